@@ -0,0 +1,89 @@
+"""端到端性能测试（模拟电缸）：定位耗时与理论运动时间的差距（固定/自适应轮询）、监控吞吐量"""
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loguru import logger
+
+from core.ec_controller import ECController
+from core.simulator import SimulatedActuator, SimulatedEIPClient
+from commands.status import StatusCommands
+from utils.converter import Converter
+
+CONFIG = {
+    'connection': {'ip_address': 'simulator', 'port': 44818},
+    'controller': {'model': 'EC-RTC12', 'max_rotation': 330, 'reduction_ratio': 45},
+    'motion': {'default_speed': 100, 'default_acceleration': 0.3, 'default_deceleration': 0.3},
+}
+
+# 每次报文往返的模拟耗时（秒）
+ROUND_TRIP = 0.001
+
+
+def make_controller() -> ECController:
+    controller = ECController(CONFIG)
+    controller.client = SimulatedEIPClient(SimulatedActuator(home_speed=200.0), round_trip=ROUND_TRIP)
+    controller.connect()
+    return controller
+
+
+def bench_motion(controller: ECController, adaptive: bool):
+    """定位耗时 = 理论运动时间 + 轮询与通信开销"""
+    position = controller.get_current_position()
+    for target, speed, acceleration in ((30, 100, 0.3), (300, 100, 0.3), (100, 500, 1.0), (0, 500, 1.0)):
+        _, _, theory = Converter.calculate_motion_time(abs(target - position), speed, acceleration)
+        requests = controller.client.requests
+        start = time.perf_counter()
+        controller.move_to_position(target, speed=speed, acceleration=acceleration, adaptive=adaptive)
+        elapsed = time.perf_counter() - start
+        requests = controller.client.requests - requests
+        print(f"  {position:5.0f} -> {target:<5}理论{theory * 1e3:8.1f} ms  实测{elapsed * 1e3:8.1f} ms"
+              f"  开销{(elapsed - theory) * 1e3:7.1f} ms  请求{requests:4d}次")
+        position = target
+
+
+def bench_monitoring(controller: ECController, duration: float = 1.0):
+    """完整状态读取：批量读取 vs 逐个读取"""
+    status = StatusCommands(controller)
+    tags = ([controller.PARAMETERS['position'], status.ALARM_CODE_TAG]
+            + [controller.SIGNALS[signal] for signal in status.IO_SIGNALS]
+            + [controller.PARAMETERS[param] for param in status.MOTION_PARAMETERS]
+            + list(status.MAINTENANCE_TAGS.values()))
+
+    def single():
+        for tag in tags:
+            controller.client.read_tag(tag)
+
+    for label, func in (("批量读取", status.get_full_status), (f"逐个读取({len(tags)}个)", single)):
+        count = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < duration:
+            func()
+            count += 1
+        print(f"  {label:<16}{count / (time.perf_counter() - start):10.1f} 次/秒")
+
+
+def main():
+    logger.remove()
+    controller = make_controller()
+    try:
+        print(f"模拟电缸，报文往返{ROUND_TRIP * 1e3:.1f} ms")
+        start = time.perf_counter()
+        controller.home()
+        print(f"原点复位{time.perf_counter() - start:10.3f} s")
+        print("定位（固定50ms轮询）:")
+        bench_motion(controller, adaptive=False)
+        print("定位（自适应轮询）:")
+        bench_motion(controller, adaptive=True)
+        stats = controller.prediction_statistics()
+        print(f"  预测误差: 平均{stats['mean_error'] * 1e3:.1f} ms, 最大{stats['max_abs_error'] * 1e3:.1f} ms")
+        print("监控吞吐量:")
+        bench_monitoring(controller)
+    finally:
+        controller.disconnect()
+
+
+if __name__ == "__main__":
+    main()
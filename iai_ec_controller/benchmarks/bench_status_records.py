@@ -0,0 +1,70 @@
+"""状态轮询结果的分配：字典 vs 状态记录（get_io_status / get_status）"""
+import sys
+import os
+import timeit
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.status_records import IOStatus, ControllerStatus
+
+POLLS = 10000
+
+# 一次批量读取的结果
+SIGNALS = {'ST0': False, 'ST1': True, 'LS0': False, 'LS1': True,
+           'PE0': False, 'PE1': False, 'ALM': True, 'RES': None}
+POSITION = 123.5
+
+
+def io_dict():
+    return {signal: bool(value) if value is not None else False for signal, value in SIGNALS.items()}
+
+
+def io_record():
+    return IOStatus.from_values(SIGNALS)
+
+
+def status_dict():
+    return {'connected': True, 'position': POSITION, 'alarm': SIGNALS['ALM'],
+            'home_complete': True, 'ls0': SIGNALS['LS0'], 'ls1': SIGNALS['LS1']}
+
+
+def status_record():
+    return ControllerStatus.from_values(True, POSITION, SIGNALS['ALM'], True,
+                                       SIGNALS['LS0'], SIGNALS['LS1'])
+
+
+def allocations(func, polls: int):
+    """保留每次轮询结果，返回每次轮询的分配块数和字节数"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    results = [func() for _ in range(polls)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    del results
+    return blocks / polls, size / polls
+
+
+def bench(label: str, func):
+    blocks, size = allocations(func, POLLS)
+    seconds = min(timeit.repeat(func, number=POLLS, repeat=5)) / POLLS
+    previous, current = func(), func()
+    compare = min(timeit.repeat(lambda: previous != current, number=POLLS, repeat=5)) / POLLS
+    print(f"  {label:<18}{blocks:6.1f} 块{size:8.0f} B/次  构造{seconds * 1e6:6.2f} us"
+          f"  比较{compare * 1e9:6.0f} ns")
+
+
+def main():
+    print("get_io_status:")
+    bench("字典", io_dict)
+    bench("IOStatus", io_record)
+    print("get_status:")
+    bench("字典", status_dict)
+    bench("ControllerStatus", status_record)
+
+
+if __name__ == "__main__":
+    main()
@@ -84,8 +84,7 @@ class MotionCommands:
                 return False
 
             # 停留
-            import time
-            time.sleep(dwell_time)
+            self.controller.clock.sleep(dwell_time)
 
         logger.info("序列运动完成")
         return True
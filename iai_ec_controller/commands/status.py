@@ -2,16 +2,76 @@
 状态监控命令模块
 用于监控电缸运行状态和诊断信息
 """
-import time
 import threading
 from typing import Dict, Any, Optional, Callable
 from datetime import datetime
 from loguru import logger
+from pycomm3 import DINT, REAL, STRING
+
+from core.acquisition import AcquisitionScheduler
+from core.status_records import IOStatus
+from utils.periodic import PeriodicScheduler
+from utils.status_bus import StatusBus, Subscription
+from utils.recorder import TelemetryRecorder, FORMAT_CSV, flatten_status
+from utils.telemetry_store import TelemetryStoreWriter
+from utils.historian import Historian
 
 
 class StatusCommands:
     """状态监控命令类"""
 
+    # I/O信号
+    IO_SIGNALS = ['ST0', 'ST1', 'LS0', 'LS1', 'PE0', 'PE1', 'ALM', 'RES']
+
+    # 运动参数
+    MOTION_PARAMETERS = ['speed', 'acceleration', 'deceleration']
+
+    # 报警代码标签
+    ALARM_CODE_TAG = 'Controller.AlarmCode'
+
+    # 维护计数器标签
+    MAINTENANCE_TAGS = {
+        'total_moves': 'Controller.TotalMoves',
+        'travel_distance': 'Controller.TravelDistance',
+        'overload_level': 'Controller.OverloadLevel',
+    }
+
+    # 诊断信息标签
+    DIAGNOSTIC_TAGS = {
+        'motor_temperature': 'Controller.MotorTemp',
+        'controller_temperature': 'Controller.ControllerTemp',
+        'bus_voltage': 'Controller.BusVoltage',
+        'motor_current': 'Controller.MotorCurrent',
+        'encoder_status': 'Controller.EncoderStatus',
+        'firmware_version': 'Controller.FirmwareVersion',
+    }
+
+    # 停止记录时等待已排队状态写完的时间（秒）
+    DRAIN_TIMEOUT = 10.0
+
+    # 标签的数据类型（未列出的按标量估计应答长度，报警代码因机型为字符串或数值，不声明）
+    TAG_TYPES = {
+        'Controller.TotalMoves': DINT,
+        'Controller.TravelDistance': DINT,
+        'Controller.OverloadLevel': DINT,
+        'Controller.MotorTemp': REAL,
+        'Controller.ControllerTemp': REAL,
+        'Controller.BusVoltage': REAL,
+        'Controller.MotorCurrent': REAL,
+        'Controller.FirmwareVersion': STRING,
+    }
+
+    # 标识信息（每次连接只读取一次）
+    IDENTITY_DIAGNOSTICS = ['firmware_version']
+
+    # 各标签组的采集周期（秒），None表示每次连接只采集一次
+    ACQUISITION_PERIODS = {
+        'signals': 0.01,
+        'motion': 0.5,
+        'diagnostics': 5.0,
+        'identity': None,
+    }
+
     def __init__(self, controller):
         """
         初始化状态命令
@@ -20,74 +80,126 @@ class StatusCommands:
             controller: EC控制器实例
         """
         self.controller = controller
+        controller.client.declare_tag_types(self.TAG_TYPES)
         self.monitoring = False
         self.monitor_thread: Optional[threading.Thread] = None
+        self.monitor_scheduler: Optional[PeriodicScheduler] = None
         self.status_callback: Optional[Callable] = None
+        self._callback_subscription: Optional[Subscription] = None
+
+        # 监控状态通过总线分发，订阅者在各自线程中处理，不阻塞采集
+        self.bus = StatusBus()
+        self.recorder: Optional[TelemetryRecorder] = None
+        self._recorder_subscription: Optional[Subscription] = None
+        self.store_writer: Optional[TelemetryStoreWriter] = None
+        self._store_subscription: Optional[Subscription] = None
+        self.historian: Optional[Historian] = None
+        self._historian_subscription: Optional[Subscription] = None
+
+        # 分级采集：监控期间状态从缓存读取，不访问设备
+        self.acquisition = AcquisitionScheduler(controller.client)
+        self._add_acquisition_groups()
+
+    def _add_acquisition_groups(self):
+        """按变化快慢划分标签组"""
+        controller = self.controller
+        diagnostics = [tag for name, tag in self.DIAGNOSTIC_TAGS.items()
+                       if name not in self.IDENTITY_DIAGNOSTICS]
+        groups = {
+            'signals': [controller.PARAMETERS['position'], self.ALARM_CODE_TAG]
+                       + [controller.SIGNALS[signal] for signal in self.IO_SIGNALS],
+            'motion': [controller.PARAMETERS[param] for param in self.MOTION_PARAMETERS],
+            'diagnostics': list(self.MAINTENANCE_TAGS.values()) + diagnostics,
+            'identity': [self.DIAGNOSTIC_TAGS[name] for name in self.IDENTITY_DIAGNOSTICS],
+        }
+        for name, tags in groups.items():
+            self.acquisition.add_group(name, tags, self.ACQUISITION_PERIODS[name])
+
+    def _read_tags(self, tags: list) -> Dict[str, Any]:
+        """读取标签：分级采集运行时读缓存，否则批量读取设备"""
+        if self.acquisition.running:
+            return self.acquisition.values(tags)
+        return self.controller.client.read_tags(tags)
 
     def get_full_status(self) -> Dict[str, Any]:
         """
         获取完整状态信息
 
+        分级采集运行时直接返回缓存中的各组最新值，否则所有标签
+        通过一次批量读取获得（超过连接大小时自动分包）。
+
         Returns:
             Dict[str, Any]: 状态字典
         """
+        controller = self.controller
+        position_tag = controller.PARAMETERS['position']
+        signal_tags = {signal: controller.SIGNALS[signal] for signal in self.IO_SIGNALS}
+        motion_tags = {param: controller.PARAMETERS[param] for param in self.MOTION_PARAMETERS}
+
+        tags = self._read_tags(
+            [position_tag, self.ALARM_CODE_TAG]
+            + list(signal_tags.values())
+            + list(motion_tags.values())
+            + list(self.MAINTENANCE_TAGS.values())
+        )
+        alarm_code = tags[self.ALARM_CODE_TAG]
+
         status = {
             'timestamp': datetime.now().isoformat(),
             'connection': {
-                'connected': self.controller.client.connected,
-                'ip_address': self.controller.client.ip_address,
+                'connected': controller.client.connected,
+                'ip_address': controller.client.ip_address,
             },
             'position': {
-                'current': self.controller.get_current_position(),
+                'current': tags[position_tag],
                 'unit': 'degree'
             },
             'signals': {
-                'ST0': self._read_signal('ST0'),
-                'ST1': self._read_signal('ST1'),
-                'LS0': self._read_signal('LS0'),
-                'LS1': self._read_signal('LS1'),
-                'PE0': self._read_signal('PE0'),
-                'PE1': self._read_signal('PE1'),
-                'ALM': self._read_signal('ALM'),
-                'RES': self._read_signal('RES'),
+                signal: self._signal_value(tags[tag]) for signal, tag in signal_tags.items()
             },
             'motion': {
-                'home_complete': self.controller.is_homing_complete,
-                'speed': self._read_parameter('speed'),
-                'acceleration': self._read_parameter('acceleration'),
-                'deceleration': self._read_parameter('deceleration'),
+                'home_complete': controller.is_homing_complete,
+                **{param: tags[tag] for param, tag in motion_tags.items()},
             },
             'alarm': {
-                'active': self.controller._check_alarm(),
-                'code': self._get_alarm_code(),
-                'description': self._get_alarm_description(),
+                'active': controller._alarm_active(tags[signal_tags['ALM']]),
+                'code': alarm_code,
+                'description': self._get_alarm_description(alarm_code or ''),
             },
             'maintenance': {
-                'total_moves': self._read_maintenance_counter('total_moves'),
-                'travel_distance': self._read_maintenance_counter('travel_distance'),
-                'overload_level': self._read_maintenance_counter('overload_level'),
+                name: tags[tag] for name, tag in self.MAINTENANCE_TAGS.items()
             }
         }
 
+        if self.acquisition.running:
+            # 各组数据的时间（秒）
+            status['acquisition'] = self.acquisition.group_ages()
+
         return status
 
-    def get_io_status(self) -> Dict[str, bool]:
+    def get_io_status(self) -> IOStatus:
         """
         获取I/O状态
 
         Returns:
-            Dict[str, bool]: I/O信号状态
+            IOStatus: I/O信号状态（只读映射，读取失败的信号为False）
         """
-        io_status = {}
-        for signal in ['ST0', 'ST1', 'LS0', 'LS1', 'PE0', 'PE1', 'ALM', 'RES']:
-            io_status[signal] = self._read_signal(signal)
-        return io_status
+        tags = self._read_tags(
+            [self.controller.SIGNALS[signal] for signal in self.IO_SIGNALS]
+        )
+        return IOStatus.from_values({
+            signal: tags[self.controller.SIGNALS[signal]]
+            for signal in self.IO_SIGNALS
+        })
 
     def start_monitoring(self, interval: float = 0.1,
                          callback: Optional[Callable] = None):
         """
         开始状态监控
 
+        后台分级采集同时启动，每个监控周期把缓存中的完整状态发布到状态总线。
+        callback作为一个订阅者注册，其它订阅者可通过 self.bus.subscribe() 注册。
+
         Args:
             interval: 监控间隔(秒)
             callback: 状态更新回调函数
@@ -96,14 +208,15 @@ class StatusCommands:
             logger.warning("监控已在运行")
             return
 
+        self.acquisition.start()
         self.monitoring = True
         self.status_callback = callback
-        self.monitor_thread = threading.Thread(
-            target=self._monitor_loop,
-            args=(interval,),
-            daemon=True
-        )
-        self.monitor_thread.start()
+        if callback:
+            self._callback_subscription = self.bus.subscribe(callback, name='status_callback')
+        # 固定频率执行，周期不受采集耗时影响
+        self.monitor_scheduler = PeriodicScheduler(interval, self._monitor_cycle, name='status-monitor')
+        self.monitor_scheduler.start()
+        self.monitor_thread = self.monitor_scheduler.thread
         logger.info("状态监控已启动")
 
     def stop_monitoring(self):
@@ -112,10 +225,27 @@ class StatusCommands:
             return
 
         self.monitoring = False
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=2)
+        if self.monitor_scheduler:
+            self.monitor_scheduler.stop()
+            logger.info(self.monitor_scheduler.report())
+        self.monitor_thread = None
+        if self._callback_subscription:
+            self.bus.unsubscribe(self._callback_subscription)
+            self._callback_subscription = None
+        self.acquisition.stop()
         logger.info("状态监控已停止")
 
+    def get_monitor_statistics(self) -> Dict[str, float]:
+        """
+        获取监控循环的运行统计（实际频率、周期耗时、超时次数等）
+
+        Returns:
+            Dict[str, float]: 统计信息，未启动过监控返回空字典
+        """
+        if not self.monitor_scheduler:
+            return {}
+        return self.monitor_scheduler.statistics()
+
     def check_alarm_history(self) -> list:
         """
         检查报警历史
@@ -144,18 +274,12 @@ class StatusCommands:
         Returns:
             Dict[str, Any]: 诊断信息
         """
-        return {
-            'motor_temperature': self._read_diagnostic('motor_temperature'),
-            'controller_temperature': self._read_diagnostic('controller_temperature'),
-            'bus_voltage': self._read_diagnostic('bus_voltage'),
-            'motor_current': self._read_diagnostic('motor_current'),
-            'encoder_status': self._read_diagnostic('encoder_status'),
-            'firmware_version': self._read_diagnostic('firmware_version'),
-        }
+        tags = self._read_tags(list(self.DIAGNOSTIC_TAGS.values()))
+        return {name: tags[tag] for name, tag in self.DIAGNOSTIC_TAGS.items()}
 
     def export_status_log(self, filename: str = "status_log.csv"):
         """
-        导出状态日志
+        导出一次状态快照（连续记录请使用 start_recording）
 
         Args:
             filename: 导出文件名
@@ -170,78 +294,137 @@ class StatusCommands:
             # 写入标题
             writer.writerow(['Timestamp', 'Parameter', 'Value'])
 
-            # 递归写入所有状态
-            def write_dict(d, prefix=''):
-                for key, value in d.items():
-                    if isinstance(value, dict):
-                        write_dict(value, f"{prefix}{key}.")
-                    else:
-                        writer.writerow([status['timestamp'], f"{prefix}{key}", value])
-
-            write_dict(status)
+            for key, value in flatten_status(status).items():
+                writer.writerow([status['timestamp'], key, value])
 
         logger.info(f"状态日志已导出到 {filename}")
 
-    def _monitor_loop(self, interval: float):
-        """监控循环"""
-        while self.monitoring:
-            try:
-                status = self.get_full_status()
-
-                # 检查报警
-                if status['alarm']['active']:
-                    logger.warning(f"检测到报警: {status['alarm']['description']}")
-
-                # 调用回调
-                if self.status_callback:
-                    self.status_callback(status)
-
-            except Exception as e:
-                logger.error(f"监控出错: {e}")
-
-            time.sleep(interval)
-
-    def _read_signal(self, signal_name: str) -> bool:
-        """读取信号状态"""
-        if signal_name in self.controller.SIGNALS:
-            value = self.controller.client.read_tag(self.controller.SIGNALS[signal_name])
-            return bool(value) if value is not None else False
-        return False
-
-    def _read_parameter(self, param_name: str) -> Optional[Any]:
-        """读取参数值"""
-        if param_name in self.controller.PARAMETERS:
-            return self.controller.client.read_tag(self.controller.PARAMETERS[param_name])
-        return None
-
-    def _read_maintenance_counter(self, counter_name: str) -> Optional[int]:
-        """读取维护计数器"""
-        tag_map = {
-            'total_moves': 'Controller.TotalMoves',
-            'travel_distance': 'Controller.TravelDistance',
-            'overload_level': 'Controller.OverloadLevel',
-        }
-        if counter_name in tag_map:
-            return self.controller.client.read_tag(tag_map[counter_name])
-        return None
-
-    def _read_diagnostic(self, diag_name: str) -> Optional[Any]:
-        """读取诊断信息"""
-        tag_map = {
-            'motor_temperature': 'Controller.MotorTemp',
-            'controller_temperature': 'Controller.ControllerTemp',
-            'bus_voltage': 'Controller.BusVoltage',
-            'motor_current': 'Controller.MotorCurrent',
-            'encoder_status': 'Controller.EncoderStatus',
-            'firmware_version': 'Controller.FirmwareVersion',
-        }
-        if diag_name in tag_map:
-            return self.controller.client.read_tag(tag_map[diag_name])
-        return None
+    def start_recording(self, directory: str = "logs/telemetry", fmt: str = FORMAT_CSV,
+                        **kwargs) -> TelemetryRecorder:
+        """
+        开始连续记录监控状态
+
+        记录器订阅状态总线，每个监控周期追加一行，由后台线程批量写入文件。
+
+        Args:
+            directory: 记录目录
+            fmt: 文件格式，'csv' 或 'binary'
+            **kwargs: TelemetryRecorder的其它参数（batch_size、max_bytes、max_seconds等）
+
+        Returns:
+            TelemetryRecorder: 记录器
+        """
+        if self.recorder:
+            logger.warning("记录已在运行")
+            return self.recorder
+
+        self.recorder = TelemetryRecorder(directory, fmt=fmt, **kwargs)
+        self.recorder.start()
+        self._recorder_subscription = self.bus.subscribe(
+            self.recorder.record, name='telemetry_recorder', maxsize=256
+        )
+        return self.recorder
+
+    def stop_recording(self):
+        """停止连续记录，写完缓冲的数据"""
+        if not self.recorder:
+            return
+
+        self.bus.unsubscribe(self._recorder_subscription, drain=True, timeout=self.DRAIN_TIMEOUT)
+        self._recorder_subscription = None
+        self.recorder.stop()
+        self.recorder = None
+
+    def start_telemetry_store(self, directory: str = "logs/telemetry_store") -> TelemetryStoreWriter:
+        """
+        开始写入列存遥测（位置、信号、报警代码），用 TelemetryStore 按时间范围查询
+
+        Args:
+            directory: 存储目录，已有数据时继续追加
+
+        Returns:
+            TelemetryStoreWriter: 写入器
+        """
+        if self.store_writer:
+            logger.warning("列存写入已在运行")
+            return self.store_writer
+
+        self.store_writer = TelemetryStoreWriter(directory, signals=self.IO_SIGNALS)
+        self._store_subscription = self.bus.subscribe(
+            self.store_writer.record, name='telemetry_store', maxsize=256
+        )
+        logger.info(f"列存遥测写入: {directory}")
+        return self.store_writer
+
+    def stop_telemetry_store(self):
+        """停止列存遥测写入，写完已排队的状态"""
+        if not self.store_writer:
+            return
+
+        self.bus.unsubscribe(self._store_subscription, drain=True, timeout=self.DRAIN_TIMEOUT)
+        self._store_subscription = None
+        self.store_writer.close()
+        self.store_writer = None
+
+    def start_historian(self, path: str = "logs/history.db", **kwargs) -> Historian:
+        """
+        开始把监控状态中的数值写入历史数据库
+
+        Args:
+            path: 数据库文件路径
+            **kwargs: Historian的其它参数（bucket_widths、raw_retention等）
+
+        Returns:
+            Historian: 历史数据库，用 query() 按时间桶查询
+        """
+        if self.historian:
+            logger.warning("历史数据库已在运行")
+            return self.historian
+
+        self.historian = Historian(path, **kwargs)
+        self.historian.start()
+        self._historian_subscription = self.bus.subscribe(
+            self.historian.record, name='historian', maxsize=256
+        )
+        return self.historian
+
+    def stop_historian(self):
+        """停止写入历史数据库，写完已排队的状态"""
+        if not self.historian:
+            return
+
+        self.bus.unsubscribe(self._historian_subscription, drain=True, timeout=self.DRAIN_TIMEOUT)
+        self._historian_subscription = None
+        self.historian.close()
+        self.historian = None
+
+    def _monitor_cycle(self):
+        """监控周期"""
+        if not self.controller.client.link_up:
+            # 断线重连期间不采集
+            return
+
+        try:
+            status = self.get_full_status()
+
+            # 检查报警
+            if status['alarm']['active']:
+                logger.warning(f"检测到报警: {status['alarm']['description']}")
+
+            # 分发给订阅者
+            self.bus.publish(status)
+
+        except Exception as e:
+            logger.error(f"监控出错: {e}")
+
+    @staticmethod
+    def _signal_value(value: Optional[Any]) -> bool:
+        """信号值转换为bool，读取失败视为False"""
+        return bool(value) if value is not None else False
 
     def _get_alarm_code(self) -> Optional[str]:
         """获取当前报警代码"""
-        return self.controller.client.read_tag('Controller.AlarmCode')
+        return self.controller.client.read_tag(self.ALARM_CODE_TAG)
 
     def _get_alarm_description(self, code: Optional[str] = None) -> str:
         """获取报警描述"""
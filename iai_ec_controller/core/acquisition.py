@@ -0,0 +1,210 @@
+"""
+分级数据采集模块
+按标签组设定不同采集周期，采集结果带时间戳缓存
+"""
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+from loguru import logger
+
+
+class TagGroup:
+    """标签组"""
+
+    def __init__(self, name: str, tags: Sequence[str], period: Optional[float]):
+        """
+        初始化标签组
+
+        Args:
+            name: 组名
+            tags: 标签名称列表
+            period: 采集周期（秒），None表示每次连接只采集一次
+        """
+        self.name = name
+        self.tags = list(tags)
+        self.period = period
+        self.next_due = 0.0
+        self.last_update: Optional[float] = None
+        self.completed = False
+
+    def due(self, now: float) -> bool:
+        """是否到了采集时间"""
+        if self.period is None and self.completed:
+            return False
+        return now >= self.next_due
+
+
+class AcquisitionScheduler:
+    """分级采集调度器
+
+    每个标签组有独立的采集周期（如信号10ms、运动参数500ms、诊断5s、
+    标识信息每次连接一次）。同一时刻到期的组合并为一次批量读取，
+    结果写入带时间戳的缓存，读取缓存不访问设备。
+    """
+
+    def __init__(self, client, min_interval: float = 0.005, retry_interval: float = 1.0):
+        """
+        初始化采集调度器
+
+        Args:
+            client: EIP客户端
+            min_interval: 两次采集之间的最小间隔（秒）
+            retry_interval: 单次采集组读取失败后的重试间隔（秒）
+        """
+        self.client = client
+        self.min_interval = min_interval
+        self.retry_interval = retry_interval
+        self.groups: Dict[str, TagGroup] = {}
+
+        self._values: Dict[str, Any] = {}
+        self._timestamps: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._hooked = False
+        self.running = False
+
+    def add_group(self, name: str, tags: Sequence[str], period: Optional[float]):
+        """
+        添加标签组
+
+        Args:
+            name: 组名
+            tags: 标签名称列表
+            period: 采集周期（秒），None表示每次连接只采集一次
+        """
+        with self._lock:
+            self.groups[name] = TagGroup(name, tags, period)
+        self._wakeup.set()
+
+    def start(self):
+        """启动后台采集"""
+        if self.running:
+            return
+
+        if not self._hooked:
+            # 重连后设备状态可能已变化，缓存作废并重新采集所有组
+            self.client.add_reconnect_hook(self.invalidate)
+            self._hooked = True
+
+        self.invalidate()
+        self.running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        logger.info("分级采集已启动")
+
+    def stop(self):
+        """停止后台采集"""
+        if not self.running:
+            return
+
+        self.running = False
+        self._wakeup.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        self._thread = None
+        logger.info("分级采集已停止")
+
+    def invalidate(self):
+        """清空缓存，所有组立即重新采集"""
+        with self._lock:
+            self._values.clear()
+            self._timestamps.clear()
+            for group in self.groups.values():
+                group.next_due = 0.0
+                group.last_update = None
+                group.completed = False
+        self._wakeup.set()
+
+    def poll(self, now: Optional[float] = None) -> List[str]:
+        """
+        采集所有到期的标签组（一次批量读取）
+
+        Args:
+            now: 当前单调时钟时间，None时取当前时间
+
+        Returns:
+            List[str]: 本次采集的组名
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            due = [group for group in self.groups.values() if group.due(now)]
+        if not due:
+            return []
+
+        tags = list(dict.fromkeys(tag for group in due for tag in group.tags))
+        values = self.client.read_tags(tags)
+        timestamp = time.monotonic()
+
+        with self._lock:
+            for tag, value in values.items():
+                # 读取失败时保留旧值，时间戳不更新
+                if value is not None:
+                    self._values[tag] = value
+                    self._timestamps[tag] = timestamp
+
+            for group in due:
+                group.next_due = now + (self.retry_interval if group.period is None else group.period)
+                if all(values.get(tag) is not None for tag in group.tags):
+                    group.last_update = timestamp
+                    group.completed = True
+
+        return [group.name for group in due]
+
+    def next_deadline(self) -> Optional[float]:
+        """下一个到期组的时间，没有待采集的组时返回None"""
+        with self._lock:
+            deadlines = [
+                group.next_due for group in self.groups.values()
+                if group.period is not None or not group.completed
+            ]
+        return min(deadlines) if deadlines else None
+
+    def value(self, tag: str, default: Any = None) -> Any:
+        """读取缓存值"""
+        with self._lock:
+            return self._values.get(tag, default)
+
+    def values(self, tags: Sequence[str]) -> Dict[str, Any]:
+        """
+        读取多个缓存值
+
+        Returns:
+            Dict[str, Any]: {标签名称: 值}，没有缓存的标签值为None
+        """
+        with self._lock:
+            return {tag: self._values.get(tag) for tag in tags}
+
+    def age(self, tag: str) -> Optional[float]:
+        """缓存值的时间（秒），没有缓存返回None"""
+        with self._lock:
+            timestamp = self._timestamps.get(tag)
+        return None if timestamp is None else time.monotonic() - timestamp
+
+    def group_ages(self) -> Dict[str, Optional[float]]:
+        """各组最近一次完整采集距今的时间（秒）"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                name: None if group.last_update is None else now - group.last_update
+                for name, group in self.groups.items()
+            }
+
+    def _run(self):
+        """采集循环"""
+        while self.running:
+            if not self.client.link_up:
+                # 断线重连期间不采集
+                self._wakeup.wait(0.1)
+                self._wakeup.clear()
+                continue
+
+            try:
+                self.poll()
+            except Exception as e:
+                logger.error(f"采集出错: {e}")
+
+            deadline = self.next_deadline()
+            delay = 0.1 if deadline is None else deadline - time.monotonic()
+            self._wakeup.wait(max(delay, self.min_interval))
+            self._wakeup.clear()
@@ -0,0 +1,167 @@
+"""
+连接监督模块
+断线自动重连（指数退避）与断路器
+与 rec_controller/core/connection_supervisor.py 相同（仅日志库不同），修改时两边同步
+"""
+import random
+import threading
+from typing import Callable, List, Optional
+from loguru import logger
+
+
+class ConnectionSupervisor:
+    """连接监督器
+
+    连续通信失败达到阈值后断路器打开：此后的读写立即失败，不再访问已断开的连接；
+    后台线程按指数退避重试连接，成功后关闭断路器，再执行重连钩子恢复缓存状态。
+    """
+
+    STATE_CONNECTED = 'connected'        # 连接正常
+    STATE_DOWN = 'down'                  # 断路器打开，正在后台重连
+    STATE_DISCONNECTED = 'disconnected'  # 主动断开
+
+    def __init__(self, reconnect: Callable[[], bool], name: str = '',
+                 failure_threshold: int = 2, initial_backoff: float = 0.5,
+                 max_backoff: float = 30.0, multiplier: float = 2.0, jitter: float = 0.1):
+        """
+        初始化连接监督器
+
+        Args:
+            reconnect: 重新建立连接的函数，成功返回True
+            name: 日志中显示的连接名称
+            failure_threshold: 打开断路器的连续失败次数
+            initial_backoff: 首次重连等待时间（秒）
+            max_backoff: 最大重连等待时间（秒）
+            multiplier: 退避倍数
+            jitter: 等待时间的随机抖动比例
+        """
+        self._reconnect = reconnect
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.multiplier = multiplier
+        self.jitter = jitter
+
+        self.state = self.STATE_DISCONNECTED
+        self.consecutive_failures = 0
+        self.reconnect_attempts = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._listeners: List[Callable[[str], None]] = []
+        self._reconnect_hooks: List[Callable[[], None]] = []
+
+    @property
+    def available(self) -> bool:
+        """断路器是否关闭（可以访问连接）"""
+        return self.state == self.STATE_CONNECTED
+
+    def add_listener(self, callback: Callable[[str], None]):
+        """
+        注册连接状态回调
+
+        Args:
+            callback: 参数为新状态，可能在后台线程中调用
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[str], None]):
+        """注销连接状态回调"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def add_reconnect_hook(self, hook: Callable[[], None]):
+        """
+        注册重连钩子，重连成功、断路器关闭后在重连线程中调用，用于恢复缓存状态
+
+        Args:
+            hook: 无参数函数
+        """
+        self._reconnect_hooks.append(hook)
+
+    def mark_connected(self):
+        """连接建立（首次连接或重连成功）"""
+        with self._lock:
+            self.consecutive_failures = 0
+            self.reconnect_attempts = 0
+        self._set_state(self.STATE_CONNECTED)
+
+    def mark_disconnected(self):
+        """主动断开：停止后台重连"""
+        self._stop_event.set()
+        thread = self._thread
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=2)
+        self._thread = None
+        self._set_state(self.STATE_DISCONNECTED)
+
+    def record_success(self):
+        """记录一次通信成功"""
+        self.consecutive_failures = 0
+
+    def record_failure(self, error: Optional[Exception] = None):
+        """
+        记录一次通信失败，达到阈值时打开断路器并启动后台重连
+
+        Args:
+            error: 失败原因
+        """
+        with self._lock:
+            if self.state != self.STATE_CONNECTED:
+                return
+            self.consecutive_failures += 1
+            if self.consecutive_failures < self.failure_threshold:
+                return
+            self.state = self.STATE_DOWN
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._reconnect_loop, daemon=True)
+
+        logger.warning(f"{self.name} 连接中断({error})，断路器打开，开始后台重连")
+        self._notify(self.STATE_DOWN)
+        self._thread.start()
+
+    def next_backoff(self) -> float:
+        """下一次重连前的等待时间（秒）"""
+        backoff = min(self.initial_backoff * self.multiplier ** self.reconnect_attempts,
+                      self.max_backoff)
+        return backoff * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _reconnect_loop(self):
+        """后台重连循环"""
+        while not self._stop_event.wait(self.next_backoff()):
+            self.reconnect_attempts += 1
+            try:
+                success = self._reconnect()
+            except Exception as e:
+                logger.debug(f"{self.name} 重连失败: {e}")
+                success = False
+
+            if not success:
+                logger.debug(f"{self.name} 第{self.reconnect_attempts}次重连失败")
+                continue
+
+            logger.info(f"{self.name} 第{self.reconnect_attempts}次重连成功")
+            self.mark_connected()
+
+            # 钩子可能需要读写设备，须在断路器关闭后执行
+            for hook in self._reconnect_hooks:
+                try:
+                    hook()
+                except Exception as e:
+                    logger.error(f"{self.name} 恢复状态失败: {e}")
+            return
+
+    def _set_state(self, state: str):
+        with self._lock:
+            changed = self.state != state
+            self.state = state
+        if changed:
+            self._notify(state)
+
+    def _notify(self, state: str):
+        for callback in list(self._listeners):
+            try:
+                callback(state)
+            except Exception as e:
+                logger.error(f"连接状态回调出错: {e}")
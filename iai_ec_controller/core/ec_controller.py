@@ -1,13 +1,17 @@
 """
 IAI EC电缸控制器主类
 """
-import time
+from collections import deque
 from typing import Optional, Dict, Any
 from loguru import logger
+from pycomm3 import BOOL, REAL
 
 # 修改导入方式
 from core.eip_client import EIPClient
+from core.status_records import ControllerStatus
 from utils.validator import Validator
+from utils.converter import Converter
+from utils.clock import Clock, REAL_CLOCK
 
 
 class ECController:
@@ -36,23 +40,50 @@ class ECController:
         'home_complete': 'Controller.HomeComplete',  # 原点复位完成
     }
 
-    def __init__(self, config: Dict[str, Any]):
+    # 标签的数据类型（批量读写按此估计应答长度和编码写入值）
+    TAG_TYPES = {
+        **{tag: BOOL for tag in SIGNALS.values()},
+        'Controller.Position': REAL,
+        'Controller.Speed': REAL,
+        'Controller.Acceleration': REAL,
+        'Controller.Deceleration': REAL,
+        'Controller.TargetPos': REAL,
+        'Controller.HomeComplete': BOOL,
+    }
+
+    # 自适应轮询：匀速段只按慢周期检查报警，预测到位时刻前后的窗口内快速轮询到位信号
+    ADAPTIVE_SLOW_INTERVAL = 0.2    # 匀速段报警检查周期（秒）
+    ADAPTIVE_FAST_INTERVAL = 0.01   # 到位窗口内轮询周期（秒）
+    ADAPTIVE_WINDOW_RATIO = 0.05    # 窗口半宽占预测时间的比例
+    ADAPTIVE_MIN_WINDOW = 0.05      # 窗口半宽下限（秒）
+    MOVE_HISTORY_SIZE = 100         # 保留的运动记录条数
+
+    def __init__(self, config: Dict[str, Any], clock: Optional[Clock] = None):
         """
         初始化控制器
 
         Args:
             config: 配置字典
+            clock: 等待循环使用的时钟，None时使用真实时钟
         """
         self.config = config
         self.client = EIPClient(
             config['connection']['ip_address'],
             config['connection']['port']
         )
+        self.client.declare_tag_types(self.TAG_TYPES)
         self.validator = Validator(config)
         self.is_homing_complete = False
+        self.clock = clock or REAL_CLOCK
+
+        # 自适应轮询（可选），每次运动的预测误差记入 move_history
+        self.adaptive_polling = config.get('motion', {}).get('adaptive_polling', False)
+        self.move_history = deque(maxlen=self.MOVE_HISTORY_SIZE)
 
     def connect(self) -> bool:
         """连接到电缸"""
+        # 客户端可能已被替换（如模拟客户端），连接前重新声明标签类型
+        self.client.declare_tag_types(self.TAG_TYPES)
         return self.client.connect()
 
     def disconnect(self):
@@ -80,9 +111,9 @@ class ECController:
 
         # 等待原点复位完成
         timeout = 30  # 30秒超时
-        start_time = time.time()
+        start_time = self.clock.time()
 
-        while time.time() - start_time < timeout:
+        while self.clock.time() - start_time < timeout:
             # 检查原点复位是否完成
             home_complete = self.client.read_tag(self.PARAMETERS['home_complete'])
             if home_complete:
@@ -98,14 +129,15 @@ class ECController:
                 self.client.write_tag(self.SIGNALS['ST0'], False)
                 return False
 
-            time.sleep(0.1)
+            self.clock.sleep(0.1)
 
         logger.error("原点复位超时")
         self.client.write_tag(self.SIGNALS['ST0'], False)
         return False
 
     def move_to_position(self, position: float, speed: Optional[float] = None,
-                        acceleration: Optional[float] = None) -> bool:
+                        acceleration: Optional[float] = None,
+                        adaptive: Optional[bool] = None) -> bool:
         """
         移动到指定位置
 
@@ -113,6 +145,7 @@ class ECController:
             position: 目标位置（度）
             speed: 速度（度/秒），None使用默认值
             acceleration: 加速度（G），None使用默认值
+            adaptive: 是否按预测到位时间自适应轮询，None时按配置 motion.adaptive_polling
 
         Returns:
             bool: 成功返回True，失败返回False
@@ -161,14 +194,20 @@ class ECController:
 
         logger.info(f"{direction}到位置 {position}度...")
 
+        use_adaptive = self.adaptive_polling if adaptive is None else adaptive
+        if use_adaptive:
+            predicted = self.predict_motion_time(abs(position - current_pos), speed, acceleration)
+            self.client.write_tag(signal, True)
+            return self._wait_adaptive(signal, complete_signal, position, current_pos, predicted)
+
         # 发送运动信号
         self.client.write_tag(signal, True)
 
         # 等待运动完成
         timeout = 60  # 60秒超时
-        start_time = time.time()
+        start_time = self.clock.time()
 
-        while time.time() - start_time < timeout:
+        while self.clock.time() - start_time < timeout:
             # 检查是否到达目标位置
             if self.client.read_tag(complete_signal):
                 self.client.write_tag(signal, False)
@@ -181,12 +220,134 @@ class ECController:
                 self.client.write_tag(signal, False)
                 return False
 
-            time.sleep(0.05)
+            self.clock.sleep(0.05)
+
+        logger.error("运动超时")
+        self.client.write_tag(signal, False)
+        return False
+
+    def predict_motion_time(self, distance: float, speed: Optional[float] = None,
+                            acceleration: Optional[float] = None) -> float:
+        """
+        预测运动时间
+
+        Args:
+            distance: 移动距离（度）
+            speed: 速度（度/秒），None时读取控制器当前设定
+            acceleration: 加速度（G），None时读取控制器当前设定
+
+        Returns:
+            float: 预测的运动时间（秒）
+        """
+        if distance <= 0:
+            return 0.0
+
+        if speed is None or acceleration is None:
+            tags = self.client.read_tags([self.PARAMETERS['speed'], self.PARAMETERS['acceleration']])
+            speed = speed if speed is not None else tags[self.PARAMETERS['speed']]
+            acceleration = acceleration if acceleration is not None else tags[self.PARAMETERS['acceleration']]
+        motion = self.config['motion']
+        speed = speed or motion['default_speed']
+        acceleration = acceleration or motion['default_acceleration']
+
+        return Converter.calculate_motion_time(distance, speed, acceleration)[2]
+
+    def _wait_adaptive(self, signal: str, complete_signal: str, position: float,
+                       start_position: float, predicted: float, timeout: float = 60) -> bool:
+        """
+        按预测到位时间等待运动完成
+
+        匀速段只按慢周期检查报警；在预测到位时刻前后的窗口内，每次用一个
+        批量读取同时检查到位信号和报警；超过窗口仍未到位时按常规周期轮询。
+
+        Args:
+            signal: 运动信号标签
+            complete_signal: 到位信号标签
+            position: 目标位置（度）
+            start_position: 起始位置（度）
+            predicted: 预测运动时间（秒）
+            timeout: 超时时间（秒）
+
+        Returns:
+            bool: 到位返回True
+        """
+        margin = max(self.ADAPTIVE_MIN_WINDOW, predicted * self.ADAPTIVE_WINDOW_RATIO)
+        window_start = predicted - margin
+        window_end = predicted + margin
+        alarm_tag = self.SIGNALS['ALM']
+        polls = 0
+        start_time = self.clock.time()
+
+        while True:
+            elapsed = self.clock.time() - start_time
+            if elapsed >= timeout:
+                break
+
+            polls += 1
+            if elapsed < window_start:
+                # 匀速段：只检查报警
+                if self._check_alarm():
+                    logger.error("运动过程中发生报警")
+                    self.client.write_tag(signal, False)
+                    return False
+                self.clock.sleep(min(self.ADAPTIVE_SLOW_INTERVAL, window_start - elapsed))
+                continue
+
+            tags = self.client.read_tags([complete_signal, alarm_tag])
+            if tags[complete_signal]:
+                actual = self.clock.time() - start_time
+                self.client.write_tag(signal, False)
+                self._record_move(position, start_position, predicted, actual, polls)
+                logger.info(f"成功到达位置 {position}度（预测{predicted:.3f}s，实际{actual:.3f}s）")
+                return True
+
+            if self._alarm_active(tags[alarm_tag]):
+                logger.error("运动过程中发生报警")
+                self.client.write_tag(signal, False)
+                return False
+
+            self.clock.sleep(self.ADAPTIVE_FAST_INTERVAL if elapsed < window_end else 0.05)
 
         logger.error("运动超时")
         self.client.write_tag(signal, False)
+        self._record_move(position, start_position, predicted, None, polls)
         return False
 
+    def _record_move(self, position: float, start_position: float, predicted: float,
+                     actual: Optional[float], polls: int):
+        """记录一次运动的预测误差（实际为None表示超时）"""
+        self.move_history.append({
+            'timestamp': self.clock.time(),
+            'target': position,
+            'distance': abs(position - start_position),
+            'predicted': predicted,
+            'actual': actual,
+            'error': actual - predicted if actual is not None else None,
+            'polls': polls,
+        })
+
+    def prediction_statistics(self) -> Dict[str, float]:
+        """
+        自适应轮询的预测误差统计
+
+        误差 = 检测到到位的时间 - 预测时间，包含最多一个快速轮询周期的检测延迟。
+
+        Returns:
+            Dict[str, float]: 运动次数、超时次数、平均误差、平均绝对误差、
+            最大绝对误差（秒）和平均轮询次数，没有记录返回空字典
+        """
+        if not self.move_history:
+            return {}
+        errors = [move['error'] for move in self.move_history if move['error'] is not None]
+        return {
+            'moves': len(self.move_history),
+            'timeouts': len(self.move_history) - len(errors),
+            'mean_error': sum(errors) / len(errors) if errors else 0.0,
+            'mean_abs_error': sum(abs(e) for e in errors) / len(errors) if errors else 0.0,
+            'max_abs_error': max((abs(e) for e in errors), default=0.0),
+            'mean_polls': sum(move['polls'] for move in self.move_history) / len(self.move_history),
+        }
+
     def stop(self):
         """紧急停止"""
         logger.warning("执行紧急停止")
@@ -203,11 +364,11 @@ class ECController:
         """
         logger.info("复位报警...")
         self.client.write_tag(self.SIGNALS['RES'], True)
-        time.sleep(0.5)
+        self.clock.sleep(0.5)
         self.client.write_tag(self.SIGNALS['RES'], False)
 
         # 检查报警是否清除
-        time.sleep(0.5)
+        self.clock.sleep(0.5)
         if not self._check_alarm():
             logger.info("报警已清除")
             return True
@@ -219,22 +380,30 @@ class ECController:
         """获取当前位置"""
         return self.client.read_tag(self.PARAMETERS['position'])
 
-    def get_status(self) -> Dict[str, Any]:
+    def get_status(self) -> ControllerStatus:
         """
         获取电缸状态
 
+        位置和各信号通过一次批量读取获得。
+
         Returns:
-            包含各种状态信息的字典
-        """
-        status = {
-            'connected': self.client.connected,
-            'position': self.get_current_position(),
-            'alarm': self._check_alarm(),
-            'home_complete': self.is_homing_complete,
-            'ls0': self.client.read_tag(self.SIGNALS['LS0']),
-            'ls1': self.client.read_tag(self.SIGNALS['LS1']),
-        }
-        return status
+            ControllerStatus: 电缸状态（只读映射，可按字典方式访问）
+        """
+        position_tag = self.PARAMETERS['position']
+        tags = self.client.read_tags([
+            position_tag,
+            self.SIGNALS['ALM'],
+            self.SIGNALS['LS0'],
+            self.SIGNALS['LS1'],
+        ])
+        return ControllerStatus.from_values(
+            connected=self.client.connected,
+            position=tags[position_tag],
+            alarm=self._alarm_active(tags[self.SIGNALS['ALM']]),
+            home_complete=self.is_homing_complete,
+            ls0=tags[self.SIGNALS['LS0']],
+            ls1=tags[self.SIGNALS['LS1']],
+        )
 
     def _check_alarm(self) -> bool:
         """
@@ -243,6 +412,18 @@ class ECController:
         Returns:
             bool: 有报警返回True，无报警返回False
         """
+        return self._alarm_active(self.client.read_tag(self.SIGNALS['ALM']))
+
+    @staticmethod
+    def _alarm_active(alarm_signal: Optional[bool]) -> bool:
+        """
+        根据ALM信号判断是否有报警
+
+        Args:
+            alarm_signal: ALM信号值，读取失败为None
+
+        Returns:
+            bool: 有报警返回True
+        """
         # ALM信号是b接点（负逻辑），正常时为True，报警时为False
-        alarm_signal = self.client.read_tag(self.SIGNALS['ALM'])
-        return alarm_signal is False if alarm_signal is not None else False
\ No newline at end of file
+        return alarm_signal is False if alarm_signal is not None else False
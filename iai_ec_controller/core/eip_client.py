@@ -2,11 +2,19 @@
 EtherNet/IP通信客户端
 用于与IAI EC电缸建立通信连接
 """
+import struct
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List, Sequence, Tuple
 from pycomm3 import CIPDriver, Services
 from loguru import logger
 
+from core.connection_supervisor import ConnectionSupervisor
+from core.multi_service import (
+    SERVICE_MULTIPLE, MESSAGE_ROUTER_CLASS, MESSAGE_ROUTER_INSTANCE, STATUS_SUCCESS,
+    WRITE_REPLY_SIZE, build_read_request, build_write_request, read_reply_size,
+    pack_requests, unpack_replies, decode_read_reply, split_requests, connection_limit,
+)
+
 
 class EIPClient:
     """EtherNet/IP客户端类"""
@@ -23,6 +31,42 @@ class EIPClient:
         self.port = port
         self.driver: Optional[CIPDriver] = None
         self.connected = False
+        # 标签声明的数据类型，用于批量读的应答长度估计和批量写的编码
+        self.tag_types: Dict[str, Any] = {}
+        # 断线后自动重连，断线期间读写立即失败
+        self.supervisor = ConnectionSupervisor(self._reopen, name=f"电缸 {ip_address}")
+
+    @property
+    def link_up(self) -> bool:
+        """已连接且通信链路正常"""
+        return self.connected and not self.supervisor.state == ConnectionSupervisor.STATE_DOWN
+
+    def declare_tag_types(self, tag_types: Dict[str, Any]):
+        """
+        声明标签的数据类型
+
+        Args:
+            tag_types: {标签名称: pycomm3数据类型}，Logix STRING使用 pycomm3.STRING
+        """
+        self.tag_types.update(tag_types)
+
+    def add_state_listener(self, callback: Callable[[str], None]):
+        """
+        注册连接状态回调，链路断开/恢复时调用
+
+        Args:
+            callback: 参数为 'connected'/'down'/'disconnected'，可能在后台线程中调用
+        """
+        self.supervisor.add_listener(callback)
+
+    def add_reconnect_hook(self, hook: Callable[[], None]):
+        """
+        注册重连钩子，自动重连成功后调用，用于恢复缓存状态
+
+        Args:
+            hook: 无参数函数
+        """
+        self.supervisor.add_reconnect_hook(hook)
 
     def connect(self) -> bool:
         """
@@ -35,6 +79,7 @@ class EIPClient:
             self.driver = CIPDriver(self.ip_address)
             self.driver.open()
             self.connected = True
+            self.supervisor.mark_connected()
             logger.info(f"成功连接到电缸 {self.ip_address}")
             return True
         except Exception as e:
@@ -44,11 +89,30 @@ class EIPClient:
 
     def disconnect(self):
         """断开连接"""
+        self.supervisor.mark_disconnected()
         if self.driver and self.connected:
             self.driver.close()
             self.connected = False
             logger.info("已断开与电缸的连接")
 
+    def _reopen(self) -> bool:
+        """
+        重新建立连接（由后台重连线程调用）
+
+        Returns:
+            bool: 成功返回True
+        """
+        try:
+            if self.driver:
+                self.driver.close()
+        except Exception:
+            pass
+
+        driver = CIPDriver(self.ip_address)
+        driver.open()
+        self.driver = driver
+        return True
+
     def read_tag(self, tag_name: str) -> Optional[Any]:
         """
         读取标签值
@@ -63,13 +127,19 @@ class EIPClient:
             logger.error("未连接到电缸")
             return None
 
+        if not self.link_up:
+            # 断路器打开，立即失败
+            return None
+
         try:
             result = self.driver.read(tag_name)
+            self.supervisor.record_success()
             if result:
                 return result.value
             return None
         except Exception as e:
             logger.error(f"读取标签 {tag_name} 失败: {e}")
+            self.supervisor.record_failure(e)
             return None
 
     def write_tag(self, tag_name: str, value: Any) -> bool:
@@ -87,9 +157,145 @@ class EIPClient:
             logger.error("未连接到电缸")
             return False
 
+        if not self.link_up:
+            return False
+
         try:
             result = self.driver.write(tag_name, value)
+            self.supervisor.record_success()
             return result is not None
         except Exception as e:
             logger.error(f"写入标签 {tag_name} 失败: {e}")
-            return False
\ No newline at end of file
+            self.supervisor.record_failure(e)
+            return False
+
+    def read_tags(self, tag_names: Sequence[str]) -> Dict[str, Any]:
+        """
+        批量读取标签
+
+        多个Read Tag服务打包进多服务报文，按声明类型估计应答长度、
+        按连接大小自动分包，通常一次往返即可读完。
+        整个报文失败时（如未声明类型的长字符串使应答超过连接大小）拆半重发。
+
+        Args:
+            tag_names: 标签名称列表
+
+        Returns:
+            Dict[str, Any]: {标签名称: 值}，读取失败的标签值为None
+        """
+        values = {name: None for name in tag_names}
+        if not self.connected:
+            logger.error("未连接到电缸")
+            return values
+
+        if not self.link_up or not values:
+            return values
+
+        names = list(values)
+        requests = [build_read_request(name) for name in names]
+        reply_sizes = [read_reply_size(self.tag_types.get(name)) for name in names]
+        batches = split_requests(requests, reply_sizes, connection_limit(self.driver))
+
+        while batches:
+            start, end = batches.pop(0)
+            replies = self._send_multiple(requests[start:end])
+            if replies is None:
+                if end - start > 1 and self.link_up:
+                    middle = (start + end) // 2
+                    batches[:0] = [(start, middle), (middle, end)]
+                continue
+            for name, (_, status, payload) in zip(names[start:end], replies):
+                if status != STATUS_SUCCESS:
+                    logger.warning(f"读取标签 {name} 失败: 状态码 {status:#04x}")
+                    continue
+                try:
+                    values[name] = decode_read_reply(payload)
+                except (struct.error, ValueError) as e:
+                    logger.warning(f"标签 {name} 数据解析失败: {e}")
+
+        return values
+
+    def write_tags(self, tag_values: Dict[str, Any]) -> Dict[str, bool]:
+        """
+        批量写入标签
+
+        Args:
+            tag_values: {标签名称: 值}，值类型为bool/int/float，
+                按标签声明的类型编码，未声明时根据值推断
+
+        Returns:
+            Dict[str, bool]: {标签名称: 是否写入成功}
+        """
+        results = {name: False for name in tag_values}
+        if not self.connected:
+            logger.error("未连接到电缸")
+            return results
+
+        if not self.link_up:
+            return results
+
+        names = []
+        requests = []
+        for name, value in tag_values.items():
+            try:
+                requests.append(build_write_request(name, value, self.tag_types.get(name)))
+            except TypeError as e:
+                logger.error(f"写入标签 {name} 失败: {e}")
+                continue
+            names.append(name)
+
+        batches = split_requests(requests, [WRITE_REPLY_SIZE] * len(requests),
+                                 connection_limit(self.driver))
+
+        for start, end in batches:
+            replies = self._send_multiple(requests[start:end])
+            if replies is None:
+                continue
+            for name, (_, status, _) in zip(names[start:end], replies):
+                results[name] = status == STATUS_SUCCESS
+                if status != STATUS_SUCCESS:
+                    logger.warning(f"写入标签 {name} 失败: 状态码 {status:#04x}")
+
+        return results
+
+    def _send_multiple(self, requests: List[bytes]) -> Optional[List[Tuple[int, int, bytes]]]:
+        """
+        发送一个多服务报文
+
+        Args:
+            requests: 服务请求列表
+
+        Returns:
+            各服务的应答，报文失败返回None
+        """
+        try:
+            response = self.driver.generic_message(
+                service=SERVICE_MULTIPLE,
+                class_code=MESSAGE_ROUTER_CLASS,
+                instance=MESSAGE_ROUTER_INSTANCE,
+                request_data=pack_requests(requests),
+                connected=False,
+                name='multiple_service',
+            )
+        except Exception as e:
+            logger.error(f"多服务报文发送失败: {e}")
+            self.supervisor.record_failure(e)
+            return None
+
+        self.supervisor.record_success()
+
+        # 部分服务失败时通用状态为0x1E，应答数据仍然有效
+        if response is None or not response.value:
+            logger.error(f"多服务报文失败: {getattr(response, 'error', None)}")
+            return None
+
+        try:
+            replies = unpack_replies(response.value)
+        except struct.error as e:
+            logger.error(f"多服务应答解析失败: {e}")
+            return None
+
+        if len(replies) != len(requests):
+            logger.error(f"多服务应答数量不符: 请求{len(requests)}个, 应答{len(replies)}个")
+            return None
+        return replies
@@ -0,0 +1,219 @@
+"""
+CIP多服务报文
+把多个Read Tag/Write Tag服务打包进一个Multiple Service Packet，一次往返读写多个标签
+"""
+import struct
+from typing import Any, List, Sequence, Tuple
+from pycomm3 import (BOOL, SINT, INT, DINT, LINT, USINT, UINT, UDINT, ULINT,
+                     REAL, LREAL, BYTE, WORD, DWORD, LWORD, STRING)
+
+# 服务代码
+SERVICE_MULTIPLE = 0x0A
+SERVICE_READ_TAG = 0x4C
+SERVICE_WRITE_TAG = 0x4D
+REPLY_FLAG = 0x80
+
+# 多服务报文发往消息路由器 (Class 0x02, Instance 1)
+MESSAGE_ROUTER_CLASS = 0x02
+MESSAGE_ROUTER_INSTANCE = 0x01
+
+# 通用状态
+STATUS_SUCCESS = 0x00
+
+# 未连接报文的最大长度
+MAX_UNCONNECTED_SIZE = 504
+
+# 多服务请求开销：服务码、路径长度、消息路由器路径(4字节)、服务数量
+REQUEST_OVERHEAD = 1 + 1 + 4 + 2
+# 多服务应答开销：服务码、保留、通用状态、扩展状态长度、服务数量
+REPLY_OVERHEAD = 4 + 2
+# 单个读应答的估计长度（未声明类型的标签）：应答头4字节、类型码2字节、数值最长8字节
+READ_REPLY_ESTIMATE = 4 + 2 + 8
+# 写应答只有应答头
+WRITE_REPLY_SIZE = 4
+
+# 结构体类型码及Logix STRING的结构句柄
+STRUCTURE_TYPE = 0xA0
+LOGIX_STRING_HANDLE = 0x0FCE
+# Logix STRING结构的数据长度：LEN(DINT) + 82字符 + 2字节填充
+LOGIX_STRING_SIZE = 4 + 82 + 2
+
+ATOMIC_TYPES = {data_type.code: data_type for data_type in (
+    BOOL, SINT, INT, DINT, LINT, USINT, UINT, UDINT, ULINT,
+    REAL, LREAL, BYTE, WORD, DWORD, LWORD,
+)}
+
+
+def symbolic_path(tag_name: str) -> bytes:
+    """
+    构造标签的符号段路径 (ANSI扩展符号段)
+
+    Args:
+        tag_name: 标签名称，如 'Controller.Position'
+
+    Returns:
+        bytes: 路径（已按字对齐）
+    """
+    path = b''
+    for segment in tag_name.split('.'):
+        name = segment.encode('ascii')
+        path += bytes([0x91, len(name)]) + name
+        if len(name) % 2:
+            path += b'\x00'
+    return path
+
+
+def build_read_request(tag_name: str, elements: int = 1) -> bytes:
+    """构造Read Tag服务请求"""
+    path = symbolic_path(tag_name)
+    return bytes([SERVICE_READ_TAG, len(path) // 2]) + path + struct.pack('<H', elements)
+
+
+def read_reply_size(data_type=None) -> int:
+    """
+    按声明的数据类型估计Read Tag应答长度
+
+    Args:
+        data_type: pycomm3数据类型，STRING表示Logix STRING，None为未声明
+
+    Returns:
+        int: 应答长度（字节）
+    """
+    if data_type is None:
+        return READ_REPLY_ESTIMATE
+    if data_type is STRING:
+        # 应答头、结构体类型码、结构句柄、STRING结构
+        return 4 + 2 + 2 + LOGIX_STRING_SIZE
+    return 4 + 2 + data_type.size
+
+
+def infer_data_type(value: Any):
+    """根据Python值推断CIP数据类型（未声明类型的标签使用）"""
+    if isinstance(value, bool):
+        return BOOL
+    if isinstance(value, int):
+        return DINT
+    if isinstance(value, float):
+        return REAL
+    raise TypeError(f"不支持批量写入的数据类型: {type(value).__name__}")
+
+
+def build_write_request(tag_name: str, value: Any, data_type=None) -> bytes:
+    """
+    构造Write Tag服务请求
+
+    Args:
+        tag_name: 标签名称
+        value: 要写入的值
+        data_type: 标签声明的CIP数据类型，None时根据值推断
+    """
+    data_type = data_type or infer_data_type(value)
+    if data_type is STRING:
+        raise TypeError("不支持批量写入STRING标签")
+    path = symbolic_path(tag_name)
+    return (bytes([SERVICE_WRITE_TAG, len(path) // 2]) + path
+            + struct.pack('<HH', data_type.code, 1) + data_type.encode(value))
+
+
+def pack_requests(requests: Sequence[bytes]) -> bytes:
+    """
+    把多个服务请求打包为多服务报文的请求数据（服务数量、偏移表、各请求）
+
+    Args:
+        requests: 服务请求列表
+
+    Returns:
+        bytes: 多服务报文请求数据
+    """
+    offset = 2 + 2 * len(requests)
+    offsets = []
+    for request in requests:
+        offsets.append(offset)
+        offset += len(request)
+    return struct.pack(f'<H{len(requests)}H', len(requests), *offsets) + b''.join(requests)
+
+
+def unpack_replies(data: bytes) -> List[Tuple[int, int, bytes]]:
+    """
+    解析多服务报文应答数据
+
+    Args:
+        data: 多服务应答数据（通用状态之后的部分）
+
+    Returns:
+        [(服务码, 通用状态, 应答数据), ...]，顺序与请求一致
+    """
+    count = struct.unpack_from('<H', data, 0)[0]
+    offsets = list(struct.unpack_from(f'<{count}H', data, 2)) + [len(data)]
+
+    replies = []
+    for i in range(count):
+        reply = data[offsets[i]:offsets[i + 1]]
+        service, _, status, extended_size = struct.unpack_from('<BBBB', reply, 0)
+        payload = reply[4 + extended_size * 2:]
+        replies.append((service & ~REPLY_FLAG, status, payload))
+    return replies
+
+
+def decode_read_reply(payload: bytes) -> Any:
+    """
+    解码Read Tag应答数据（类型码+数值）
+
+    Returns:
+        原子类型返回Python值，Logix STRING返回str，其它结构体返回原始字节
+    """
+    type_code = struct.unpack_from('<H', payload, 0)[0]
+    if type_code == STRUCTURE_TYPE:
+        handle = struct.unpack_from('<H', payload, 2)[0]
+        value = payload[4:]
+        if handle == LOGIX_STRING_HANDLE:
+            length = struct.unpack_from('<I', value, 0)[0]
+            return value[4:4 + length].decode('ascii', errors='replace')
+        return bytes(value)
+
+    data_type = ATOMIC_TYPES.get(type_code)
+    if data_type is None:
+        return bytes(payload[2:])
+    return data_type.decode(payload[2:])
+
+
+def split_requests(requests: Sequence[bytes], reply_sizes: Sequence[int],
+                   limit: int) -> List[Tuple[int, int]]:
+    """
+    按连接大小把请求切分为多个多服务报文
+
+    请求报文和（估计的）应答报文都不超过连接大小。
+
+    Args:
+        requests: 服务请求列表
+        reply_sizes: 各请求的应答估计长度
+        limit: 连接大小（字节）
+
+    Returns:
+        [(起始索引, 结束索引), ...]
+    """
+    batches = []
+    start = 0
+    request_size = REQUEST_OVERHEAD
+    reply_size = REPLY_OVERHEAD
+    for i, request in enumerate(requests):
+        item_request = len(request) + 2
+        item_reply = reply_sizes[i] + 2
+        if i > start and (request_size + item_request > limit or reply_size + item_reply > limit):
+            batches.append((start, i))
+            start = i
+            request_size = REQUEST_OVERHEAD
+            reply_size = REPLY_OVERHEAD
+        request_size += item_request
+        reply_size += item_reply
+    if start < len(requests):
+        batches.append((start, len(requests)))
+    return batches
+
+
+def connection_limit(driver) -> int:
+    """驱动可用的单个报文大小"""
+    size = getattr(driver, 'connection_size', None)
+    if not isinstance(size, int) or size <= 0:
+        return MAX_UNCONNECTED_SIZE
+    return min(size, MAX_UNCONNECTED_SIZE)
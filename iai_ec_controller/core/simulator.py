@@ -0,0 +1,418 @@
+"""
+EC电缸模拟器
+在进程内实现控制器的全部标签，可替代EIPClient在无硬件时运行和测试
+"""
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Sequence
+from loguru import logger
+
+from core.connection_supervisor import ConnectionSupervisor
+from utils.converter import Converter
+
+# 可写标签（其余标签只读）
+WRITABLE_TAGS = {
+    'Controller.ST0', 'Controller.ST1', 'Controller.RES', 'Controller.BKRLS',
+    'Controller.Speed', 'Controller.Acceleration', 'Controller.Deceleration',
+    'Controller.TargetPos',
+}
+
+# 报警历史条数（Controller.AlarmHistory0~9，0为最新）
+ALARM_HISTORY_SIZE = 10
+
+
+class SimulatedActuator:
+    """模拟EC电缸
+
+    ST1上升沿向目标位置前进（目标在后方时前进到动作范围终点），
+    ST0上升沿向目标位置后退（目标在前方时后退到0度）。上电后第一次
+    ST0执行原点复位，完成后HomeComplete置位。运动按梯形速度曲线进行，
+    时间由 Converter.calculate_motion_time 计算；到达后LS1/LS0置位，
+    运动中释放ST0/ST1立即停止。
+
+    报警期间不接受运动命令，ALM为b接点（报警时为False），RES上升沿清除报警。
+    """
+
+    def __init__(self, max_rotation: float = 330.0, speed: float = 100.0,
+                 acceleration: float = 0.3, home_speed: float = 20.0,
+                 latency: float = 0.0, time_source: Callable[[], float] = time.monotonic):
+        """
+        初始化模拟电缸
+
+        Args:
+            max_rotation: 最大旋转角度（度）
+            speed: 初始速度设定（度/秒）
+            acceleration: 初始加减速度设定（G）
+            home_speed: 原点复位速度（度/秒）
+            latency: 命令到开始动作的延迟（秒）
+            time_source: 时间函数（秒）
+        """
+        self.home_speed = home_speed
+        self.latency = latency
+        self.time_source = time_source
+        self._lock = threading.RLock()
+
+        self.tags: Dict[str, Any] = {
+            'Controller.ST0': False,
+            'Controller.ST1': False,
+            'Controller.RES': False,
+            'Controller.BKRLS': False,
+            'Controller.LS0': False,
+            'Controller.LS1': False,
+            'Controller.PE0': False,
+            'Controller.PE1': False,
+            'Controller.ALM': True,
+            'Controller.Position': 0.0,
+            'Controller.Speed': float(speed),
+            'Controller.Acceleration': float(acceleration),
+            'Controller.Deceleration': float(acceleration),
+            'Controller.TargetPos': 0.0,
+            'Controller.HomeComplete': False,
+            'Controller.AlarmCode': '',
+            'Controller.TotalMoves': 0,
+            'Controller.TravelDistance': 0.0,
+            'Controller.OverloadLevel': 0,
+            'Controller.MotorTemp': 25.0,
+            'Controller.ControllerTemp': 30.0,
+            'Controller.BusVoltage': 24.0,
+            'Controller.MotorCurrent': 0.0,
+            'Controller.EncoderStatus': 0,
+            'Controller.FirmwareVersion': 'V0001',
+        }
+        # 参数初始值与 ParameterCommands.PARAM_IDS 的编号对应
+        defaults = [max_rotation, 0.5, 1, 0.0, 0, 0, 0, 0]
+        for index, value in enumerate(defaults, start=1):
+            self.tags[f'Controller.Parameter{index}'] = value
+        for index in range(ALARM_HISTORY_SIZE):
+            self.tags[f'Controller.AlarmHistory{index}'] = ''
+            self.tags[f'Controller.AlarmTime{index}'] = ''
+
+        # 当前运动：起点、终点、开始时间、(加速时间, 匀速时间, 总时间)、加速度、方向
+        self._motion: Optional[Dict[str, Any]] = None
+
+    @property
+    def moving(self) -> bool:
+        """是否正在运动"""
+        with self._lock:
+            self._update(self.time_source())
+            return self._motion is not None
+
+    @property
+    def position(self) -> float:
+        """当前位置（度）"""
+        return self.read('Controller.Position')
+
+    def read(self, tag_name: str) -> Optional[Any]:
+        """
+        读取标签
+
+        Args:
+            tag_name: 标签名称
+
+        Returns:
+            标签值，标签不存在返回None
+        """
+        with self._lock:
+            self._update(self.time_source())
+            return self.tags.get(tag_name)
+
+    def read_many(self, tag_names: Sequence[str]) -> Dict[str, Any]:
+        """在同一时刻读取多个标签"""
+        with self._lock:
+            self._update(self.time_source())
+            return {name: self.tags.get(name) for name in tag_names}
+
+    def write(self, tag_name: str, value: Any) -> bool:
+        """
+        写入标签
+
+        Args:
+            tag_name: 标签名称
+            value: 标签值
+
+        Returns:
+            bool: 标签可写且值有效返回True
+        """
+        if tag_name not in WRITABLE_TAGS and not tag_name.startswith('Controller.Parameter'):
+            return False
+        if tag_name not in self.tags:
+            return False
+        if tag_name in ('Controller.Speed', 'Controller.Acceleration',
+                        'Controller.Deceleration') and not value > 0:
+            return False
+
+        with self._lock:
+            now = self.time_source()
+            self._update(now)
+            previous = self.tags[tag_name]
+            self.tags[tag_name] = value
+
+            if tag_name == 'Controller.RES' and value and not previous:
+                self._clear_alarm()
+            elif tag_name in ('Controller.ST0', 'Controller.ST1'):
+                self._apply_start_signals(now, rising=bool(value) and not previous)
+        return True
+
+    def inject_alarm(self, code: str = 'A01'):
+        """
+        使电缸进入报警状态：立即停止并记入报警历史
+
+        Args:
+            code: 报警代码，首字母对应报警类别
+        """
+        with self._lock:
+            self._update(self.time_source())
+            self._stop()
+            self.tags['Controller.ALM'] = False
+            self.tags['Controller.AlarmCode'] = code
+            for index in range(ALARM_HISTORY_SIZE - 1, 0, -1):
+                self.tags[f'Controller.AlarmHistory{index}'] = self.tags[f'Controller.AlarmHistory{index - 1}']
+                self.tags[f'Controller.AlarmTime{index}'] = self.tags[f'Controller.AlarmTime{index - 1}']
+            self.tags['Controller.AlarmHistory0'] = code
+            self.tags['Controller.AlarmTime0'] = datetime.now().isoformat()
+        logger.info(f"模拟报警: {code}")
+
+    def _clear_alarm(self):
+        self.tags['Controller.ALM'] = True
+        self.tags['Controller.AlarmCode'] = ''
+
+    def _apply_start_signals(self, now: float, rising: bool):
+        """根据ST0/ST1的状态启动或停止运动"""
+        forward = self.tags['Controller.ST1']
+        backward = self.tags['Controller.ST0']
+        if forward == backward:
+            # 都释放或都置位：停止
+            self._stop()
+            return
+        if not rising:
+            # 释放其中一个信号：运动中则停止，已到位则保持LS
+            if self._motion is not None:
+                self._stop()
+            return
+        if not self.tags['Controller.ALM']:
+            return
+
+        position = self.tags['Controller.Position']
+        target = self.tags['Controller.TargetPos']
+        motion_range = self.tags['Controller.Parameter1']
+        homing = False
+        speed = self.tags['Controller.Speed']
+        if forward:
+            destination = target if position <= target <= motion_range else motion_range
+        elif not self.tags['Controller.HomeComplete']:
+            destination = 0.0
+            speed = self.home_speed
+            homing = True
+        else:
+            destination = target if 0.0 <= target <= position else 0.0
+
+        self._start_motion(now, destination, speed, bool(forward), homing)
+
+    def _start_motion(self, now: float, destination: float, speed: float,
+                      forward: bool, homing: bool):
+        destination = float(destination)
+        start = self.tags['Controller.Position']
+        acceleration = self.tags['Controller.Acceleration']
+        distance = abs(destination - start)
+        self.tags['Controller.LS0'] = False
+        self.tags['Controller.LS1'] = False
+        if distance > 0:
+            timing = Converter.calculate_motion_time(distance, speed, acceleration)
+        else:
+            timing = (0.0, 0.0, 0.0)
+        self._motion = {
+            'start': start,
+            'destination': destination,
+            'start_time': now + self.latency,
+            'timing': timing,
+            'acceleration': Converter.g_to_degree_per_second2(acceleration),
+            'forward': forward,
+            'homing': homing,
+        }
+        self.tags['Controller.MotorCurrent'] = 0.6
+
+    def _stop(self):
+        """立即停止在当前位置"""
+        if self._motion is not None:
+            self.tags['Controller.TravelDistance'] += abs(
+                self.tags['Controller.Position'] - self._motion['start'])
+        self._motion = None
+        self.tags['Controller.MotorCurrent'] = 0.0
+
+    def _update(self, now: float):
+        """按经过的时间推进位置，到达终点时置位LS"""
+        motion = self._motion
+        if motion is None:
+            return
+
+        t_acc, t_const, t_total = motion['timing']
+        elapsed = now - motion['start_time']
+        if elapsed < t_total:
+            self.tags['Controller.Position'] = motion['start'] + self._travelled(
+                max(elapsed, 0.0), motion) * (1 if motion['destination'] > motion['start'] else -1)
+            return
+
+        destination = motion['destination']
+        self.tags['Controller.Position'] = destination
+        self.tags['Controller.TotalMoves'] += 1
+        self._stop()
+        if motion['forward']:
+            self.tags['Controller.LS1'] = True
+        else:
+            self.tags['Controller.LS0'] = True
+        if motion['homing']:
+            self.tags['Controller.HomeComplete'] = True
+
+    @staticmethod
+    def _travelled(elapsed: float, motion: Dict[str, Any]) -> float:
+        """梯形速度曲线上经过elapsed秒后的移动距离"""
+        t_acc, t_const, t_total = motion['timing']
+        acc = motion['acceleration']
+        distance = abs(motion['destination'] - motion['start'])
+        if elapsed < t_acc:
+            return 0.5 * acc * elapsed ** 2
+        if elapsed < t_acc + t_const:
+            return 0.5 * acc * t_acc ** 2 + acc * t_acc * (elapsed - t_acc)
+        remaining = t_total - elapsed
+        return distance - 0.5 * acc * remaining ** 2
+
+
+class SimulatedEIPClient:
+    """模拟EIP客户端
+
+    接口与EIPClient相同，读写作用于进程内的SimulatedActuator。
+    round_trip为每次报文往返的模拟耗时，批量读写只计一次往返。
+    set_link 可模拟链路中断，断路器和自动重连与真实客户端行为一致。
+    """
+
+    def __init__(self, actuator: Optional[SimulatedActuator] = None,
+                 ip_address: str = 'simulator', port: int = 44818, round_trip: float = 0.0):
+        """
+        初始化模拟客户端
+
+        Args:
+            actuator: 模拟电缸，None时新建
+            ip_address: 显示用地址
+            port: 显示用端口
+            round_trip: 每次报文往返的模拟耗时（秒）
+        """
+        self.actuator = actuator or SimulatedActuator()
+        self.ip_address = ip_address
+        self.port = port
+        self.round_trip = round_trip
+        self.connected = False
+        self.requests = 0
+        self.tag_types: Dict[str, Any] = {}
+        self._link_ok = True
+        self.supervisor = ConnectionSupervisor(self._reopen, name=f"模拟电缸 {ip_address}")
+
+    @property
+    def link_up(self) -> bool:
+        """已连接且通信链路正常"""
+        return self.connected and not self.supervisor.state == ConnectionSupervisor.STATE_DOWN
+
+    def declare_tag_types(self, tag_types: Dict[str, Any]):
+        """声明标签的数据类型（模拟电缸按值的类型读写，只做记录）"""
+        self.tag_types.update(tag_types)
+
+    def add_state_listener(self, callback: Callable[[str], None]):
+        """注册连接状态回调"""
+        self.supervisor.add_listener(callback)
+
+    def add_reconnect_hook(self, hook: Callable[[], None]):
+        """注册重连钩子"""
+        self.supervisor.add_reconnect_hook(hook)
+
+    def connect(self) -> bool:
+        """建立连接"""
+        if not self._link_ok:
+            logger.error("连接失败: 模拟链路中断")
+            return False
+        self.connected = True
+        self.supervisor.mark_connected()
+        logger.info(f"成功连接到模拟电缸 {self.ip_address}")
+        return True
+
+    def disconnect(self):
+        """断开连接"""
+        self.supervisor.mark_disconnected()
+        if self.connected:
+            self.connected = False
+            logger.info("已断开与模拟电缸的连接")
+
+    def set_link(self, up: bool):
+        """
+        模拟链路中断/恢复
+
+        Args:
+            up: False时后续报文失败，恢复后由后台重连线程重新连接
+        """
+        self._link_ok = up
+
+    def _reopen(self) -> bool:
+        return self._link_ok
+
+    def _exchange(self) -> bool:
+        """模拟一次报文往返，链路中断时记录失败"""
+        if self.round_trip:
+            time.sleep(self.round_trip)
+        self.requests += 1
+        if not self._link_ok:
+            self.supervisor.record_failure(ConnectionError("模拟链路中断"))
+            return False
+        self.supervisor.record_success()
+        return True
+
+    def read_tag(self, tag_name: str) -> Optional[Any]:
+        """读取标签值，失败返回None"""
+        if not self.connected:
+            logger.error("未连接到电缸")
+            return None
+        if not self.link_up or not self._exchange():
+            return None
+
+        value = self.actuator.read(tag_name)
+        if value is None:
+            logger.error(f"读取标签 {tag_name} 失败: 标签不存在")
+        return value
+
+    def write_tag(self, tag_name: str, value: Any) -> bool:
+        """写入标签值"""
+        if not self.connected:
+            logger.error("未连接到电缸")
+            return False
+        if not self.link_up or not self._exchange():
+            return False
+
+        if not self.actuator.write(tag_name, value):
+            logger.error(f"写入标签 {tag_name} 失败")
+            return False
+        return True
+
+    def read_tags(self, tag_names: Sequence[str]) -> Dict[str, Any]:
+        """批量读取标签（一次往返）"""
+        values = {name: None for name in tag_names}
+        if not self.connected:
+            logger.error("未连接到电缸")
+            return values
+        if not self.link_up or not values or not self._exchange():
+            return values
+
+        values.update(self.actuator.read_many(list(values)))
+        return values
+
+    def write_tags(self, tag_values: Dict[str, Any]) -> Dict[str, bool]:
+        """批量写入标签（一次往返）"""
+        results = {name: False for name in tag_values}
+        if not self.connected:
+            logger.error("未连接到电缸")
+            return results
+        if not self.link_up or not self._exchange():
+            return results
+
+        for name, value in tag_values.items():
+            results[name] = self.actuator.write(name, value)
+            if not results[name]:
+                logger.warning(f"写入标签 {name} 失败")
+        return results
@@ -0,0 +1,167 @@
+"""
+状态记录模块
+轮询得到的状态保存为不可变的紧凑记录，代替每次新建的字典
+"""
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+
+class StatusRecord(Mapping):
+    """
+    状态记录基类
+
+    各布尔量压缩在一个整数位域里，字段在访问时才解码；不可变，
+    相等比较和哈希只比较槽位的值，适合做变化检测。同时实现只读映射接口，
+    status['ALM']、status.get()、items() 等原有字典用法保持可用。
+    """
+
+    __slots__ = ('word',)
+
+    # 子类定义：字段名 -> 解码函数（参数为记录本身）
+    FIELDS: Dict[str, Callable[['StatusRecord'], Any]] = {}
+
+    def __init__(self, word: int):
+        object.__setattr__(self, 'word', word)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} 不可修改")
+
+    def _key(self) -> Tuple:
+        """构造参数，也用于比较、哈希和序列化"""
+        return (self.word,)
+
+    def __reduce__(self):
+        return type(self), self._key()
+
+    def __getitem__(self, key: str):
+        try:
+            decode = self.FIELDS[key]
+        except KeyError:
+            raise KeyError(key) from None
+        return decode(self)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def __eq__(self, other):
+        if type(other) is type(self):
+            return self._key() == other._key()
+        return Mapping.__eq__(self, other)
+
+    def __hash__(self):
+        return hash((type(self),) + self._key())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为普通字典"""
+        return dict(self.items())
+
+
+def _flag(mask: int) -> Callable[[StatusRecord], bool]:
+    return lambda record: bool(record.word & mask)
+
+
+def _optional_flag(mask: int, valid_mask: int) -> Callable[[StatusRecord], Optional[bool]]:
+    """带有效位的标志，读取失败时为None"""
+    return lambda record: bool(record.word & mask) if record.word & valid_mask else None
+
+
+def _add_properties(cls):
+    """为每个字段生成只读属性（status.ALM 与 status['ALM'] 等价）"""
+    for name, decode in cls.FIELDS.items():
+        setattr(cls, name, property(decode))
+    return cls
+
+
+@_add_properties
+class IOStatus(StatusRecord):
+    """
+    I/O信号状态
+
+    位序与 StatusCommands.IO_SIGNALS 及列存的默认信号位序一致，
+    word 可以直接写入列存的 signals 列。
+    """
+
+    __slots__ = ()
+
+    SIGNALS = ('ST0', 'ST1', 'LS0', 'LS1', 'PE0', 'PE1', 'ALM', 'RES')
+
+    FIELDS = {signal: _flag(1 << bit) for bit, signal in enumerate(SIGNALS)}
+
+    @classmethod
+    def from_values(cls, values: Dict[str, Any]) -> 'IOStatus':
+        """
+        由 {信号名: 状态} 构造，缺少或读取失败(None)的信号视为False
+
+        Args:
+            values: 信号状态
+
+        Returns:
+            IOStatus: I/O状态记录
+        """
+        word = 0
+        for bit, signal in enumerate(cls.SIGNALS):
+            if values.get(signal):
+                word |= 1 << bit
+        return cls(word)
+
+
+# ControllerStatus 位域
+_CONNECTED = 0x01
+_ALARM = 0x02
+_HOME_COMPLETE = 0x04
+_LS0 = 0x08
+_LS1 = 0x10
+_LS0_VALID = 0x100
+_LS1_VALID = 0x200
+
+
+@_add_properties
+class ControllerStatus(StatusRecord):
+    """
+    电缸状态（ECController.get_status 的返回值）
+
+    位置单独保存，其余状态压缩在位域中；LS0/LS1读取失败时为None。
+    """
+
+    __slots__ = ('_position',)
+
+    FIELDS = {
+        'connected': _flag(_CONNECTED),
+        'position': lambda record: record._position,
+        'alarm': _flag(_ALARM),
+        'home_complete': _flag(_HOME_COMPLETE),
+        'ls0': _optional_flag(_LS0, _LS0_VALID),
+        'ls1': _optional_flag(_LS1, _LS1_VALID),
+    }
+
+    def __init__(self, word: int, position: Optional[float] = None):
+        super().__init__(word)
+        object.__setattr__(self, '_position', position)
+
+    def _key(self) -> Tuple:
+        return self.word, self._position
+
+    @classmethod
+    def from_values(cls, connected: bool, position: Optional[float], alarm: bool,
+                    home_complete: bool, ls0: Optional[bool],
+                    ls1: Optional[bool]) -> 'ControllerStatus':
+        """
+        由各状态值构造
+
+        Returns:
+            ControllerStatus: 电缸状态记录
+        """
+        word = ((_CONNECTED if connected else 0)
+                | (_ALARM if alarm else 0)
+                | (_HOME_COMPLETE if home_complete else 0))
+        if ls0 is not None:
+            word |= _LS0_VALID | (_LS0 if ls0 else 0)
+        if ls1 is not None:
+            word |= _LS1_VALID | (_LS1 if ls1 else 0)
+        return cls(word, position)
@@ -9,6 +9,7 @@ from typing import Dict, Any
 from loguru import logger
 
 from core.ec_controller import ECController
+from core.connection_supervisor import ConnectionSupervisor
 from commands.motion import MotionCommands
 from commands.parameter import ParameterCommands
 from commands.status import StatusCommands
@@ -39,6 +40,12 @@ class ControlPanel:
 
         # 状态更新
         self.update_timer = None
+        self.link_down = False
+
+        # 链路断开/恢复时暂停/恢复状态更新（回调在后台线程，转到界面线程处理）
+        self.controller.client.add_state_listener(
+            lambda state: self.root.after(0, self._on_link_state, state)
+        )
 
     def _create_widgets(self):
         """创建控件"""
@@ -248,6 +255,19 @@ class ControlPanel:
         self.param_read_btn.config(state='disabled')
         self.param_write_btn.config(state='disabled')
 
+    def _on_link_state(self, state: str):
+        """链路状态变化的处理"""
+        if state == ConnectionSupervisor.STATE_DOWN:
+            self.link_down = True
+            self._stop_status_update()
+            self._log("通信中断，正在自动重连", 'warning')
+        elif state == ConnectionSupervisor.STATE_CONNECTED and self.link_down:
+            self.link_down = False
+            self._start_status_update()
+            self._log("通信已恢复")
+        elif state == ConnectionSupervisor.STATE_DISCONNECTED:
+            self.link_down = False
+
     def _home(self):
         """原点复位"""
 
@@ -340,7 +360,7 @@ class ControlPanel:
         """开始状态更新"""
 
         def update():
-            if self.controller.client.connected:
+            if self.controller.client.link_up:
                 status = self.controller.get_status()
 
                 # 更新位置
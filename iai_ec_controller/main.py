@@ -45,6 +45,8 @@ def main():
                        help='配置文件路径')
     parser.add_argument('--demo', action='store_true',
                        help='运行演示程序')
+    parser.add_argument('--simulate', action='store_true',
+                       help='连接模拟电缸（无需硬件）')
     args = parser.parse_args()
 
     # 加载配置
@@ -55,6 +57,10 @@ def main():
 
     # 创建控制器
     controller = ECController(config)
+    if args.simulate:
+        from core.simulator import SimulatedActuator, SimulatedEIPClient
+        controller.client = SimulatedEIPClient(
+            SimulatedActuator(max_rotation=config['controller']['max_rotation']))
     motion = MotionCommands(controller)
 
     try:
@@ -0,0 +1,92 @@
+"""
+分级采集测试模块
+"""
+import pytest
+import time
+from unittest.mock import Mock
+from core.acquisition import AcquisitionScheduler
+from core.ec_controller import ECController
+from commands.status import StatusCommands
+
+
+class TestAcquisition:
+    """分级采集测试类"""
+
+    @pytest.fixture
+    def mock_client(self):
+        """模拟客户端：报警代码为空，其它标签读出固定值"""
+        client = Mock()
+        client.link_up = True
+        client.read_tags.side_effect = lambda tags: {
+            tag: '' if tag == StatusCommands.ALARM_CODE_TAG else 1.0 for tag in tags
+        }
+        return client
+
+    @pytest.fixture
+    def scheduler(self, mock_client):
+        """三个标签组的调度器"""
+        scheduler = AcquisitionScheduler(mock_client)
+        scheduler.add_group('fast', ['A', 'B'], 0.01)
+        scheduler.add_group('slow', ['C'], 0.5)
+        scheduler.add_group('identity', ['D'], None)
+        return scheduler
+
+    def test_tiered_polling(self, scheduler, mock_client):
+        """测试各组按自己的周期采集，到期的组合并为一次读取"""
+        assert scheduler.poll(now=100.0) == ['fast', 'slow', 'identity']
+        mock_client.read_tags.assert_called_once_with(['A', 'B', 'C', 'D'])
+
+        assert scheduler.poll(now=100.02) == ['fast']
+        assert scheduler.poll(now=100.51) == ['fast', 'slow']
+        assert scheduler.poll(now=200.0) == ['fast', 'slow']
+        assert mock_client.read_tags.call_count == 4
+
+        assert scheduler.values(['A', 'D']) == {'A': 1.0, 'D': 1.0}
+        assert scheduler.age('A') is not None
+        assert scheduler.age('X') is None
+
+    def test_identity_reset_on_reconnect(self, scheduler, mock_client):
+        """测试重连后缓存作废，标识信息重新读取"""
+        scheduler.poll(now=100.0)
+        scheduler.invalidate()
+        assert scheduler.value('D') is None
+        assert 'identity' in scheduler.poll(now=100.02)
+
+    def test_failed_read_keeps_value(self, scheduler, mock_client):
+        """测试读取失败时保留旧值，单次采集组稍后重试"""
+        scheduler.poll(now=100.0)
+        mock_client.read_tags.side_effect = lambda tags: {tag: None for tag in tags}
+        scheduler.invalidate()
+        scheduler.poll(now=100.0)
+        assert scheduler.value('A') is None
+
+        scheduler.poll(now=100.02)
+        assert 'identity' not in scheduler.poll(now=100.5)
+        assert 'identity' in scheduler.poll(now=101.1)
+
+    def test_full_status_from_cache(self, mock_client):
+        """测试监控期间完整状态从缓存读取"""
+        controller = Mock()
+        controller.client = mock_client
+        controller.SIGNALS = ECController.SIGNALS
+        controller.PARAMETERS = ECController.PARAMETERS
+        controller._alarm_active = ECController._alarm_active
+        status = StatusCommands(controller)
+
+        status.acquisition.start()
+        try:
+            deadline = time.time() + 2
+            while status.acquisition.group_ages()['identity'] is None and time.time() < deadline:
+                time.sleep(0.01)
+
+            # 暂停后台采集后，读取状态不再访问设备
+            mock_client.link_up = False
+            time.sleep(0.05)
+            calls = mock_client.read_tags.call_count
+            full_status = status.get_full_status()
+            assert mock_client.read_tags.call_count == calls
+            assert full_status['position']['current'] == 1.0
+            assert set(full_status['acquisition']) == {'signals', 'motion', 'diagnostics', 'identity'}
+            assert status.get_diagnostic_info()['firmware_version'] == 1.0
+        finally:
+            status.acquisition.stop()
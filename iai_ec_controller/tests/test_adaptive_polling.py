@@ -0,0 +1,80 @@
+"""
+自适应轮询测试模块
+"""
+import pytest
+from core.ec_controller import ECController
+from core.simulator import SimulatedActuator, SimulatedEIPClient
+from utils.clock import VirtualClock
+from utils.converter import Converter
+
+
+class TestAdaptivePolling:
+    """自适应轮询测试类"""
+
+    @pytest.fixture
+    def mock_config(self):
+        """模拟配置"""
+        return {
+            'connection': {'ip_address': '127.0.0.1', 'port': 44818},
+            'controller': {'model': 'EC-RTC12', 'max_rotation': 330, 'reduction_ratio': 45},
+            'motion': {'default_speed': 100, 'default_acceleration': 0.3,
+                       'default_deceleration': 0.3, 'adaptive_polling': True},
+        }
+
+    @pytest.fixture
+    def controller(self, mock_config):
+        """虚拟时钟下连接模拟电缸、已完成原点复位的控制器"""
+        clock = VirtualClock()
+        controller = ECController(mock_config, clock=clock)
+        actuator = SimulatedActuator(time_source=clock.monotonic)
+        actuator.tags['Controller.HomeComplete'] = True
+        controller.client = SimulatedEIPClient(actuator)
+        controller.connect()
+        controller.is_homing_complete = True
+        return controller
+
+    def test_prediction(self, controller):
+        """测试预测时间使用控制器当前的速度和加速度设定"""
+        expected = Converter.calculate_motion_time(300, 100.0, 0.3)[2]
+        assert controller.predict_motion_time(300) == pytest.approx(expected)
+        assert controller.predict_motion_time(0) == 0.0
+
+    def test_adaptive_move_records_error(self, controller):
+        """测试自适应等待到位并记录预测误差"""
+        assert controller.move_to_position(300, speed=100) is True
+        assert controller.get_current_position() == 300.0
+
+        stats = controller.prediction_statistics()
+        assert stats['moves'] == 1
+        assert stats['timeouts'] == 0
+        # 误差不超过一个快速轮询周期
+        assert 0.0 <= stats['max_abs_error'] <= ECController.ADAPTIVE_FAST_INTERVAL + 1e-6
+
+    def test_fewer_requests_than_fixed(self, controller):
+        """测试长距离运动时总线访问少于固定周期轮询"""
+        client = controller.client
+        before = client.requests
+        assert controller.move_to_position(300, speed=100, adaptive=False)
+        fixed = client.requests - before
+
+        before = client.requests
+        assert controller.move_to_position(0, speed=100, adaptive=True)
+        adaptive = client.requests - before
+
+        assert adaptive < fixed / 2
+
+    def test_alarm_during_cruise(self, controller):
+        """测试匀速段发生报警时停止等待"""
+        actuator = controller.client.actuator
+        clock = controller.clock
+        original_sleep = clock.sleep
+
+        def sleep(seconds):
+            original_sleep(seconds)
+            if clock.time() > 1.0:
+                actuator.inject_alarm('A01')
+
+        clock.sleep = sleep
+        assert controller.move_to_position(300, speed=100) is False
+        assert clock.time() < 2.0
+        assert actuator.read('Controller.ST1') is False
@@ -0,0 +1,90 @@
+"""
+时钟测试模块
+"""
+import threading
+import time
+import pytest
+from core.ec_controller import ECController
+from core.simulator import SimulatedActuator, SimulatedEIPClient
+from utils.clock import VirtualClock
+
+
+class TestClock:
+    """时钟测试类"""
+
+    @pytest.fixture
+    def mock_config(self):
+        """模拟配置"""
+        return {
+            'connection': {'ip_address': '127.0.0.1', 'port': 44818},
+            'controller': {'model': 'EC-RTC12', 'max_rotation': 330, 'reduction_ratio': 45},
+            'motion': {'default_speed': 100, 'default_acceleration': 0.3,
+                       'default_deceleration': 0.3},
+        }
+
+    def test_single_thread_sleep(self):
+        """测试单线程休眠立即返回并推进时间"""
+        clock = VirtualClock(start=100.0)
+        start = time.monotonic()
+        clock.sleep(3600)
+        assert clock.time() == 3700.0
+        assert time.monotonic() - start < 0.1
+
+    def test_threads_interleave(self):
+        """测试多个线程按虚拟时间顺序交替唤醒"""
+        clock = VirtualClock(participants=0)
+        clock.register(2)
+        events = []
+
+        def worker(name, period, count):
+            try:
+                for _ in range(count):
+                    clock.sleep(period)
+                    events.append((clock.time(), name))
+            finally:
+                clock.release()
+
+        threads = [threading.Thread(target=worker, args=('fast', 1.0, 4)),
+                   threading.Thread(target=worker, args=('slow', 3.0, 1))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=2)
+
+        assert [t for t, _ in events] == sorted(t for t, _ in events)
+        assert (3.0, 'slow') in events
+        assert clock.time() == 4.0
+
+    def test_home_timeout_in_virtual_time(self, mock_config):
+        """测试30秒原点复位超时不占用实际时间"""
+        clock = VirtualClock()
+        controller = ECController(mock_config, clock=clock)
+        # 原点复位需要80秒，超过30秒超时
+        actuator = SimulatedActuator(home_speed=0.5, time_source=clock.monotonic)
+        actuator.tags['Controller.Position'] = 40.0
+        controller.client = SimulatedEIPClient(actuator)
+        controller.connect()
+
+        start = time.monotonic()
+        assert controller.home() is False
+        assert clock.time() >= 30.0
+        assert time.monotonic() - start < 1.0
+
+    def test_thousand_cycles(self, mock_config):
+        """测试往复1000次在虚拟时间中快速完成"""
+        clock = VirtualClock()
+        controller = ECController(mock_config, clock=clock)
+        controller.client = SimulatedEIPClient(
+            SimulatedActuator(home_speed=100.0, time_source=clock.monotonic))
+        controller.connect()
+        assert controller.home() is True
+
+        start = time.monotonic()
+        for _ in range(1000):
+            assert controller.move_to_position(90, speed=300)
+            assert controller.move_to_position(10, speed=300)
+
+        assert controller.get_current_position() == 10.0
+        # 每次往复约0.8秒虚拟时间
+        assert clock.time() > 500.0
+        assert time.monotonic() - start < 10.0
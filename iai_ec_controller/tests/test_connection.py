@@ -121,4 +121,56 @@ class TestConnection:
             result2 = controller.connect()
             assert result2 is True
 
-            assert mock_connect.call_count == 2
\ No newline at end of file
+            assert mock_connect.call_count == 2
+
+    def test_circuit_breaker_fail_fast(self):
+        """测试连续通信失败后断路器打开，读写立即失败"""
+        client = EIPClient('192.168.1.100')
+        client.connected = True
+        client.supervisor.initial_backoff = 10  # 测试期间不发起重连
+        client.supervisor.mark_connected()
+
+        with patch.object(client, 'driver') as mock_driver:
+            mock_driver.read.side_effect = ConnectionResetError("Connection reset")
+
+            assert client.read_tag('TestTag') is None
+            assert client.read_tag('TestTag') is None
+            assert client.link_up is False
+
+            # 断路器打开后不再访问驱动
+            assert client.read_tag('TestTag') is None
+            assert client.write_tag('TestTag', 100) is False
+            assert mock_driver.read.call_count == 2
+            mock_driver.write.assert_not_called()
+
+        client.supervisor.mark_disconnected()
+
+    def test_auto_reconnect(self):
+        """测试断线后自动重连并执行重连钩子"""
+        client = EIPClient('192.168.1.100')
+        client.connected = True
+        client.supervisor.initial_backoff = 0.01
+        client.supervisor.mark_connected()
+
+        states = []
+        client.add_state_listener(states.append)
+        hook = Mock()
+        client.add_reconnect_hook(hook)
+
+        with patch('core.eip_client.CIPDriver') as mock_driver_class:
+            # 第一次重连失败，第二次成功
+            mock_driver_class.return_value.open.side_effect = [OSError("Network unreachable"), None]
+            client.driver = Mock()
+            client.driver.read.side_effect = ConnectionResetError("Connection reset")
+            client.read_tag('TestTag')
+            client.read_tag('TestTag')
+
+            deadline = time.time() + 2
+            while not hook.called and time.time() < deadline:
+                time.sleep(0.01)
+
+        assert client.link_up is True
+        assert client.driver is mock_driver_class.return_value
+        assert states == ['down', 'connected']
+        hook.assert_called_once()
+        client.supervisor.mark_disconnected()
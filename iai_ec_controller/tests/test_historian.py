@@ -0,0 +1,71 @@
+"""
+历史数据库测试模块
+"""
+import sqlite3
+from utils.historian import Historian, numeric_values
+
+
+class TestHistorian:
+    """历史数据库测试类"""
+
+    def test_numeric_values(self):
+        """测试只保留数值"""
+        values = numeric_values({'position': {'current': 1.5, 'unit': 'degree'},
+                                 'signals': {'ALM': True}, 'alarm': {'code': None}}, 'axis0')
+        assert values == {'axis0.position.current': 1.5, 'axis0.signals.ALM': 1.0}
+
+    def test_rollup_query(self, tmp_path):
+        """测试预聚合查询与原始样本聚合结果一致"""
+        historian = Historian(str(tmp_path / 'history.db'), bucket_widths=(60, 3600))
+        # 两小时数据，每10秒一个样本
+        for i in range(720):
+            historian.record({'position': i % 100}, timestamp=7200.0 + i * 10)
+        historian.flush()
+
+        hourly = historian.query('position', 7200, 14400, 3600)
+        assert len(hourly) == 2
+        assert hourly[0]['time'] == 7200 and hourly[0]['count'] == 360
+        assert hourly[0]['min'] == 0 and hourly[0]['max'] == 99
+
+        # 桶宽不是预聚合宽度的整数倍时从原始样本聚合
+        raw = historian.query('position', 7200, 14400, 1800)
+        assert len(raw) == 4
+        assert sum(row['count'] for row in raw) == 720
+
+        # 600秒桶由60秒预聚合合并
+        ten_minutes = historian.query('position', 7200, 7800, 600)
+        assert ten_minutes[0]['count'] == 60
+        assert ten_minutes[0]['avg'] == sum(i % 100 for i in range(60)) / 60
+        historian.close()
+
+    def test_background_writer(self, tmp_path):
+        """测试后台批量写入和WAL模式"""
+        path = str(tmp_path / 'history.db')
+        historian = Historian(path, batch_size=50, flush_interval=0.05)
+        historian.start()
+        for i in range(200):
+            historian.record({'a': i, 'b': True}, source='unit0_axis0', timestamp=1000.0 + i)
+        historian.stop()
+
+        assert historian.statistics()['samples_written'] == 400
+        assert historian.series() == ['unit0_axis0.a', 'unit0_axis0.b']
+        assert len(historian.raw('unit0_axis0.a', 1000, 1100)) == 100
+
+        # 其它连接可以同时读取
+        reader = sqlite3.connect(path)
+        assert reader.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        assert reader.execute("SELECT COUNT(*) FROM samples").fetchone()[0] == 400
+        reader.close()
+        historian.close()
+
+    def test_purge_keeps_rollups(self, tmp_path):
+        """测试清理原始样本后预聚合仍可查询"""
+        historian = Historian(str(tmp_path / 'history.db'), bucket_widths=(60,))
+        for i in range(120):
+            historian.record({'value': 1.0}, timestamp=float(i))
+        historian.flush()
+
+        assert historian.purge(120.0) == 120
+        assert historian.raw('value', 0, 120) == []
+        assert sum(row['count'] for row in historian.query('value', 0, 120, 60)) == 120
+        historian.close()
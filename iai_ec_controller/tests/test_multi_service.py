@@ -0,0 +1,256 @@
+"""
+多服务报文批量读写测试模块
+"""
+import pytest
+import struct
+from unittest.mock import Mock
+from pycomm3 import BOOL, INT, DINT, REAL, STRING
+from core.eip_client import EIPClient
+from core.ec_controller import ECController
+from core.multi_service import (
+    build_read_request, build_write_request, pack_requests, unpack_replies,
+    decode_read_reply, split_requests, symbolic_path, read_reply_size, LOGIX_STRING_SIZE,
+)
+from commands.status import StatusCommands
+
+
+def parse_tag_name(request: bytes) -> str:
+    """从服务请求中取出标签名称"""
+    path = request[2:2 + request[1] * 2]
+    names = []
+    offset = 0
+    while offset < len(path):
+        length = path[offset + 1]
+        names.append(path[offset + 2:offset + 2 + length].decode('ascii'))
+        offset += 2 + length + length % 2
+    return '.'.join(names)
+
+
+class FakeTagDriver:
+    """模拟处理多服务报文的驱动"""
+
+    def __init__(self, tags, connection_size=504, tag_types=None):
+        self.tags = dict(tags)
+        self.connection_size = connection_size
+        self.tag_types = tag_types or {}
+        self.messages = 0
+        self.too_large = 0
+
+    def generic_message(self, service, class_code, instance, request_data, **kwargs):
+        assert service == 0x0A and class_code == 0x02 and instance == 0x01
+        assert len(request_data) + 8 <= self.connection_size
+        self.messages += 1
+
+        count = struct.unpack_from('<H', request_data, 0)[0]
+        offsets = list(struct.unpack_from(f'<{count}H', request_data, 2)) + [len(request_data)]
+        replies = []
+        for i in range(count):
+            request = request_data[offsets[i]:offsets[i + 1]]
+            replies.append(self._handle(request))
+
+        offset = 2 + 2 * count
+        table = []
+        for reply in replies:
+            table.append(offset)
+            offset += len(reply)
+        value = struct.pack(f'<H{count}H', count, *table) + b''.join(replies)
+        if len(value) + 4 > self.connection_size:
+            # 应答超过连接大小：整个报文失败
+            self.too_large += 1
+            return Mock(value=None, error='Reply data too large')
+        return Mock(value=value, error=None)
+
+    def _handle(self, request: bytes) -> bytes:
+        service = request[0]
+        name = parse_tag_name(request)
+        if name not in self.tags:
+            return bytes([service | 0x80, 0, 0x05, 0])
+
+        if service == 0x4C:
+            value = self.tags[name]
+            if isinstance(value, str):
+                data = struct.pack('<I', len(value)) + value.encode('ascii')
+                data += bytes(LOGIX_STRING_SIZE - len(data))
+                return bytes([service | 0x80, 0, 0, 0]) + struct.pack('<HH', 0xA0, 0x0FCE) + data
+            data_type = BOOL if isinstance(value, bool) else DINT if isinstance(value, int) else REAL
+            return bytes([service | 0x80, 0, 0, 0]) + struct.pack('<H', data_type.code) + data_type.encode(value)
+
+        data = request[2 + request[1] * 2:]
+        type_code = struct.unpack_from('<H', data, 0)[0]
+        data_type = {BOOL.code: BOOL, INT.code: INT, DINT.code: DINT, REAL.code: REAL}[type_code]
+        if name in self.tag_types and self.tag_types[name] is not data_type:
+            return bytes([service | 0x80, 0, 0xFF, 1, 0x07, 0x21])  # 类型不符
+        self.tags[name] = data_type.decode(data[4:])
+        return bytes([service | 0x80, 0, 0, 0])
+
+
+class TestMultiService:
+    """多服务报文测试类"""
+
+    @pytest.fixture
+    def mock_config(self):
+        """模拟配置"""
+        return {
+            'connection': {
+                'ip_address': '192.168.1.100',
+                'port': 44818,
+                'timeout': 5
+            },
+            'controller': {
+                'model': 'EC-RTC12',
+                'max_rotation': 330,
+                'reduction_ratio': 45
+            }
+        }
+
+    @pytest.fixture
+    def device_tags(self):
+        """设备标签"""
+        tags = {tag: False for tag in ECController.SIGNALS.values()}
+        tags.update({
+            'Controller.ALM': True,
+            'Controller.LS1': True,
+            'Controller.Position': 123.5,
+            'Controller.Speed': 100.0,
+            'Controller.Acceleration': 0.5,
+            'Controller.Deceleration': 0.5,
+            'Controller.TotalMoves': 1024,
+            'Controller.TravelDistance': 4096,
+            'Controller.OverloadLevel': 12,
+        })
+        return tags
+
+    def test_packet_round_trip(self):
+        """测试请求打包和应答解析"""
+        assert symbolic_path('Controller.ST0') == b'\x91\x0aController\x91\x03ST0\x00'
+
+        requests = [build_read_request('A'), build_write_request('B', 1.5)]
+        packet = pack_requests(requests)
+        assert struct.unpack_from('<HHH', packet, 0) == (2, 6, 6 + len(requests[0]))
+        assert parse_tag_name(requests[1]) == 'B'
+
+        reply = bytes([0xCC, 0, 0, 0]) + struct.pack('<H', REAL.code) + REAL.encode(1.5)
+        data = struct.pack('<HHH', 2, 6, 6 + len(reply)) + reply + bytes([0xCD, 0, 0x05, 1, 0, 0])
+        replies = unpack_replies(data)
+        assert replies[0][0] == 0x4C and decode_read_reply(replies[0][2]) == 1.5
+        assert replies[1] == (0x4D, 0x05, b'')
+
+    def test_split_by_connection_size(self):
+        """测试按连接大小分包"""
+        requests = [build_read_request(f'Controller.Tag{i}') for i in range(40)]
+        batches = split_requests(requests, [14] * len(requests), 200)
+        assert len(batches) > 1
+        assert batches[0][0] == 0 and batches[-1][1] == 40
+        for (_, end), (start, _) in zip(batches, batches[1:]):
+            assert end == start
+
+    def test_read_tags(self, device_tags):
+        """测试批量读取标签"""
+        client = EIPClient('192.168.1.100')
+        client.connected = True
+        client.driver = FakeTagDriver(device_tags)
+
+        values = client.read_tags(['Controller.Position', 'Controller.LS1', 'Controller.Unknown'])
+        assert values['Controller.Position'] == 123.5
+        assert values['Controller.LS1'] is True
+        assert values['Controller.Unknown'] is None
+        assert client.driver.messages == 1
+
+    def test_read_tags_split(self, device_tags):
+        """测试超过连接大小时自动分包"""
+        client = EIPClient('192.168.1.100')
+        client.connected = True
+        client.driver = FakeTagDriver(device_tags, connection_size=120)
+
+        values = client.read_tags(list(device_tags))
+        assert values == device_tags
+        assert client.driver.messages > 1
+
+    def test_write_tags(self, device_tags):
+        """测试批量写入标签"""
+        client = EIPClient('192.168.1.100')
+        client.connected = True
+        client.driver = FakeTagDriver(device_tags)
+
+        results = client.write_tags({
+            'Controller.Speed': 200.0,
+            'Controller.ST1': True,
+            'Controller.Unknown': 1,
+        })
+        assert results == {'Controller.Speed': True, 'Controller.ST1': True, 'Controller.Unknown': False}
+        assert client.driver.tags['Controller.Speed'] == 200.0
+        assert client.driver.tags['Controller.ST1'] is True
+        assert client.driver.messages == 1
+
+    def test_full_status_round_trips(self, mock_config, device_tags):
+        """测试完整状态只需一次往返"""
+        controller = ECController(mock_config)
+        controller.client.connected = True
+        controller.client.driver = FakeTagDriver(device_tags)
+        status = StatusCommands(controller)
+
+        full_status = status.get_full_status()
+        assert controller.client.driver.messages == 1
+        assert full_status['position']['current'] == 123.5
+        assert full_status['signals']['LS1'] is True
+        assert full_status['alarm']['active'] is False
+        assert full_status['motion']['speed'] == 100.0
+        assert full_status['maintenance']['total_moves'] == 1024
+
+        assert status.get_io_status()['ALM'] is True
+        assert controller.get_status()['position'] == 123.5
+        assert controller.client.driver.messages == 3
+
+    def test_reply_size_by_type(self):
+        """测试按声明类型估计应答长度"""
+        assert read_reply_size(BOOL) == 4 + 2 + 1
+        assert read_reply_size(REAL) == 4 + 2 + 4
+        assert read_reply_size(STRING) == 4 + 2 + 2 + LOGIX_STRING_SIZE
+        assert read_reply_size(None) == 4 + 2 + 8
+
+    def test_read_declared_strings(self, device_tags):
+        """测试声明为STRING的标签按实际应答长度分包，应答不超过连接大小"""
+        strings = {f'Controller.Name{i}': f'name{i}' for i in range(6)}
+        device_tags.update(strings)
+        client = EIPClient('192.168.1.100')
+        client.connected = True
+        client.declare_tag_types({name: STRING for name in strings})
+        client.driver = FakeTagDriver(device_tags, connection_size=240)
+
+        values = client.read_tags(list(device_tags))
+        assert values == device_tags
+        assert client.driver.too_large == 0
+        assert client.driver.messages > 1
+
+    def test_read_undeclared_strings_split(self, device_tags):
+        """测试未声明类型的长应答使报文失败时拆半重发"""
+        strings = {f'Controller.Name{i}': f'name{i}' for i in range(6)}
+        device_tags.update(strings)
+        client = EIPClient('192.168.1.100')
+        client.connected = True
+        client.driver = FakeTagDriver(device_tags, connection_size=240)
+
+        values = client.read_tags(list(device_tags))
+        assert values == device_tags
+        assert client.driver.too_large > 0
+
+    def test_write_declared_type(self, device_tags):
+        """测试批量写入按标签声明的类型编码"""
+        device_tags['Controller.Mode'] = 0
+        client = EIPClient('192.168.1.100')
+        client.connected = True
+        client.driver = FakeTagDriver(device_tags, tag_types={'Controller.Mode': INT})
+
+        assert client.write_tags({'Controller.Mode': 3}) == {'Controller.Mode': False}
+        client.declare_tag_types({'Controller.Mode': INT})
+        assert client.write_tags({'Controller.Mode': 3}) == {'Controller.Mode': True}
+        assert client.driver.tags['Controller.Mode'] == 3
+
+    def test_controller_declares_types(self, mock_config):
+        """测试控制器和状态命令声明各自标签的类型"""
+        controller = ECController(mock_config)
+        StatusCommands(controller)
+        types = controller.client.tag_types
+        assert types['Controller.ST0'] is BOOL
+        assert types['Controller.Position'] is REAL
+        assert types['Controller.FirmwareVersion'] is STRING
@@ -0,0 +1,76 @@
+"""
+周期调度测试模块
+"""
+import threading
+import time
+from utils.periodic import PeriodicScheduler, percentile
+
+
+class TestPeriodic:
+    """周期调度测试类"""
+
+    def test_percentile(self):
+        """测试百分位数"""
+        values = list(range(1, 101))
+        assert percentile(values, 0.5) == 50
+        assert percentile(values, 0.99) == 99
+        assert percentile([], 0.5) == 0.0
+
+    def test_fixed_rate(self):
+        """测试周期不受任务耗时影响"""
+        scheduler = PeriodicScheduler(0.05, lambda: time.sleep(0.02), name='test')
+        scheduler.start()
+        time.sleep(0.6)
+        scheduler.stop()
+
+        stats = scheduler.statistics()
+        # 若按 sleep(interval) 方式执行只能达到约14Hz
+        assert 17 <= stats['achieved_hz'] <= 23
+        assert stats['overruns'] == 0
+
+    def test_overrun_skips_cycles(self):
+        """测试超时时跳过错过的周期"""
+        calls = []
+
+        def task():
+            calls.append(time.monotonic())
+            if len(calls) == 2:
+                time.sleep(0.16)
+
+        scheduler = PeriodicScheduler(0.05, task, name='test')
+        scheduler.start()
+        time.sleep(0.5)
+        scheduler.stop()
+
+        stats = scheduler.statistics()
+        assert stats['overruns'] == 1
+        assert stats['skipped'] == 3
+        # 跳过后回到原有时间网格，不连续补执行
+        assert calls[2] - calls[1] >= 0.19
+
+    def test_restart_without_wait(self):
+        """测试只发信号停止后立即重启：旧线程退出，任务不会并发执行"""
+        active = []
+        overlaps = []
+        lock = threading.Lock()
+
+        def task():
+            with lock:
+                active.append(1)
+                overlaps.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.pop()
+
+        scheduler = PeriodicScheduler(0.01, task, name='test')
+        scheduler.start()
+        time.sleep(0.02)
+        old_thread = scheduler.thread
+        scheduler.stop(wait=False)
+        scheduler.start()
+        time.sleep(0.2)
+        scheduler.stop()
+
+        assert not old_thread.is_alive()
+        assert max(overlaps) == 1
+        assert [t for t in threading.enumerate() if t.name == 'test'] == []
@@ -0,0 +1,121 @@
+"""
+遥测记录测试模块
+"""
+import csv
+import pytest
+from utils.recorder import TelemetryRecorder, FORMAT_BINARY, flatten_status, read_binary
+
+
+def make_status(i: int) -> dict:
+    """生成测试状态"""
+    return {
+        'timestamp': f"2026-01-01T00:00:{i:02d}",
+        'position': {'current': i * 0.5, 'target': 10.0},
+        'signals': {'alarm': i % 2 == 0, 'pend': None},
+        'alarm_code': 'E100' if i % 3 == 0 else '',
+    }
+
+
+class TestRecorder:
+    """遥测记录测试类"""
+
+    def test_flatten_status(self):
+        """测试展开嵌套状态"""
+        flat = flatten_status(make_status(1))
+        assert flat['position.current'] == 0.5
+        assert flat['signals.alarm'] is False
+        assert 'position' not in flat
+
+    def test_csv_round_trip(self, tmp_path):
+        """测试CSV记录"""
+        recorder = TelemetryRecorder(str(tmp_path), batch_size=4, flush_interval=0.05)
+        recorder.start()
+        for i in range(10):
+            recorder.record(make_status(i))
+        recorder.stop()
+
+        assert recorder.rows_written == 10
+        assert len(recorder.files) == 1
+        with open(recorder.files[0], newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 10
+        assert float(rows[3]['position.current']) == 1.5
+        assert rows[3]['alarm_code'] == 'E100'
+
+    def test_binary_round_trip(self, tmp_path):
+        """测试二进制列存记录"""
+        recorder = TelemetryRecorder(str(tmp_path), fmt=FORMAT_BINARY, batch_size=3,
+                                     flush_interval=0.05)
+        recorder.start()
+        for i in range(7):
+            recorder.record(make_status(i))
+        recorder.stop()
+
+        columns = read_binary(recorder.files[0])
+        assert columns['position.current'] == [i * 0.5 for i in range(7)]
+        assert columns['signals.alarm'] == [i % 2 == 0 for i in range(7)]
+        assert columns['signals.pend'] == [None] * 7
+        assert columns['alarm_code'][:4] == ['E100', '', '', 'E100']
+        assert len(columns['time']) == 7
+
+    def test_rotation(self, tmp_path):
+        """测试按大小轮换文件"""
+        recorder = TelemetryRecorder(str(tmp_path), batch_size=5, flush_interval=0.05,
+                                     max_bytes=200)
+        recorder.start()
+        for i in range(20):
+            recorder.record(make_status(i))
+        recorder.stop()
+
+        assert len(recorder.files) > 1
+        total = 0
+        for path in recorder.files:
+            with open(path, newline='', encoding='utf-8') as f:
+                total += len(list(csv.DictReader(f)))
+        assert total == 20
+
+    def test_bounded_pending(self, tmp_path):
+        """测试写线程未运行时队列有上限"""
+        recorder = TelemetryRecorder(str(tmp_path), max_pending=5)
+        for i in range(8):
+            recorder.record(make_status(i))
+
+        stats = recorder.statistics()
+        assert stats['pending'] == 5
+        assert stats['rows_dropped'] == 3
+
+    def test_invalid_format(self, tmp_path):
+        """测试未知格式"""
+        with pytest.raises(ValueError):
+            TelemetryRecorder(str(tmp_path), fmt='xml')
+
+    def test_schema_change_binary(self, tmp_path):
+        """测试二进制格式中先为空后为文本的列和后出现的列不丢失"""
+        recorder = TelemetryRecorder(str(tmp_path), fmt=FORMAT_BINARY, batch_size=2,
+                                     flush_interval=0.05)
+        recorder.start()
+        recorder.record({'position': 1.0, 'alarm_code': None})
+        recorder.record({'position': 2.0, 'alarm_code': None})
+        recorder.record({'position': 3.0, 'alarm_code': 'E100', 'voltage': 24.0})
+        recorder.record({'position': 4.0, 'alarm_code': 17, 'voltage': None})
+        recorder.stop()
+
+        assert len(recorder.files) == 1
+        columns = read_binary(recorder.files[0])
+        assert columns['position'] == [1.0, 2.0, 3.0, 4.0]
+        assert columns['alarm_code'] == [None, None, 'E100', '17']
+        assert columns['voltage'] == [None, None, 24.0, None]
+
+    def test_schema_change_csv(self, tmp_path):
+        """测试CSV出现新列时轮换到新文件"""
+        recorder = TelemetryRecorder(str(tmp_path), batch_size=1, flush_interval=0.05)
+        recorder.start()
+        recorder.record({'position': 1.0})
+        recorder.record({'position': 2.0, 'alarm_code': 'E100'})
+        recorder.stop()
+
+        assert len(recorder.files) == 2
+        with open(recorder.files[1], newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0]['alarm_code'] == 'E100'
+        assert float(rows[0]['position']) == 2.0
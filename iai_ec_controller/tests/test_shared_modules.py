@@ -0,0 +1,67 @@
+"""
+共用模块一致性测试模块
+
+rec_controller 和 iai_ec_controller 是各自独立运行的程序（各自的工作目录、
+依赖和 utils/core 包），没有共同的安装包，部分通用模块在两边各有一份。
+这里检查两份副本除模块文档、import、日志对象外的语法树一致，防止改了一边忘了另一边。
+"""
+import ast
+import os
+import pytest
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REC_DIR = os.path.join(os.path.dirname(APP_DIR), 'rec_controller')
+
+
+def module_body(path: str, skip=()) -> list:
+    """
+    模块顶层语句的语法树
+
+    Args:
+        path: 模块文件
+        skip: 允许两边不同的顶层函数或类名
+
+    Returns:
+        list: 去掉模块文档、import和logger定义后各顶层语句的 ast.dump
+    """
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    body = []
+    for node in tree.body[1:] if ast.get_docstring(tree) is not None else tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            continue
+        if isinstance(node, ast.Assign) and any(
+                isinstance(target, ast.Name) and target.id == 'logger' for target in node.targets):
+            continue
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)) and node.name in skip:
+            continue
+        body.append(ast.dump(node))
+    return body
+
+
+def assert_same_as_rec(module: str, skip=()):
+    """断言本程序的模块与 rec_controller 中的副本一致"""
+    rec_path = os.path.join(REC_DIR, module)
+    if not os.path.exists(rec_path):
+        pytest.skip("没有 rec_controller 源码")
+    assert module_body(os.path.join(APP_DIR, module), skip) == module_body(rec_path, skip)
+
+
+class TestSharedModules:
+    """共用模块一致性测试类"""
+
+    def test_connection_supervisor(self):
+        """测试连接监督与 rec_controller 一致"""
+        assert_same_as_rec('core/connection_supervisor.py')
+
+    def test_periodic(self):
+        """测试周期调度与 rec_controller 一致"""
+        assert_same_as_rec('utils/periodic.py')
+
+    def test_historian(self):
+        """测试历史数据库与 rec_controller 一致（flatten_status 在本程序中取自 recorder）"""
+        assert_same_as_rec('utils/historian.py', skip={'flatten_status'})
+
+    def test_clock(self):
+        """测试时钟与 rec_controller 一致"""
+        assert_same_as_rec('utils/clock.py')
@@ -0,0 +1,155 @@
+"""
+EC电缸模拟器测试模块
+"""
+import pytest
+from core.simulator import SimulatedActuator, SimulatedEIPClient
+from core.ec_controller import ECController
+from commands.status import StatusCommands
+from utils.converter import Converter
+
+
+class FakeTime:
+    """手动推进的时间函数"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSimulator:
+    """EC电缸模拟器测试类"""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeTime()
+
+    @pytest.fixture
+    def actuator(self, clock):
+        """已完成原点复位的模拟电缸"""
+        actuator = SimulatedActuator(speed=100.0, acceleration=0.3, time_source=clock)
+        actuator.tags['Controller.HomeComplete'] = True
+        return actuator
+
+    @pytest.fixture
+    def controller(self):
+        """连接模拟客户端的控制器"""
+        config = {
+            'connection': {'ip_address': '127.0.0.1', 'port': 44818},
+            'controller': {'model': 'EC-RTC12', 'max_rotation': 330, 'reduction_ratio': 45},
+            'motion': {'default_speed': 100, 'default_acceleration': 0.3,
+                       'default_deceleration': 0.3},
+        }
+        controller = ECController(config)
+        controller.client = SimulatedEIPClient(SimulatedActuator(home_speed=500.0))
+        controller.connect()
+        yield controller
+        controller.disconnect()
+
+    def test_motion_time(self, actuator, clock):
+        """测试运动时间与 calculate_motion_time 一致，到达后LS1置位"""
+        _, _, total = Converter.calculate_motion_time(90.0, 100.0, 0.3)
+        actuator.write('Controller.TargetPos', 90.0)
+        actuator.write('Controller.ST1', True)
+
+        clock.now = total / 2
+        assert actuator.read('Controller.Position') == pytest.approx(45.0)
+        assert actuator.read('Controller.LS1') is False
+
+        clock.now = total
+        assert actuator.read('Controller.Position') == 90.0
+        assert actuator.read('Controller.LS1') is True
+        assert actuator.read('Controller.TotalMoves') == 1
+
+    def test_new_move_clears_ls(self, actuator, clock):
+        """测试新的运动开始时清除上次的到位信号"""
+        actuator.write('Controller.TargetPos', 10.0)
+        actuator.write('Controller.ST1', True)
+        clock.now = 1.0
+        assert actuator.read('Controller.LS1') is True
+
+        actuator.write('Controller.ST1', False)
+        actuator.write('Controller.TargetPos', 20.0)
+        actuator.write('Controller.ST1', True)
+        assert actuator.read('Controller.LS1') is False
+
+    def test_release_stops_motion(self, actuator, clock):
+        """测试运动中释放ST1立即停止"""
+        actuator.write('Controller.TargetPos', 300.0)
+        actuator.write('Controller.ST1', True)
+        clock.now = 1.0
+        actuator.write('Controller.ST1', False)
+        stopped_at = actuator.read('Controller.Position')
+
+        clock.now = 5.0
+        assert 0.0 < stopped_at < 300.0
+        assert actuator.read('Controller.Position') == stopped_at
+        assert actuator.read('Controller.LS1') is False
+
+    def test_first_st0_homes(self, clock):
+        """测试上电后第一次ST0执行原点复位"""
+        actuator = SimulatedActuator(home_speed=20.0, time_source=clock)
+        actuator.tags['Controller.Position'] = 40.0
+        actuator.write('Controller.ST0', True)
+
+        clock.now = 10.0
+        assert actuator.read('Controller.Position') == 0.0
+        assert actuator.read('Controller.HomeComplete') is True
+        assert actuator.read('Controller.LS0') is True
+
+    def test_alarm_blocks_motion(self, actuator, clock):
+        """测试报警期间不接受运动命令，RES清除报警"""
+        actuator.inject_alarm('A01')
+        assert actuator.read('Controller.ALM') is False
+        assert actuator.read('Controller.AlarmHistory0') == 'A01'
+
+        actuator.write('Controller.TargetPos', 90.0)
+        actuator.write('Controller.ST1', True)
+        clock.now = 10.0
+        assert actuator.read('Controller.Position') == 0.0
+
+        actuator.write('Controller.ST1', False)
+        actuator.write('Controller.RES', True)
+        assert actuator.read('Controller.ALM') is True
+        assert actuator.read('Controller.AlarmCode') == ''
+
+    def test_read_only_tags(self, actuator):
+        """测试只读标签和无效值写入失败"""
+        assert actuator.write('Controller.Position', 10.0) is False
+        assert actuator.write('Controller.LS1', True) is False
+        assert actuator.write('Controller.Speed', 0) is False
+        assert actuator.write('Controller.Unknown', 1) is False
+        assert actuator.write('Controller.Parameter1', 300.0) is True
+
+    def test_controller_end_to_end(self, controller):
+        """测试控制器通过模拟客户端完成原点复位和定位"""
+        assert controller.home() is True
+        assert controller.move_to_position(30, speed=500, acceleration=1.0) is True
+        assert controller.get_current_position() == 30.0
+        assert controller.move_to_position(10, speed=500, acceleration=1.0) is True
+        assert controller.get_current_position() == 10.0
+
+        status = StatusCommands(controller).get_full_status()
+        assert status['signals']['LS0'] is True
+        assert status['maintenance']['travel_distance'] == pytest.approx(50.0)
+
+    def test_batch_read_single_request(self, controller):
+        """测试批量读取只计一次往返"""
+        status = StatusCommands(controller)
+        before = controller.client.requests
+        status.get_diagnostic_info()
+        assert controller.client.requests == before + 1
+
+    def test_link_down_opens_breaker(self, controller):
+        """测试链路中断后断路器打开，读写立即失败"""
+        client = controller.client
+        client.supervisor.initial_backoff = 0.01
+        client.set_link(False)
+        assert client.read_tag('Controller.Position') is None
+        assert client.read_tag('Controller.Position') is None
+        assert client.link_up is False
+
+        requests = client.requests
+        assert client.write_tag('Controller.ST1', True) is False
+        assert client.requests == requests
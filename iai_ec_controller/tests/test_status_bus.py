@@ -0,0 +1,107 @@
+"""
+状态总线测试模块
+"""
+import threading
+import time
+from utils.status_bus import (StatusBus, POLICY_DROP_OLDEST, POLICY_COALESCE_LATEST,
+                              POLICY_BLOCK)
+
+
+def wait_for(predicate, timeout: float = 2.0):
+    """等待条件成立"""
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+class TestStatusBus:
+    """状态总线测试类"""
+
+    def test_multiple_subscribers(self):
+        """测试多个订阅者都收到全部状态"""
+        bus = StatusBus()
+        first, second = [], []
+        bus.subscribe(first.append, name='first')
+        bus.subscribe(second.append, name='second')
+
+        for i in range(5):
+            bus.publish(i)
+
+        assert wait_for(lambda: len(first) == 5 and len(second) == 5)
+        assert first == second == [0, 1, 2, 3, 4]
+        assert bus.metrics()['first']['delivered'] == 5
+        bus.close()
+
+    def test_slow_subscriber_does_not_block(self):
+        """测试慢订阅者不拖慢发布者，按策略丢弃"""
+        bus = StatusBus()
+        release = threading.Event()
+        received = []
+
+        def slow(status):
+            release.wait()
+            received.append(status)
+
+        oldest = bus.subscribe(slow, name='oldest', maxsize=3, policy=POLICY_DROP_OLDEST)
+        latest = bus.subscribe(lambda status: (release.wait(), received.append(('latest', status))),
+                               name='latest', policy=POLICY_COALESCE_LATEST)
+
+        bus.publish(0)
+        assert wait_for(lambda: oldest.depth == 0 and latest.depth == 0)
+
+        started = time.monotonic()
+        for i in range(1, 11):
+            bus.publish(i)
+        assert time.monotonic() - started < 0.1
+
+        metrics = bus.metrics()
+        assert metrics['oldest']['depth'] == 3 and metrics['oldest']['dropped'] == 7
+        assert metrics['latest']['depth'] == 1 and metrics['latest']['dropped'] == 9
+
+        release.set()
+        assert wait_for(lambda: len(received) == 6)
+        assert [status for status in received if not isinstance(status, tuple)] == [0, 8, 9, 10]
+        assert ('latest', 10) in received
+        assert bus.metrics()['oldest']['max_lag_ms'] > 0
+        bus.close()
+
+    def test_block_policy(self):
+        """测试block策略下发布者等待，超时后丢弃"""
+        bus = StatusBus()
+        release = threading.Event()
+        subscription = bus.subscribe(lambda status: release.wait(), name='block',
+                                     maxsize=1, policy=POLICY_BLOCK, block_timeout=0.05)
+
+        bus.publish(0)
+        assert wait_for(lambda: subscription.depth == 0)
+        bus.publish(1)
+
+        started = time.monotonic()
+        bus.publish(2)
+        assert time.monotonic() - started >= 0.05
+        assert subscription.metrics()['dropped'] == 1
+
+        release.set()
+        bus.close()
+
+    def test_unsubscribe_drain(self):
+        """测试排空取消订阅时已排队的状态全部分发"""
+        bus = StatusBus()
+        release = threading.Event()
+        received = []
+
+        def slow(status):
+            release.wait()
+            received.append(status)
+
+        subscription = bus.subscribe(slow, name='slow', maxsize=16)
+        for i in range(5):
+            bus.publish(i)
+        release.set()
+        bus.unsubscribe(subscription, drain=True)
+
+        assert received == [0, 1, 2, 3, 4]
+        bus.publish(5)
+        assert received == [0, 1, 2, 3, 4]
+        bus.close()
@@ -0,0 +1,82 @@
+"""
+状态记录测试模块
+"""
+import copy
+import pickle
+import pytest
+from core.status_records import IOStatus, ControllerStatus
+from commands.status import StatusCommands
+from utils.recorder import flatten_status
+from utils.telemetry_store import pack_signals, DEFAULT_SIGNALS
+
+
+class TestStatusRecords:
+    """状态记录测试类"""
+
+    def test_io_status_dict_access(self):
+        """测试I/O状态保持字典用法，读取失败视为False"""
+        status = IOStatus.from_values({'ST1': True, 'LS1': 1, 'ALM': None})
+        assert status['ST1'] is True
+        assert status.LS1 is True
+        assert status['ALM'] is False
+        assert status.get('RES') is False
+        assert status.get('XXX') is None
+        assert list(status) == StatusCommands.IO_SIGNALS
+        assert status == {signal: signal in ('ST1', 'LS1') for signal in StatusCommands.IO_SIGNALS}
+        with pytest.raises(KeyError):
+            status['XXX']
+
+    def test_io_status_bit_order(self):
+        """测试位序与列存信号位序一致"""
+        assert list(IOStatus.SIGNALS) == DEFAULT_SIGNALS
+        values = {'ST0': True, 'PE1': True, 'RES': True}
+        assert IOStatus.from_values(values).word == pack_signals(values, DEFAULT_SIGNALS)
+
+    def test_equality_and_hash(self):
+        """测试相等比较只比较位域，可用作集合元素"""
+        first = IOStatus.from_values({'LS0': True})
+        second = IOStatus.from_values({'LS0': True, 'ALM': None})
+        assert first == second
+        assert hash(first) == hash(second)
+        assert first != IOStatus.from_values({'LS1': True})
+        assert len({first, second}) == 1
+
+    def test_immutable(self):
+        """测试记录不可修改，也不能添加属性"""
+        status = IOStatus(0)
+        with pytest.raises(AttributeError):
+            status.word = 1
+        with pytest.raises(AttributeError):
+            status.ALM = True
+        with pytest.raises(TypeError):
+            status['ALM'] = True
+        assert not hasattr(status, '__dict__')
+
+    def test_controller_status(self):
+        """测试电缸状态的位置和可缺省的限位信号"""
+        status = ControllerStatus.from_values(connected=True, position=123.5, alarm=False,
+                                              home_complete=True, ls0=None, ls1=True)
+        assert status['position'] == 123.5
+        assert status.connected is True
+        assert status['alarm'] is False
+        assert status['ls0'] is None
+        assert status['ls1'] is True
+        assert status.to_dict() == {'connected': True, 'position': 123.5, 'alarm': False,
+                                    'home_complete': True, 'ls0': None, 'ls1': True}
+
+        moved = ControllerStatus(status.word, 124.0)
+        assert moved != status
+        assert ControllerStatus(status.word, 123.5) == status
+
+    def test_copy_and_pickle(self):
+        """测试复制和序列化"""
+        status = ControllerStatus.from_values(True, 10.0, True, False, True, False)
+        assert pickle.loads(pickle.dumps(status)) == status
+        assert copy.copy(status) == status
+        assert copy.deepcopy(status) == status
+
+    def test_flatten(self):
+        """测试嵌套在状态字典中的记录可被展开"""
+        flat = flatten_status({'signals': IOStatus.from_values({'ALM': True})})
+        assert flat['signals.ALM'] is True
+        assert flat['signals.ST0'] is False
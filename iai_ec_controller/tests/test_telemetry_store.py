@@ -0,0 +1,91 @@
+"""
+列存遥测测试模块
+"""
+import numpy as np
+import pytest
+from utils.telemetry_store import TelemetryStore, TelemetryStoreWriter, column_path
+
+
+def write_rows(directory, count: int, chunk_rows: int = 64) -> TelemetryStoreWriter:
+    """写入测试数据：每0.01秒一行，位置为行号"""
+    writer = TelemetryStoreWriter(str(directory), chunk_rows=chunk_rows)
+    for i in range(count):
+        writer.append(1000.0 + i * 0.01, float(i), {'ALM': i % 10 == 0, 'PE0': True},
+                      'A12' if i % 10 == 0 else None)
+    return writer
+
+
+class TestTelemetryStore:
+    """列存遥测测试类"""
+
+    def test_range_returns_views(self, tmp_path):
+        """测试时间范围查询返回内存映射的视图"""
+        write_rows(tmp_path, 1000).close()
+
+        store = TelemetryStore(str(tmp_path))
+        assert len(store) == 1000
+
+        data = store.range(1001.0, 1002.0)
+        assert len(data['position']) == 100
+        assert data['position'][0] == 100.0
+        assert np.shares_memory(data['position'], store.column('position'))
+        assert data['alarm_code'][0] == b'A12'
+        assert store.signal('ALM', 1001.0, 1002.0).sum() == 10
+        assert store.signal('PE0').all()
+
+    def test_downsample(self, tmp_path):
+        """测试最小/最大值降采样"""
+        write_rows(tmp_path, 1000).close()
+        store = TelemetryStore(str(tmp_path))
+
+        result = store.downsample('position', 10)
+        assert len(result['min']) == 10
+        assert result['min'][0] == 0.0 and result['max'][0] == 99.0
+        assert result['max'][-1] == 999.0
+
+        # 数据少于分段数时返回原始值
+        result = store.downsample('position', 50, 1000.0, 1000.1)
+        assert len(result['min']) == 10
+
+    def test_append_and_refresh(self, tmp_path):
+        """测试写入端追加后读取端刷新，未刷新的缓冲不可见"""
+        writer = write_rows(tmp_path, 100, chunk_rows=64)
+        store = TelemetryStore(str(tmp_path))
+        assert len(store) == 64
+
+        writer.flush()
+        store.refresh()
+        assert len(store) == 100
+
+        with pytest.raises(ValueError):
+            writer.append(999.0, 0.0, 0)
+        writer.close()
+
+    def test_reopen_truncates_partial_row(self, tmp_path):
+        """测试中断后重新打开时截掉不完整的行并继续追加"""
+        write_rows(tmp_path, 10).close()
+        with open(column_path(str(tmp_path), 'timestamp'), 'ab') as f:
+            f.write(b'\x00' * 3)
+
+        writer = TelemetryStoreWriter(str(tmp_path))
+        assert writer.rows == 10
+        writer.record({'timestamp': 2000.0, 'position': {'current': None},
+                       'signals': {'ST0': True}, 'alarm': {'code': ''}})
+        writer.close()
+
+        store = TelemetryStore(str(tmp_path))
+        assert len(store) == 11
+        assert np.isnan(store.column('position')[-1])
+        assert store.column('signals')[-1] == 1
+
+    def test_numeric_alarm_code(self, tmp_path):
+        """测试控制器返回整数报警代码时按文本保存"""
+        writer = TelemetryStoreWriter(str(tmp_path))
+        writer.record({'timestamp': 1000.0, 'position': {'current': 1.0},
+                       'signals': {}, 'alarm': {'code': 1234}})
+        writer.record({'timestamp': 1000.1, 'position': {'current': 1.0},
+                       'signals': {}, 'alarm': {'code': 0}})
+        writer.close()
+
+        store = TelemetryStore(str(tmp_path))
+        assert list(store.column('alarm_code')) == [b'1234', b'']
@@ -4,5 +4,13 @@
 from .logger import get_logger
 from .converter import Converter
 from .validator import Validator
+from .periodic import PeriodicScheduler
+from .status_bus import StatusBus
+from .recorder import TelemetryRecorder
+from .telemetry_store import TelemetryStore, TelemetryStoreWriter
+from .historian import Historian
+from .clock import RealClock, VirtualClock
 
-__all__ = ['get_logger', 'Converter', 'Validator']
\ No newline at end of file
+__all__ = ['get_logger', 'Converter', 'Validator', 'PeriodicScheduler', 'StatusBus',
+           'TelemetryRecorder', 'TelemetryStore', 'TelemetryStoreWriter',
+           'Historian', 'RealClock', 'VirtualClock']
\ No newline at end of file
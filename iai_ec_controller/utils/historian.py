@@ -0,0 +1,332 @@
+"""
+历史数据库
+状态数值写入本地SQLite（WAL模式），后台线程批量提交，按时间桶预聚合
+与 rec_controller/utils/historian.py 相同（仅日志库不同；flatten_status 取自 utils.recorder），修改时两边同步
+"""
+import math
+import sqlite3
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from loguru import logger
+
+from utils.recorder import flatten_status
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS series (
+    id INTEGER PRIMARY KEY,
+    name TEXT UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS samples (
+    series_id INTEGER NOT NULL,
+    ts REAL NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS samples_series_ts ON samples (series_id, ts);
+CREATE TABLE IF NOT EXISTS rollups (
+    series_id INTEGER NOT NULL,
+    width INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    v_min REAL NOT NULL,
+    v_max REAL NOT NULL,
+    v_sum REAL NOT NULL,
+    PRIMARY KEY (series_id, width, bucket)
+) WITHOUT ROWID;
+"""
+
+UPSERT_ROLLUP = """
+INSERT INTO rollups (series_id, width, bucket, count, v_min, v_max, v_sum)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (series_id, width, bucket) DO UPDATE SET
+    count = count + excluded.count,
+    v_min = min(v_min, excluded.v_min),
+    v_max = max(v_max, excluded.v_max),
+    v_sum = v_sum + excluded.v_sum
+"""
+
+
+def numeric_values(status: Dict[str, Any], source: str = '') -> Dict[str, float]:
+    """
+    取出状态中的数值（布尔记为0/1，文本和空值忽略）
+
+    Args:
+        status: 状态字典，可嵌套
+        source: 数据来源，作为序列名前缀（如 'unit0_axis1'）
+
+    Returns:
+        Dict[str, float]: {序列名: 值}
+    """
+    prefix = f"{source}." if source else ''
+    values = {}
+    for key, value in flatten_status(status).items():
+        if isinstance(value, (bool, int, float)) and not (isinstance(value, float) and math.isnan(value)):
+            values[prefix + key] = float(value)
+    return values
+
+
+class Historian:
+    """历史数据库
+
+    record() 只把样本放入有界队列；写线程每批在一个事务中插入原始样本，
+    同时更新各时间桶宽度的预聚合（数量/最小/最大/总和）。
+    查询按桶返回 min/max/avg，桶宽是预聚合宽度的整数倍时只读预聚合表，
+    一周的数据也不需要扫描原始样本。
+    """
+
+    def __init__(self, path: str, bucket_widths: Sequence[int] = (60, 3600),
+                 batch_size: int = 500, flush_interval: float = 1.0,
+                 max_pending: int = 100000, raw_retention: Optional[float] = None):
+        """
+        初始化历史数据库
+
+        Args:
+            path: 数据库文件路径
+            bucket_widths: 预聚合的时间桶宽度（秒）
+            batch_size: 每个事务插入的样本数
+            flush_interval: 最长提交间隔（秒）
+            max_pending: 队列中最多等待写入的样本数
+            raw_retention: 原始样本保留时间（秒），None为一直保留，预聚合不删除
+        """
+        self.path = path
+        self.bucket_widths = sorted(int(width) for width in bucket_widths)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.raw_retention = raw_retention
+
+        self._pending = deque(maxlen=max_pending)
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self.running = False
+
+        self._connection = self._connect()
+        self._connection.executescript(SCHEMA)
+        self._query_lock = threading.Lock()
+        self._series_ids: Dict[str, int] = {}
+        self._load_series()
+        self._last_purge = 0.0
+
+        self.samples_recorded = 0
+        self.samples_written = 0
+        self.samples_dropped = 0
+        self.batches_written = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """打开连接（WAL模式，其它进程读取时不阻塞写入）"""
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def start(self):
+        """启动写线程"""
+        if self.running:
+            return
+        self.running = True
+        self._thread = threading.Thread(target=self._run, name='historian', daemon=True)
+        self._thread.start()
+        logger.info(f"历史数据库已启动: {self.path}")
+
+    def stop(self):
+        """写完队列中的样本后停止"""
+        if not self.running:
+            return
+        with self._condition:
+            self.running = False
+            self._condition.notify()
+        if self._thread:
+            self._thread.join(timeout=10)
+        self._thread = None
+        logger.info(f"历史数据库已停止: 写入{self.samples_written}个样本, 丢弃{self.samples_dropped}个")
+
+    def close(self):
+        """停止并关闭数据库"""
+        self.stop()
+        with self._query_lock:
+            self._connection.close()
+
+    def record(self, status: Dict[str, Any], source: str = '', timestamp: Optional[float] = None):
+        """
+        记录一条状态中的全部数值（不阻塞，可直接作为状态总线的订阅回调）
+
+        Args:
+            status: 状态字典
+            source: 数据来源，作为序列名前缀
+            timestamp: Unix时间（秒），默认当前时间
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        samples = [(name, timestamp, value) for name, value in numeric_values(status, source).items()]
+        with self._condition:
+            for sample in samples:
+                if len(self._pending) == self._pending.maxlen:
+                    self.samples_dropped += 1
+                self._pending.append(sample)
+            self.samples_recorded += len(samples)
+            if len(self._pending) >= self.batch_size:
+                self._condition.notify()
+
+    def flush(self):
+        """在当前线程中立即写入队列中的样本"""
+        with self._condition:
+            batch = list(self._pending)
+            self._pending.clear()
+        if batch:
+            self._write_batch(batch)
+
+    def _run(self):
+        """写线程"""
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: len(self._pending) >= self.batch_size or not self.running,
+                    timeout=self.flush_interval,
+                )
+                batch = list(self._pending)
+                self._pending.clear()
+                running = self.running
+
+            for offset in range(0, len(batch), self.batch_size):
+                chunk = batch[offset:offset + self.batch_size]
+                try:
+                    self._write_batch(chunk)
+                except sqlite3.Error as e:
+                    logger.error(f"历史数据写入失败: {e}")
+                    self.samples_dropped += len(chunk)
+                    # 事务已回滚，本批新建的序列编号作废
+                    with self._query_lock:
+                        self._load_series()
+
+            if self.raw_retention and time.monotonic() - self._last_purge > 60:
+                self._last_purge = time.monotonic()
+                self.purge(time.time() - self.raw_retention)
+            if not running:
+                break
+
+    def _load_series(self):
+        """读取序列名与编号的对应关系"""
+        self._series_ids = {name: series_id for series_id, name
+                            in self._connection.execute("SELECT id, name FROM series")}
+
+    def _series_id(self, name: str) -> int:
+        """序列编号，不存在时创建"""
+        series_id = self._series_ids.get(name)
+        if series_id is None:
+            cursor = self._connection.execute("INSERT OR IGNORE INTO series (name) VALUES (?)", (name,))
+            series_id = cursor.lastrowid if cursor.rowcount else self._connection.execute(
+                "SELECT id FROM series WHERE name = ?", (name,)).fetchone()[0]
+            self._series_ids[name] = series_id
+        return series_id
+
+    def _write_batch(self, batch: List[Tuple[str, float, float]]):
+        """一个事务写入一批样本并更新预聚合"""
+        with self._query_lock, self._connection:
+            rows = [(self._series_id(name), timestamp, value) for name, timestamp, value in batch]
+            self._connection.executemany("INSERT INTO samples (series_id, ts, value) VALUES (?, ?, ?)", rows)
+
+            # 先在内存中按桶合并，每个桶只执行一次UPSERT
+            rollups: Dict[Tuple[int, int, int], List[float]] = defaultdict(
+                lambda: [0, math.inf, -math.inf, 0.0])
+            for series_id, timestamp, value in rows:
+                for width in self.bucket_widths:
+                    rollup = rollups[(series_id, width, int(timestamp // width))]
+                    rollup[0] += 1
+                    rollup[1] = min(rollup[1], value)
+                    rollup[2] = max(rollup[2], value)
+                    rollup[3] += value
+            self._connection.executemany(
+                UPSERT_ROLLUP, [key + tuple(rollup) for key, rollup in rollups.items()]
+            )
+
+        self.samples_written += len(batch)
+        self.batches_written += 1
+
+    def purge(self, before: float) -> int:
+        """
+        删除早于指定时间的原始样本（预聚合保留）
+
+        Returns:
+            int: 删除的样本数
+        """
+        with self._query_lock, self._connection:
+            deleted = self._connection.execute("DELETE FROM samples WHERE ts < ?", (before,)).rowcount
+        if deleted:
+            logger.info(f"历史数据库清理了{deleted}个原始样本")
+        return deleted
+
+    def series(self) -> List[str]:
+        """全部序列名"""
+        with self._query_lock:
+            return [row[0] for row in self._connection.execute("SELECT name FROM series ORDER BY name")]
+
+    def raw(self, name: str, start: float, end: float) -> List[Tuple[float, float]]:
+        """
+        查询原始样本
+
+        Args:
+            name: 序列名
+            start: 起始时间（含）
+            end: 结束时间（不含）
+
+        Returns:
+            List[Tuple[float, float]]: [(时间, 值), ...]
+        """
+        series_id = self._series_ids.get(name)
+        if series_id is None:
+            return []
+        with self._query_lock:
+            return self._connection.execute(
+                "SELECT ts, value FROM samples WHERE series_id = ? AND ts >= ? AND ts < ? ORDER BY ts",
+                (series_id, start, end)).fetchall()
+
+    def query(self, name: str, start: float, end: float, bucket: float) -> List[Dict[str, float]]:
+        """
+        按时间桶查询聚合值
+
+        桶宽是某个预聚合宽度的整数倍时读预聚合表，此时首尾的桶按预聚合
+        宽度对齐，可能包含范围外的少量数据；否则从原始样本聚合。
+
+        Args:
+            name: 序列名
+            start: 起始时间（含）
+            end: 结束时间（不含）
+            bucket: 桶宽（秒）
+
+        Returns:
+            List[Dict[str, float]]: [{'time': 桶起始时间, 'count', 'min', 'max', 'avg'}, ...]
+        """
+        series_id = self._series_ids.get(name)
+        if series_id is None:
+            return []
+
+        width = next((width for width in reversed(self.bucket_widths)
+                      if bucket >= width and bucket % width == 0), None)
+        with self._query_lock:
+            if width is not None:
+                ratio = int(bucket // width)
+                rows = self._connection.execute(
+                    "SELECT bucket / ? AS slot, SUM(count), MIN(v_min), MAX(v_max), SUM(v_sum) / SUM(count) "
+                    "FROM rollups WHERE series_id = ? AND width = ? AND bucket >= ? AND bucket < ? "
+                    "GROUP BY slot ORDER BY slot",
+                    (ratio, series_id, width, math.floor(start / width), math.ceil(end / width))).fetchall()
+            else:
+                rows = self._connection.execute(
+                    "SELECT CAST(ts / ? AS INTEGER) AS slot, COUNT(*), MIN(value), MAX(value), AVG(value) "
+                    "FROM samples WHERE series_id = ? AND ts >= ? AND ts < ? "
+                    "GROUP BY slot ORDER BY slot",
+                    (bucket, series_id, start, end)).fetchall()
+
+        return [{'time': slot * bucket, 'count': count, 'min': v_min, 'max': v_max, 'avg': avg}
+                for slot, count, v_min, v_max, avg in rows]
+
+    def statistics(self) -> Dict[str, Any]:
+        """写入统计"""
+        with self._condition:
+            pending = len(self._pending)
+        return {
+            'samples_recorded': self.samples_recorded,
+            'samples_written': self.samples_written,
+            'samples_dropped': self.samples_dropped,
+            'batches_written': self.batches_written,
+            'pending': pending,
+        }
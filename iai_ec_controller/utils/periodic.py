@@ -0,0 +1,185 @@
+"""
+周期任务调度
+按单调时钟截止时间固定频率执行任务，统计抖动和超时
+与 rec_controller/utils/periodic.py 相同（仅日志库不同），修改时两边同步
+"""
+import math
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional, Sequence
+from loguru import logger
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """
+    计算百分位数（最近秩法）
+
+    Args:
+        values: 数据
+        fraction: 百分位（0~1）
+
+    Returns:
+        float: 百分位数，没有数据返回0
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+class PeriodicScheduler:
+    """固定频率周期调度器
+
+    截止时间按周期累加（deadline += period），不受任务执行时间影响，
+    长时间运行也不会漂移。任务执行超过一个周期时记为超时，
+    并跳过已经错过的周期，保持在原有的时间网格上，不集中补执行。
+
+    每次启动使用独立的停止事件，stop() 不等待线程退出时（wait=False）
+    也可以立即再次 start()：旧线程只看自己的事件，执行完当前周期即退出，
+    任务由锁串行执行，新旧线程不会同时执行任务。
+    """
+
+    def __init__(self, period: float, task: Callable[[], None],
+                 name: str = 'periodic', history: int = 1000):
+        """
+        初始化周期调度器
+
+        Args:
+            period: 周期（秒）
+            task: 每个周期执行的函数
+            name: 线程名称
+            history: 统计保留的最近周期数
+        """
+        if period <= 0:
+            raise ValueError("周期必须大于0")
+
+        self.period = period
+        self.task = task
+        self.name = name
+        self.running = False
+        self.thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._task_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._cycle_times = deque(maxlen=history)
+        self._jitters = deque(maxlen=history)
+        self.reset_statistics()
+
+    def start(self):
+        """启动调度线程"""
+        if self.running:
+            return
+
+        self.running = True
+        self._stop_event = threading.Event()
+        self.reset_statistics()
+        self.thread = threading.Thread(target=self._run, args=(self._stop_event,),
+                                       name=self.name, daemon=True)
+        self.thread.start()
+
+    def stop(self, timeout: float = 2.0, wait: bool = True):
+        """
+        停止调度线程
+
+        Args:
+            timeout: 等待线程退出的时间（秒）
+            wait: 为False时只发出停止信号立即返回（用于GUI线程等不能阻塞的调用方）
+        """
+        if not self.running:
+            return
+
+        self.running = False
+        self._stop_event.set()
+        if wait and self.thread and self.thread is not threading.current_thread():
+            self.thread.join(timeout=timeout)
+            if self.thread.is_alive():
+                logger.warning(f"{self.name} 线程未在{timeout}秒内退出")
+        self.thread = None
+
+    def _run(self, stop_event: threading.Event):
+        """调度循环，stop_event 为本次启动的停止事件"""
+        deadline = time.monotonic()
+        while not stop_event.is_set():
+            scheduled = deadline
+            started = time.monotonic()
+            try:
+                with self._task_lock:
+                    if stop_event.is_set():
+                        break
+                    self.task()
+            except Exception as e:
+                logger.error(f"{self.name} 周期任务出错: {e}")
+            finished = time.monotonic()
+
+            deadline += self.period
+            skipped = 0
+            if finished > deadline:
+                # 超时：跳过已错过的周期，下一次在时间网格上的下一个截止时间执行
+                skipped = int((finished - deadline) // self.period) + 1
+                deadline += skipped * self.period
+
+            self._record(started, finished, scheduled, skipped)
+
+            if stop_event.wait(max(0.0, deadline - time.monotonic())):
+                break
+
+    def _record(self, started: float, finished: float, scheduled: float, skipped: int):
+        """记录一个周期的统计"""
+        with self._stats_lock:
+            self._cycles += 1
+            self._cycle_times.append(finished - started)
+            self._jitters.append(started - scheduled)
+            if skipped:
+                self._overruns += 1
+                self._skipped += skipped
+
+    def reset_statistics(self):
+        """清零统计"""
+        with self._stats_lock:
+            self._stats_start = time.monotonic()
+            self._cycles = 0
+            self._overruns = 0
+            self._skipped = 0
+            self._cycle_times.clear()
+            self._jitters.clear()
+
+    def statistics(self) -> Dict[str, float]:
+        """
+        运行统计
+
+        Returns:
+            cycles: 已执行周期数
+            target_hz: 目标频率
+            achieved_hz: 实际频率
+            cycle_p50_ms / cycle_p99_ms / cycle_max_ms: 任务执行时间
+            jitter_p50_ms / jitter_p99_ms / jitter_max_ms: 实际开始时间相对截止时间的延迟
+            overruns: 超时周期数
+            skipped: 跳过的周期数
+        """
+        with self._stats_lock:
+            elapsed = max(time.monotonic() - self._stats_start, 1e-9)
+            cycle_times = list(self._cycle_times)
+            jitters = list(self._jitters)
+            return {
+                'cycles': self._cycles,
+                'target_hz': 1.0 / self.period,
+                'achieved_hz': self._cycles / elapsed,
+                'cycle_p50_ms': percentile(cycle_times, 0.50) * 1000,
+                'cycle_p99_ms': percentile(cycle_times, 0.99) * 1000,
+                'cycle_max_ms': max(cycle_times, default=0.0) * 1000,
+                'jitter_p50_ms': percentile(jitters, 0.50) * 1000,
+                'jitter_p99_ms': percentile(jitters, 0.99) * 1000,
+                'jitter_max_ms': max(jitters, default=0.0) * 1000,
+                'overruns': self._overruns,
+                'skipped': self._skipped,
+            }
+
+    def report(self) -> str:
+        """统计摘要文本"""
+        stats = self.statistics()
+        return (f"{self.name}: {stats['achieved_hz']:.1f}/{stats['target_hz']:.1f}Hz, "
+                f"周期耗时p50 {stats['cycle_p50_ms']:.2f}ms p99 {stats['cycle_p99_ms']:.2f}ms, "
+                f"抖动p99 {stats['jitter_p99_ms']:.2f}ms, "
+                f"超时{stats['overruns']}次, 跳过{stats['skipped']}个周期")
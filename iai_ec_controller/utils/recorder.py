@@ -0,0 +1,380 @@
+"""
+遥测数据记录
+后台线程批量追加写入状态数据，支持CSV和二进制列存格式，按大小/时间轮换文件
+"""
+import csv
+import math
+import os
+import struct
+import threading
+import time
+from array import array
+from collections import deque
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+from loguru import logger
+
+FORMAT_CSV = 'csv'
+FORMAT_BINARY = 'binary'
+
+# 二进制列存格式
+FILE_MAGIC = b'TLM1'
+BLOCK_MAGIC = b'BLK1'
+BLOCK_HEADER = struct.Struct('<4sII')  # 块标记, 行数, 列数
+
+# 列类型
+COLUMN_FLOAT = b'd'   # 数值，缺失为NaN
+COLUMN_BOOL = b'b'    # 布尔，缺失为-1
+COLUMN_TEXT = b's'    # 文本，UTF-8，长度前缀
+
+
+def flatten_status(status: Mapping, prefix: str = '') -> Dict[str, Any]:
+    """
+    展开嵌套的状态字典
+
+    Args:
+        status: 状态字典
+        prefix: 键前缀
+
+    Returns:
+        Dict[str, Any]: {'position.current': 12.3, ...}
+    """
+    flat = {}
+    for key, value in status.items():
+        if isinstance(value, Mapping):
+            flat.update(flatten_status(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def column_type(value: Any) -> bytes:
+    """根据值确定列类型（没有值时按数值列处理）"""
+    if value is None:
+        return COLUMN_FLOAT
+    if isinstance(value, bool):
+        return COLUMN_BOOL
+    if isinstance(value, (int, float)):
+        return COLUMN_FLOAT
+    return COLUMN_TEXT
+
+
+def infer_column_type(values: List[Any], default: bytes = COLUMN_FLOAT) -> bytes:
+    """
+    按一列的全部值确定列类型
+
+    有文本即为文本列（数值也按文本保存，不丢失），全部为布尔时为布尔列，
+    其余为数值列；全部为空时沿用default。
+    """
+    kinds = {column_type(value) for value in values if value is not None}
+    if not kinds:
+        return default
+    if COLUMN_TEXT in kinds:
+        return COLUMN_TEXT
+    if kinds == {COLUMN_BOOL}:
+        return COLUMN_BOOL
+    return COLUMN_FLOAT
+
+
+def encode_column(values: List[Any], kind: bytes) -> bytes:
+    """编码一列数据"""
+    if kind == COLUMN_FLOAT:
+        return array('d', (float('nan') if not isinstance(v, (int, float)) else float(v)
+                           for v in values)).tobytes()
+    if kind == COLUMN_BOOL:
+        return array('b', (-1 if v is None else int(bool(v)) for v in values)).tobytes()
+
+    encoded = [b'' if v is None else str(v).encode('utf-8') for v in values]
+    lengths = array('I', (len(e) for e in encoded))
+    return lengths.tobytes() + b''.join(encoded)
+
+
+def decode_column(payload: bytes, kind: bytes, rows: int) -> List[Any]:
+    """解码一列数据"""
+    if kind == COLUMN_FLOAT:
+        values = array('d')
+        values.frombytes(payload)
+        return [None if math.isnan(v) else v for v in values]
+    if kind == COLUMN_BOOL:
+        values = array('b')
+        values.frombytes(payload)
+        return [None if v < 0 else bool(v) for v in values]
+
+    lengths = array('I')
+    lengths.frombytes(payload[:rows * 4])
+    values = []
+    offset = rows * 4
+    for length in lengths:
+        values.append(payload[offset:offset + length].decode('utf-8'))
+        offset += length
+    return values
+
+
+def iter_binary_blocks(path: str) -> Iterator[Dict[str, List[Any]]]:
+    """
+    逐块读取二进制列存文件
+
+    Args:
+        path: 文件路径
+
+    Yields:
+        {列名: 值列表}
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(FILE_MAGIC)) != FILE_MAGIC:
+            raise ValueError(f"不是遥测记录文件: {path}")
+
+        while True:
+            header = f.read(BLOCK_HEADER.size)
+            if len(header) < BLOCK_HEADER.size:
+                return
+            magic, rows, column_count = BLOCK_HEADER.unpack(header)
+            if magic != BLOCK_MAGIC:
+                raise ValueError(f"文件损坏: {path}")
+
+            block = {}
+            for _ in range(column_count):
+                name_length = struct.unpack('<H', f.read(2))[0]
+                name = f.read(name_length).decode('utf-8')
+                kind = f.read(1)
+                payload_length = struct.unpack('<I', f.read(4))[0]
+                block[name] = decode_column(f.read(payload_length), kind, rows)
+            yield block
+
+
+def read_binary(path: str) -> Dict[str, List[Any]]:
+    """
+    读取整个二进制列存文件
+
+    Returns:
+        Dict[str, List[Any]]: {列名: 值列表}
+    """
+    columns: Dict[str, List[Any]] = {}
+    rows = 0
+    for block in iter_binary_blocks(path):
+        block_rows = len(next(iter(block.values()), []))
+        for name in block:
+            if name not in columns:
+                columns[name] = [None] * rows
+        for name, values in columns.items():
+            values.extend(block.get(name, [None] * block_rows))
+        rows += block_rows
+    return columns
+
+
+class TelemetryRecorder:
+    """遥测记录器
+
+    record() 只把状态放入有界队列，立即返回；后台写线程攒够一批
+    或到达刷新间隔后一次写入文件。队列满时丢弃最旧的记录，内存占用有上限。
+
+    列为所有出现过的键。二进制格式每块自带列名和列类型，新列和类型变化
+    直接写入下一块；CSV表头在打开文件时写出，出现新列时轮换到新文件。
+    """
+
+    def __init__(self, directory: str, prefix: str = 'status', fmt: str = FORMAT_CSV,
+                 batch_size: int = 200, flush_interval: float = 1.0,
+                 max_bytes: int = 64 * 1024 * 1024, max_seconds: float = 3600.0,
+                 max_pending: int = 100000):
+        """
+        初始化记录器
+
+        Args:
+            directory: 记录目录
+            prefix: 文件名前缀
+            fmt: 文件格式，'csv' 或 'binary'
+            batch_size: 每批写入的行数
+            flush_interval: 最长刷新间隔（秒）
+            max_bytes: 单个文件最大字节数，超过后轮换
+            max_seconds: 单个文件最长记录时间（秒），超过后轮换
+            max_pending: 队列中最多等待写入的行数
+        """
+        if fmt not in (FORMAT_CSV, FORMAT_BINARY):
+            raise ValueError(f"未知的记录格式: {fmt}")
+
+        self.directory = directory
+        self.prefix = prefix
+        self.fmt = fmt
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+
+        self._pending = deque(maxlen=max_pending)
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self.running = False
+
+        self._file = None
+        self._csv_writer = None
+        self._columns: Optional[List[str]] = None
+        self._column_types: Dict[str, bytes] = {}
+        self._file_opened = 0.0
+        self._file_index = 0
+        self.files: List[str] = []
+
+        self.rows_recorded = 0
+        self.rows_written = 0
+        self.rows_dropped = 0
+        self.batches_written = 0
+
+    def start(self):
+        """启动后台写线程"""
+        if self.running:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        self.running = True
+        self._thread = threading.Thread(target=self._run, name='telemetry-recorder', daemon=True)
+        self._thread.start()
+        logger.info(f"遥测记录已启动: {self.directory} ({self.fmt})")
+
+    def stop(self):
+        """写完队列中的数据后停止"""
+        if not self.running:
+            return
+        with self._condition:
+            self.running = False
+            self._condition.notify()
+        if self._thread:
+            self._thread.join(timeout=10)
+        self._thread = None
+        logger.info(f"遥测记录已停止: 写入{self.rows_written}行, 丢弃{self.rows_dropped}行, "
+                    f"{len(self.files)}个文件")
+
+    def record(self, status: Dict[str, Any]):
+        """
+        记录一条状态（不阻塞，可直接作为状态总线的订阅回调）
+
+        Args:
+            status: 状态字典，嵌套字典展开为 'a.b' 形式的列
+        """
+        row = flatten_status(status)
+        row['time'] = time.time()
+        with self._condition:
+            if len(self._pending) == self._pending.maxlen:
+                self.rows_dropped += 1
+            self._pending.append(row)
+            self.rows_recorded += 1
+            if len(self._pending) >= self.batch_size:
+                self._condition.notify()
+
+    def statistics(self) -> Dict[str, Any]:
+        """记录统计"""
+        with self._condition:
+            pending = len(self._pending)
+        return {
+            'rows_recorded': self.rows_recorded,
+            'rows_written': self.rows_written,
+            'rows_dropped': self.rows_dropped,
+            'batches_written': self.batches_written,
+            'pending': pending,
+            'files': list(self.files),
+        }
+
+    def _run(self):
+        """写线程"""
+        try:
+            while True:
+                with self._condition:
+                    self._condition.wait_for(
+                        lambda: len(self._pending) >= self.batch_size or not self.running,
+                        timeout=self.flush_interval,
+                    )
+                    batch = list(self._pending)
+                    self._pending.clear()
+                    running = self.running
+
+                # 按batch_size分块写入，轮换检查的粒度不超过一批
+                for offset in range(0, len(batch), self.batch_size):
+                    chunk = batch[offset:offset + self.batch_size]
+                    try:
+                        self._write_batch(chunk)
+                    except OSError as e:
+                        logger.error(f"遥测记录写入失败: {e}")
+                        self.rows_dropped += len(chunk)
+                if not running:
+                    break
+        finally:
+            self._close_file()
+
+    def _write_batch(self, batch: List[Dict[str, Any]]):
+        """写入一批数据，必要时轮换文件"""
+        columns = self._merge_columns(batch)
+        if self._file is None or self._should_rotate():
+            self._open_file(columns)
+        elif self.fmt == FORMAT_CSV and len(columns) > len(self._columns):
+            logger.info(f"遥测记录出现新列 {columns[len(self._columns):]}，轮换文件")
+            self._open_file(columns)
+        else:
+            self._columns = columns
+
+        if self.fmt == FORMAT_CSV:
+            self._csv_writer.writerows([[row.get(column, '') for column in self._columns]
+                                        for row in batch])
+        else:
+            self._file.write(self._encode_block(batch))
+        self._file.flush()
+
+        self.rows_written += len(batch)
+        self.batches_written += 1
+
+    def _merge_columns(self, batch: List[Dict[str, Any]]) -> List[str]:
+        """已有的列加上这批数据中新出现的列（保持出现顺序）"""
+        columns = list(self._columns or ['time'])
+        known = set(columns)
+        for row in batch:
+            for column in row:
+                if column not in known:
+                    known.add(column)
+                    columns.append(column)
+        return columns
+
+    def _encode_block(self, batch: List[Dict[str, Any]]) -> bytes:
+        """编码一个二进制数据块，列类型按本块的值确定，本块全为空时沿用上一块的类型"""
+        parts = [BLOCK_HEADER.pack(BLOCK_MAGIC, len(batch), len(self._columns))]
+        for column in self._columns:
+            values = [row.get(column) for row in batch]
+            kind = infer_column_type(values, self._column_types.get(column, COLUMN_FLOAT))
+            self._column_types[column] = kind
+            payload = encode_column(values, kind)
+            name = column.encode('utf-8')
+            parts.append(struct.pack('<H', len(name)) + name + kind
+                         + struct.pack('<I', len(payload)) + payload)
+        return b''.join(parts)
+
+    def _should_rotate(self) -> bool:
+        """是否需要轮换文件"""
+        if self._file.tell() >= self.max_bytes:
+            return True
+        return time.monotonic() - self._file_opened >= self.max_seconds
+
+    def _open_file(self, columns: List[str]):
+        """打开新文件"""
+        self._close_file()
+
+        self._file_index += 1
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        extension = 'csv' if self.fmt == FORMAT_CSV else 'tlm'
+        path = os.path.join(self.directory, f"{self.prefix}_{timestamp}_{self._file_index:03d}.{extension}")
+
+        self._columns = columns
+
+        if self.fmt == FORMAT_CSV:
+            self._file = open(path, 'w', newline='', encoding='utf-8')
+            self._csv_writer = csv.writer(self._file)
+            self._csv_writer.writerow(self._columns)
+        else:
+            self._file = open(path, 'wb')
+            self._file.write(FILE_MAGIC)
+
+        self._file_opened = time.monotonic()
+        self.files.append(path)
+        logger.info(f"遥测记录文件: {path}")
+
+    def _close_file(self):
+        """关闭当前文件"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._csv_writer = None
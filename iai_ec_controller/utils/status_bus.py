@@ -0,0 +1,232 @@
+"""
+状态总线
+发布/订阅方式分发状态，每个订阅者有独立的有界队列和分发线程
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+from loguru import logger
+
+# 队列满时的处理策略
+POLICY_DROP_OLDEST = 'drop_oldest'          # 丢弃最旧的一条
+POLICY_COALESCE_LATEST = 'coalesce_latest'  # 只保留最新的一条
+POLICY_BLOCK = 'block'                      # 发布者等待队列空出
+
+
+class Subscription:
+    """订阅者
+
+    状态在发布线程中放入队列，由订阅者自己的分发线程调用回调，
+    回调再慢也不会拖慢发布（采集）线程。
+    """
+
+    def __init__(self, callback: Callable[[Any], None], name: str,
+                 maxsize: int = 16, policy: str = POLICY_DROP_OLDEST,
+                 block_timeout: Optional[float] = None):
+        """
+        初始化订阅者
+
+        Args:
+            callback: 回调函数，参数为状态
+            name: 订阅者名称
+            maxsize: 队列长度
+            policy: 队列满时的处理策略
+            block_timeout: block策略下发布者最长等待时间（秒），None为一直等待
+        """
+        if policy not in (POLICY_DROP_OLDEST, POLICY_COALESCE_LATEST, POLICY_BLOCK):
+            raise ValueError(f"未知的队列策略: {policy}")
+        if maxsize < 1:
+            raise ValueError("队列长度必须大于0")
+
+        self.callback = callback
+        self.name = name
+        self.policy = policy
+        self.maxsize = 1 if policy == POLICY_COALESCE_LATEST else maxsize
+        self.block_timeout = block_timeout
+
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self._total_lag = 0.0
+
+        self.thread = threading.Thread(target=self._run, name=f"bus-{name}", daemon=True)
+        self.thread.start()
+
+    def put(self, item: Any):
+        """放入一条状态（在发布线程中调用）"""
+        entry = (time.monotonic(), item)
+        with self._condition:
+            if self._closed:
+                return
+            self.published += 1
+
+            if len(self._queue) >= self.maxsize:
+                if self.policy == POLICY_BLOCK:
+                    if not self._condition.wait_for(
+                            lambda: len(self._queue) < self.maxsize or self._closed,
+                            timeout=self.block_timeout):
+                        # 等待超时，丢弃这一条
+                        self.dropped += 1
+                        return
+                    if self._closed:
+                        return
+                else:
+                    self._queue.popleft()
+                    self.dropped += 1
+
+            self._queue.append(entry)
+            self.max_depth = max(self.max_depth, len(self._queue))
+            self._condition.notify_all()
+
+    def close(self, timeout: float = 2.0, drain: bool = False):
+        """
+        停止分发
+
+        Args:
+            timeout: 等待分发线程退出的时间（秒）
+            drain: 为True时先分发完队列中的状态，否则丢弃
+        """
+        with self._condition:
+            self._closed = True
+            if not drain:
+                self._queue.clear()
+            self._condition.notify_all()
+        if self.thread is not threading.current_thread():
+            self.thread.join(timeout=timeout)
+
+    @property
+    def depth(self) -> int:
+        """当前排队数"""
+        return len(self._queue)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        订阅者统计
+
+        Returns:
+            policy: 队列策略
+            published / delivered / dropped / errors: 发布、分发、丢弃、回调出错次数
+            depth / max_depth: 当前和最大排队数
+            last_lag_ms / avg_lag_ms / max_lag_ms: 从发布到回调开始的延迟
+        """
+        with self._condition:
+            return {
+                'policy': self.policy,
+                'published': self.published,
+                'delivered': self.delivered,
+                'dropped': self.dropped,
+                'errors': self.errors,
+                'depth': len(self._queue),
+                'max_depth': self.max_depth,
+                'last_lag_ms': self.last_lag * 1000,
+                'avg_lag_ms': self._total_lag / self.delivered * 1000 if self.delivered else 0.0,
+                'max_lag_ms': self.max_lag * 1000,
+            }
+
+    def _run(self):
+        """分发线程"""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    # 已关闭且队列已空（不排空时关闭会先清空队列）
+                    return
+                published_at, item = self._queue.popleft()
+                # 唤醒等待队列空出的发布者
+                self._condition.notify_all()
+
+            lag = time.monotonic() - published_at
+            failed = False
+            try:
+                self.callback(item)
+            except Exception as e:
+                failed = True
+                logger.error(f"订阅者 {self.name} 回调出错: {e}")
+
+            with self._condition:
+                self.delivered += 1
+                self.errors += failed
+                self.last_lag = lag
+                self.max_lag = max(self.max_lag, lag)
+                self._total_lag += lag
+
+
+class StatusBus:
+    """状态总线"""
+
+    def __init__(self):
+        self._subscriptions: List[Subscription] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[Any], None], name: Optional[str] = None,
+                  maxsize: int = 16, policy: str = POLICY_DROP_OLDEST,
+                  block_timeout: Optional[float] = None) -> Subscription:
+        """
+        订阅状态
+
+        Args:
+            callback: 回调函数，在订阅者自己的线程中调用
+            name: 订阅者名称，默认取回调函数名
+            maxsize: 队列长度
+            policy: 队列满时的处理策略（drop_oldest/coalesce_latest/block）
+            block_timeout: block策略下发布者最长等待时间（秒）
+
+        Returns:
+            Subscription: 订阅者，用于取消订阅和查看统计
+        """
+        name = name or getattr(callback, '__name__', 'subscriber')
+        subscription = Subscription(callback, name, maxsize, policy, block_timeout)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription, drain: bool = False,
+                    timeout: float = 2.0):
+        """
+        取消订阅
+
+        Args:
+            subscription: 订阅者
+            drain: 为True时先把已排队的状态分发完
+            timeout: 等待分发线程退出的时间（秒）
+        """
+        with self._lock:
+            if subscription not in self._subscriptions:
+                return
+            self._subscriptions.remove(subscription)
+        subscription.close(timeout=timeout, drain=drain)
+
+    def publish(self, status: Any):
+        """发布状态给所有订阅者"""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.put(status)
+
+    def close(self):
+        """取消所有订阅"""
+        with self._lock:
+            subscriptions = self._subscriptions
+            self._subscriptions = []
+        for subscription in subscriptions:
+            subscription.close()
+
+    @property
+    def subscriber_count(self) -> int:
+        """订阅者数量"""
+        return len(self._subscriptions)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """各订阅者的统计，键为订阅者名称"""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        return {subscription.name: subscription.metrics() for subscription in subscriptions}
@@ -0,0 +1,301 @@
+"""
+列存遥测数据
+每列一个只追加的二进制文件，读取时内存映射，按时间范围返回NumPy视图
+"""
+import json
+import os
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Union
+import numpy as np
+from loguru import logger
+
+STORE_VERSION = 1
+META_FILE = 'meta.json'
+
+# 列名和数据类型（小端，定长）
+COLUMNS = {
+    'timestamp': '<f8',   # Unix时间（秒）
+    'position': '<f8',    # 当前位置
+    'signals': '<u2',     # I/O信号位域，位序见meta中的signals
+    'alarm_code': 'S8',   # 报警代码，无报警为空
+}
+
+# 默认信号位序（与StatusCommands.IO_SIGNALS一致）
+DEFAULT_SIGNALS = ['ST0', 'ST1', 'LS0', 'LS1', 'PE0', 'PE1', 'ALM', 'RES']
+
+
+def column_path(directory: str, column: str) -> str:
+    """列文件路径"""
+    return os.path.join(directory, f"{column}.bin")
+
+
+def pack_signals(signals: Dict[str, Any], order: Sequence[str]) -> int:
+    """
+    信号字典打包为位域
+
+    Args:
+        signals: {信号名: 状态}
+        order: 信号位序
+
+    Returns:
+        int: 位域
+    """
+    bits = 0
+    for bit, name in enumerate(order):
+        if signals.get(name):
+            bits |= 1 << bit
+    return bits
+
+
+class TelemetryStoreWriter:
+    """列存遥测写入器
+
+    行先放入内存缓冲，攒够chunk_rows行后每列一次追加写入。
+    行数由文件大小得出，不需要改写元数据，写到一半中断时
+    读取端按最短的列截断，不会读到半行。
+    """
+
+    def __init__(self, directory: str, signals: Sequence[str] = DEFAULT_SIGNALS,
+                 chunk_rows: int = 256):
+        """
+        打开或创建列存目录
+
+        Args:
+            directory: 存储目录
+            signals: 信号位序（最多16个）
+            chunk_rows: 缓冲行数
+        """
+        if len(signals) > 16:
+            raise ValueError("信号数量不能超过16")
+
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+        os.makedirs(directory, exist_ok=True)
+
+        meta_path = os.path.join(directory, META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta['columns'] != COLUMNS or meta['signals'] != list(signals):
+                raise ValueError(f"列存格式不一致: {directory}")
+        else:
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': STORE_VERSION, 'columns': COLUMNS,
+                           'signals': list(signals)}, f, indent=2)
+
+        self.signals = list(signals)
+        self._buffer = np.zeros(chunk_rows, dtype=[(name, dtype) for name, dtype in COLUMNS.items()])
+        self._buffered = 0
+
+        # 已有数据时从最后一行继续，保证时间单调
+        existing = TelemetryStore(directory)
+        self.rows = len(existing)
+        self.last_timestamp = float(existing.column('timestamp')[-1]) if self.rows else float('-inf')
+        existing.close()
+        self._truncate(self.rows)
+
+        self._files = {name: open(column_path(directory, name), 'ab') for name in COLUMNS}
+
+    def _truncate(self, rows: int):
+        """截掉上次中断留下的不完整行"""
+        for name, dtype in COLUMNS.items():
+            path = column_path(self.directory, name)
+            size = rows * np.dtype(dtype).itemsize
+            if os.path.exists(path) and os.path.getsize(path) > size:
+                logger.warning(f"列存 {name} 有不完整数据，已截断到{rows}行")
+                with open(path, 'r+b') as f:
+                    f.truncate(size)
+
+    def append(self, timestamp: float, position: Optional[float], signals: Any,
+               alarm_code: Optional[Union[str, int]] = None):
+        """
+        追加一行
+
+        Args:
+            timestamp: Unix时间（秒），不能早于上一行
+            position: 当前位置，None记为NaN
+            signals: 信号位域，或 {信号名: 状态} 字典
+            alarm_code: 报警代码，控制器可能返回整数，按文本保存；0或空为无报警
+        """
+        if timestamp < self.last_timestamp:
+            raise ValueError(f"时间戳必须递增: {timestamp} < {self.last_timestamp}")
+        if isinstance(signals, Mapping):
+            signals = pack_signals(signals, self.signals)
+
+        row = self._buffer[self._buffered]
+        row['timestamp'] = timestamp
+        row['position'] = np.nan if position is None else position
+        row['signals'] = signals
+        row['alarm_code'] = (str(alarm_code) if alarm_code else '').encode('ascii', 'replace')[:8]
+
+        self._buffered += 1
+        self.rows += 1
+        self.last_timestamp = timestamp
+        if self._buffered == self.chunk_rows:
+            self.flush()
+
+    def record(self, status: Dict[str, Any]):
+        """
+        追加一条完整状态（可直接作为状态总线的订阅回调）
+
+        Args:
+            status: StatusCommands.get_full_status() 返回的状态
+        """
+        timestamp = status.get('timestamp')
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp).timestamp()
+        # 本地时间的isoformat在相邻两行间可能因时钟调整回退，保持单调
+        timestamp = max(float(timestamp), self.last_timestamp)
+
+        self.append(timestamp,
+                    status.get('position', {}).get('current'),
+                    status.get('signals', {}),
+                    status.get('alarm', {}).get('code'))
+
+    def flush(self):
+        """缓冲数据写入文件"""
+        if not self._buffered:
+            return
+        chunk = self._buffer[:self._buffered]
+        for name, f in self._files.items():
+            f.write(np.ascontiguousarray(chunk[name]).tobytes())
+            f.flush()
+        self._buffered = 0
+
+    def close(self):
+        """写完缓冲数据并关闭文件"""
+        self.flush()
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+
+
+class TelemetryStore:
+    """列存遥测读取器
+
+    各列以只读内存映射打开，打开时不读取数据，文件再大也能立即打开。
+    查询返回的数组是映射的切片（视图），不复制、不解析。
+    """
+
+    def __init__(self, directory: str):
+        """
+        打开列存目录
+
+        Args:
+            directory: 存储目录
+        """
+        with open(os.path.join(directory, META_FILE), encoding='utf-8') as f:
+            meta = json.load(f)
+
+        self.directory = directory
+        self.signals: List[str] = meta['signals']
+        self._columns: Dict[str, np.ndarray] = {}
+        self.refresh()
+
+    def refresh(self):
+        """重新映射，读取写入端新追加的行"""
+        sizes = {}
+        for name, dtype in COLUMNS.items():
+            path = column_path(self.directory, name)
+            size = os.path.getsize(path) if os.path.exists(path) else 0
+            sizes[name] = size // np.dtype(dtype).itemsize
+        rows = min(sizes.values())
+
+        self._columns = {}
+        for name, dtype in COLUMNS.items():
+            if rows:
+                self._columns[name] = np.memmap(column_path(self.directory, name),
+                                                dtype=dtype, mode='r', shape=(rows,))
+            else:
+                self._columns[name] = np.empty(0, dtype=dtype)
+        self.rows = rows
+
+    def close(self):
+        """释放内存映射"""
+        self._columns = {}
+        self.rows = 0
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def column(self, name: str) -> np.ndarray:
+        """整列（内存映射）"""
+        return self._columns[name]
+
+    def time_slice(self, start: Optional[float] = None, end: Optional[float] = None) -> slice:
+        """
+        时间范围对应的行范围（二分查找）
+
+        Args:
+            start: 起始时间（含），None为开头
+            end: 结束时间（不含），None为末尾
+
+        Returns:
+            slice: 行范围
+        """
+        timestamps = self._columns['timestamp']
+        first = 0 if start is None else int(np.searchsorted(timestamps, start, side='left'))
+        last = self.rows if end is None else int(np.searchsorted(timestamps, end, side='left'))
+        return slice(first, max(first, last))
+
+    def range(self, start: Optional[float] = None, end: Optional[float] = None,
+              columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        查询时间范围内的数据
+
+        Args:
+            start: 起始时间（含）
+            end: 结束时间（不含）
+            columns: 列名，None为全部
+
+        Returns:
+            Dict[str, np.ndarray]: {列名: 视图}
+        """
+        rows = self.time_slice(start, end)
+        return {name: self._columns[name][rows] for name in (columns or COLUMNS)}
+
+    def signal(self, name: str, start: Optional[float] = None,
+               end: Optional[float] = None) -> np.ndarray:
+        """
+        单个信号的状态
+
+        Args:
+            name: 信号名
+            start: 起始时间（含）
+            end: 结束时间（不含）
+
+        Returns:
+            np.ndarray: 布尔数组
+        """
+        bit = self.signals.index(name)
+        return (self._columns['signals'][self.time_slice(start, end)] >> bit & 1).astype(bool)
+
+    def downsample(self, column: str, buckets: int, start: Optional[float] = None,
+                   end: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """
+        按最小/最大值降采样（用于绘图，保留尖峰）
+
+        Args:
+            column: 数值列名
+            buckets: 分段数
+            start: 起始时间（含）
+            end: 结束时间（不含）
+
+        Returns:
+            timestamp: 各段起始时间
+            min / max: 各段最小值和最大值（数据不多于分段数时与原始值相同）
+        """
+        rows = self.time_slice(start, end)
+        timestamps = self._columns['timestamp'][rows]
+        values = self._columns[column][rows]
+
+        if len(values) <= buckets:
+            return {'timestamp': timestamps, 'min': values, 'max': values}
+
+        edges = np.linspace(0, len(values), buckets + 1).astype(np.intp)[:-1]
+        return {
+            'timestamp': timestamps[edges],
+            'min': np.fmin.reduceat(values, edges),
+            'max': np.fmax.reduceat(values, edges),
+        }
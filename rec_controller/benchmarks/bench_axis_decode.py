@@ -0,0 +1,43 @@
+"""轴状态解码性能对比：逐轴状态记录 vs NumPy批量解码"""
+import sys
+import os
+import random
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.process_image import (ProcessImage, AXES_PER_UNIT, AXIS_STATUS_FLAGS,
+                                input_image_size, decode_axis_status)
+
+
+def bench(label: str, func, number: int) -> float:
+    """运行并打印单次耗时（微秒）"""
+    seconds = min(timeit.repeat(func, number=number, repeat=5))
+    per_call = seconds / number * 1e6
+    print(f"  {label:<24}{per_call:10.2f} us")
+    return per_call
+
+
+def main():
+    random.seed(0)
+    for unit_count in (4, 8, 16):
+        data = bytes(random.getrandbits(8) for _ in range(input_image_size(unit_count)))
+
+        # 两种解码结果一致
+        image = ProcessImage(data, unit_count)
+        axes = image.axes()
+        for record, status in zip(axes, image.all_axes_status().values()):
+            expected = decode_axis_status(int(record['word']))
+            assert status == expected
+            assert all(bool(record[name]) == expected[name] for name in AXIS_STATUS_FLAGS)
+            assert record['position'] == expected['position']
+
+        # 每次轮询都是新的快照，解码结果不能复用
+        print(f"{unit_count * AXES_PER_UNIT} 轴:")
+        old = bench("逐轴状态记录", lambda: ProcessImage(data, unit_count).all_axes_status(), 2000)
+        new = bench("NumPy批量解码", lambda: ProcessImage(data, unit_count).axes(), 2000)
+        print(f"  {'加速比':<22}{old / new:10.1f} x")
+
+
+if __name__ == "__main__":
+    main()
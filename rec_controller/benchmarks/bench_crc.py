@@ -0,0 +1,60 @@
+"""CRC16性能对比：逐位计算 vs 查表计算"""
+import sys
+import os
+import struct
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.modbus import crc16, check_crc
+
+
+def bitwise_crc(data: bytes) -> int:
+    """原逐位实现"""
+    crc = 0xFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            if crc & 0x0001:
+                crc = (crc >> 1) ^ 0xA001
+            else:
+                crc >>= 1
+    return crc
+
+
+def bitwise_verify(data: bytes) -> bool:
+    """原切片校验实现"""
+    if len(data) < 3:
+        return False
+    received_crc = struct.unpack('<H', data[-2:])[0]
+    return received_crc == bitwise_crc(data[:-2])
+
+
+def bench(label: str, func, number: int) -> float:
+    """运行并打印单次耗时（微秒）"""
+    seconds = min(timeit.repeat(func, number=number, repeat=5))
+    per_call = seconds / number * 1e6
+    print(f"  {label:<24}{per_call:10.2f} us")
+    return per_call
+
+
+def main():
+    for size in (8, 64, 256):
+        request = bytes(range(size - 2))
+        frame = request + struct.pack('<H', bitwise_crc(request))
+        view = memoryview(bytearray(frame))
+        assert crc16(request) == bitwise_crc(request)
+        assert check_crc(view) and bitwise_verify(frame)
+
+        number = 20000 if size <= 64 else 5000
+        print(f"帧长 {size} 字节:")
+        old = bench("逐位计算", lambda: bitwise_crc(request), number)
+        new = bench("查表计算", lambda: crc16(request), number)
+        print(f"  {'加速比':<22}{old / new:10.1f} x")
+        old = bench("切片校验", lambda: bitwise_verify(frame), number)
+        new = bench("整帧校验(memoryview)", lambda: check_crc(view), number)
+        print(f"  {'加速比':<22}{old / new:10.1f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""数据解析性能对比：逐字切片/拼接 vs memoryview/array/NumPy"""
+import sys
+import os
+import random
+import struct
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.data_parser import DataParser
+
+
+def slice_bytes_to_words(data: bytes) -> list:
+    """原逐字切片实现"""
+    words = []
+    for i in range(0, len(data), 2):
+        if i + 1 < len(data):
+            word = struct.unpack('<H', data[i:i + 2])[0]
+            words.append(word)
+    return words
+
+
+def concat_words_to_bytes(words: list) -> bytes:
+    """原拼接实现"""
+    data = b''
+    for word in words:
+        data += struct.pack('<H', word & 0xFFFF)
+    return data
+
+
+def shift_word_to_bits(word: int) -> list:
+    """原逐位实现"""
+    return [(word >> i) & 1 for i in range(16)]
+
+
+def bench(label: str, func, number: int) -> float:
+    """运行并打印单次耗时（微秒）"""
+    seconds = min(timeit.repeat(func, number=number, repeat=5))
+    per_call = seconds / number * 1e6
+    print(f"  {label:<24}{per_call:10.2f} us")
+    return per_call
+
+
+def main():
+    random.seed(0)
+    word = 0xA5C3
+    assert DataParser.word_to_bits(word) == shift_word_to_bits(word)
+    print("单字展开为位:")
+    old = bench("逐位移位", lambda: shift_word_to_bits(word), 100000)
+    new = bench("字节查表", lambda: DataParser.word_to_bits(word), 100000)
+    print(f"  {'加速比':<22}{old / new:10.1f} x")
+
+    for size in (68, 516, 4096):
+        data = bytes(random.getrandbits(8) for _ in range(size))
+        words = slice_bytes_to_words(data)
+        assert DataParser.bytes_to_words(data) == words
+        assert DataParser.words_to_bytes(words) == concat_words_to_bytes(words)
+        bits = DataParser.words_to_bits_array(data)
+        assert bits.tolist() == [shift_word_to_bits(w) for w in words]
+        assert DataParser.bits_array_to_words(bits).tolist() == words
+
+        number = 2000 if size <= 516 else 200
+        print(f"过程映像 {size} 字节 ({len(words)} 字):")
+        old = bench("切片解包", lambda: slice_bytes_to_words(data), number)
+        new = bench("memoryview.cast", lambda: DataParser.bytes_to_words(data), number)
+        print(f"  {'加速比':<22}{old / new:10.1f} x")
+        old = bench("拼接打包", lambda: concat_words_to_bytes(words), number)
+        new = bench("array打包", lambda: DataParser.words_to_bytes(words), number)
+        print(f"  {'加速比':<22}{old / new:10.1f} x")
+        old = bench("逐字展开位", lambda: [shift_word_to_bits(w) for w in slice_bytes_to_words(data)], number)
+        new = bench("unpackbits", lambda: DataParser.words_to_bits_array(data), number)
+        print(f"  {'加速比':<22}{old / new:10.1f} x")
+
+
+if __name__ == "__main__":
+    main()
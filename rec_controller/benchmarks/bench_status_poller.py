@@ -0,0 +1,75 @@
+"""多轴等待：各轴独立轮询 vs 集中状态轮询（本机模拟网关，显式报文）"""
+import sys
+import os
+import logging
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.rec_controller import RECController
+from core.ec_actuator import ECActuator
+from core.process_image import AXES_PER_UNIT
+from simulator import RECSimulator, EIPServer
+
+STROKE_TIME = 0.3
+LATENCY = 0.02
+ROUNDS = 5
+
+
+def run_round(axes, direction: str) -> list:
+    """所有轴同时运动并等待到位，返回各轴的检测延迟（秒）"""
+    delays = [None] * len(axes)
+
+    def worker(index, axis):
+        start = time.perf_counter()
+        if direction == 'forward':
+            axis.move_forward()
+        else:
+            axis.move_backward()
+        if axis.wait_for_position(direction, timeout=2.0):
+            delays[index] = time.perf_counter() - start - LATENCY - STROKE_TIME
+        axis.stop()
+
+    threads = [threading.Thread(target=worker, args=(i, axis)) for i, axis in enumerate(axes)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return delays
+
+
+def bench(label: str, server: EIPServer, poller_period=None):
+    controller = RECController('ethernet_ip', ip_address=f"{server.host}:{server.port}")
+    controller.connect()
+    if poller_period:
+        controller.start_status_poller(poller_period)
+    axes = [ECActuator(controller, 0, index) for index in range(AXES_PER_UNIT)]
+    try:
+        requests = server.requests
+        start = time.perf_counter()
+        delays = []
+        for _ in range(ROUNDS):
+            delays += run_round(axes, 'forward') + run_round(axes, 'backward')
+        elapsed = time.perf_counter() - start
+        requests = server.requests - requests
+    finally:
+        controller.disconnect()
+
+    detected = [d for d in delays if d is not None]
+    print(f"  {label:<20}{requests / elapsed:8.0f} 请求/秒"
+          f"{sum(detected) / len(detected) * 1e3:10.1f} ms平均"
+          f"{max(detected) * 1e3:8.1f} ms最大  到位{len(detected)}/{len(delays)}")
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+    simulator = RECSimulator(1, stroke_time=STROKE_TIME, latency=LATENCY)
+    with EIPServer(simulator, port=0) as server:
+        print(f"{AXES_PER_UNIT}轴同时往复{ROUNDS}次，检测延迟 = 等待返回 - 理论到位时间")
+        bench("各轴独立轮询(50ms)", server)
+        bench("集中轮询(10ms)", server, poller_period=0.01)
+
+
+if __name__ == "__main__":
+    main()
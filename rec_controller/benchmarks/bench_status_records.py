@@ -0,0 +1,72 @@
+"""每次轮询的状态分配：逐轴字典 vs 状态记录（内存分配次数、字节数、变化检测耗时）"""
+import sys
+import os
+import random
+import timeit
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.process_image import (AXES_PER_UNIT, AXIS_STATUS_FLAGS, input_image_size,
+                                axis_status_offset, decode_axis_status)
+
+UNIT_COUNT = 16
+POLLS = 1000
+
+
+def decode_axis_dict(status_word: int) -> dict:
+    """原有的字典解码"""
+    status = {name: bool(status_word & mask) for name, mask in AXIS_STATUS_FLAGS.items()}
+    status['position'] = (status_word & 0xFF00) >> 8
+    status['status_code'] = status_word & 0x00FF
+    return status
+
+
+def read_words(data: bytes) -> list:
+    return [int.from_bytes(data[offset:offset + 2], 'little')
+            for offset in (axis_status_offset(unit, axis)
+                           for unit in range(UNIT_COUNT) for axis in range(AXES_PER_UNIT))]
+
+
+def allocations(func, polls: int):
+    """保留每次轮询结果（与GUI/监控持有上一次状态相同），返回每次轮询的分配块数和字节数"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    results = [func() for _ in range(polls)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, 'filename')
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    del results
+    return blocks / polls, size / polls
+
+
+def main():
+    random.seed(0)
+    data = bytes(random.getrandbits(8) for _ in range(input_image_size(UNIT_COUNT)))
+    words = read_words(data)
+    print(f"{len(words)} 轴，每次轮询解码全部轴状态:")
+
+    for label, decode in (("逐轴字典", decode_axis_dict), ("状态记录", decode_axis_status)):
+        poll = lambda: [decode(word) for word in words]
+        blocks, size = allocations(poll, POLLS)
+        seconds = min(timeit.repeat(poll, number=POLLS, repeat=5)) / POLLS
+
+        # 变化检测：与上一次轮询逐轴比较
+        previous, current = poll(), poll()
+        compare = min(timeit.repeat(lambda: [a != b for a, b in zip(previous, current)],
+                                    number=POLLS, repeat=5)) / POLLS
+        print(f"  {label:<10}{blocks:8.0f} 块{size / 1024:8.1f} KiB/次"
+              f"  解码{seconds * 1e6:8.1f} us  比较{compare * 1e6:7.1f} us")
+
+    # 记录只需比较状态字
+    previous = [decode_axis_status(word) for word in words]
+    current = [decode_axis_status(word) for word in words]
+    compare = min(timeit.repeat(lambda: [a.word != b.word for a, b in zip(previous, current)],
+                                number=POLLS, repeat=5)) / POLLS
+    print(f"  {'状态记录(比较状态字)':<10}{'':>42}比较{compare * 1e6:7.1f} us")
+
+
+if __name__ == "__main__":
+    main()
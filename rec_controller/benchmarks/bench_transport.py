@@ -0,0 +1,59 @@
+"""通信方式性能对比：显式报文 / 隐式I/O / Modbus RTU（本机模拟网关）"""
+import sys
+import os
+import logging
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.rec_controller import RECController
+from core.ec_actuator import ECActuator
+from simulator import RECSimulator, EIPServer, ModbusRTUServer
+
+UNIT_COUNT = 2
+POLLS = 200
+
+
+def bench_controller(label: str, controller: RECController):
+    """轮询延迟与一次往复动作耗时"""
+    if not controller.connect():
+        print(f"  {label:<12}连接失败")
+        return
+    try:
+        # 等待隐式I/O收到第一帧
+        time.sleep(0.05)
+        start = time.perf_counter()
+        for _ in range(POLLS):
+            controller.read_process_image()
+        poll_ms = (time.perf_counter() - start) / POLLS * 1e3
+
+        axis = ECActuator(controller, UNIT_COUNT - 1, 2)
+        start = time.perf_counter()
+        forward = axis.move_forward() and axis.wait_for_position('forward', 2)
+        axis.stop()
+        backward = axis.move_backward() and axis.wait_for_position('backward', 2)
+        axis.stop()
+        cycle = time.perf_counter() - start
+        result = "OK" if forward and backward else "超时"
+        print(f"  {label:<12}{poll_ms:10.3f} ms/轮询{cycle:10.2f} s/往复  {result}")
+    finally:
+        controller.disconnect()
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+    simulator = RECSimulator(UNIT_COUNT, stroke_time=0.2, latency=0.01)
+    with EIPServer(simulator, port=0, io_port=0) as eip, ModbusRTUServer(simulator) as modbus:
+        address = f"{eip.host}:{eip.port}"
+        print(f"模拟网关: {UNIT_COUNT}单元, 全行程0.2s, 响应延迟0.01s")
+        bench_controller("显式报文", RECController(
+            'ethernet_ip', ip_address=address, unit_count=UNIT_COUNT))
+        bench_controller("隐式I/O", RECController(
+            'ethernet_ip', ip_address=address, unit_count=UNIT_COUNT, implicit_io=True,
+            io_port=eip.io_port + 1, target_io_port=eip.io_port, rpi=5.0))
+        bench_controller("Modbus RTU", RECController(
+            'serial', port=modbus.slave_path, unit_count=UNIT_COUNT))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""往复运动在虚拟时钟下的耗时：虚拟时间 vs 实际耗时（本机模拟网关，显式报文）"""
+import sys
+import os
+import logging
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.rec_controller import RECController
+from core.ec_actuator import ECActuator
+from commands.position_commands import PositionCommands
+from simulator import RECSimulator, EIPServer
+from utils.clock import VirtualClock
+
+CYCLES = 1000
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+    clock = VirtualClock()
+    simulator = RECSimulator(1, stroke_time=0.5, latency=0.02, time_source=clock.monotonic)
+    with EIPServer(simulator, port=0) as server:
+        controller = RECController('ethernet_ip', ip_address=f"{server.host}:{server.port}")
+        if not controller.connect():
+            print("连接模拟网关失败")
+            return
+        try:
+            commands = PositionCommands(ECActuator(controller, 0, 0, clock=clock))
+            wall = time.perf_counter()
+            cpu = time.process_time()
+            ok = commands.cycle_motion(CYCLES, dwell_time=0.1)
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+        finally:
+            controller.disconnect()
+
+    print(f"往复{CYCLES}次: {'完成' if ok else '失败'}")
+    print(f"  虚拟时间{clock.time():10.1f} s")
+    print(f"  实际耗时{wall:10.2f} s  (CPU {cpu:.2f} s)")
+    print(f"  加速比  {clock.time() / wall:10.0f} x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,6 @@
 """基本控制命令"""
 from typing import Optional
 from core.ec_actuator import ECActuator
-import time
 
 
 class BasicCommands:
@@ -22,14 +21,14 @@ class BasicCommands:
         """
         self.actuator.move_forward()
         if duration:
-            time.sleep(duration)
+            self.actuator.clock.sleep(duration)
             self.actuator.stop()
 
     def jog_backward(self, duration: Optional[float] = None):
         """点动后退"""
         self.actuator.move_backward()
         if duration:
-            time.sleep(duration)
+            self.actuator.clock.sleep(duration)
             self.actuator.stop()
 
     def move_to_forward_end(self) -> bool:
@@ -1,7 +1,6 @@
 """位置控制命令"""
 from typing import List, Tuple
 from core.ec_actuator import ECActuator
-import time
 
 
 class PositionCommands:
@@ -40,7 +39,7 @@ class PositionCommands:
             if not self.actuator.wait_for_position('forward'):
                 return False
             self.actuator.stop()
-            time.sleep(dwell_time)
+            self.actuator.clock.sleep(dwell_time)
 
             # 后退
             if not self.actuator.move_backward():
@@ -48,7 +47,7 @@ class PositionCommands:
             if not self.actuator.wait_for_position('backward'):
                 return False
             self.actuator.stop()
-            time.sleep(dwell_time)
+            self.actuator.clock.sleep(dwell_time)
 
         return True
 
@@ -75,6 +74,6 @@ class PositionCommands:
                 return False
 
             self.actuator.stop()
-            time.sleep(dwell)
+            self.actuator.clock.sleep(dwell)
 
         return True
\ No newline at end of file
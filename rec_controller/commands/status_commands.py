@@ -1,7 +1,11 @@
 """状态查询命令"""
+import time
 from typing import Dict, Optional
+import numpy as np
 from core.rec_controller import RECController
 from core.ec_actuator import ECActuator
+from core.process_image import ProcessImage, AXES_PER_UNIT
+from utils.historian import Historian
 
 
 class StatusCommands:
@@ -10,6 +14,10 @@ class StatusCommands:
     def __init__(self, controller: RECController):
         self.controller = controller
 
+    def get_snapshot(self) -> Optional[ProcessImage]:
+        """一次读取网关输入块，返回过程映像快照"""
+        return self.controller.read_process_image()
+
     def get_gateway_status(self) -> Optional[Dict]:
         """获取网关状态"""
         return self.controller.read_gateway_status()
@@ -19,14 +27,45 @@ class StatusCommands:
         return self.controller.read_axis_status(unit_index, axis_index)
 
     def get_all_axes_status(self) -> Dict:
-        """获取所有轴状态"""
+        """获取所有轴状态（一次总线读取）"""
+        image = self.get_snapshot()
+        if image is not None:
+            return image.all_axes_status()
+
         status = {}
         for unit in range(self.controller.unit_count):
-            for axis in range(4):
-                key = f"unit{unit}_axis{axis}"
-                status[key] = self.get_axis_status(unit, axis)
+            for axis in range(AXES_PER_UNIT):
+                status[f"unit{unit}_axis{axis}"] = None
         return status
 
+    def get_axes_array(self) -> Optional[np.ndarray]:
+        """获取所有轴状态的结构化数组（一次总线读取，向量化解码）"""
+        image = self.get_snapshot()
+        return image.axes() if image is not None else None
+
+    def record_history(self, historian: Historian, image: Optional[ProcessImage] = None) -> bool:
+        """把网关和所有轴的状态写入历史数据库（一次总线读取）
+
+        Args:
+            historian: 历史数据库
+            image: 过程映像快照，不给出时读取一次
+
+        Returns:
+            是否读取到状态
+        """
+        image = image if image is not None else self.get_snapshot()
+        if image is None:
+            return False
+
+        timestamp = time.time()
+        gateway = image.gateway_status()
+        if gateway is not None:
+            historian.record(gateway, source='gateway', timestamp=timestamp)
+        for key, status in image.all_axes_status().items():
+            if status is not None:
+                historian.record(status, source=key, timestamp=timestamp)
+        return True
+
     def check_alarm(self, unit_index: int, axis_index: int) -> bool:
         """检查是否有报警"""
         status = self.get_axis_status(unit_index, axis_index)
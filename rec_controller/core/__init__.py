@@ -2,5 +2,8 @@
 from .ethernet_ip import EtherNetIPClient
 from .rec_controller import RECController
 from .ec_actuator import ECActuator
+from .async_controller import AsyncRECController
+from .async_actuator import AsyncECActuator
 
-__all__ = ['EtherNetIPClient', 'RECController', 'ECActuator']
\ No newline at end of file
+__all__ = ['EtherNetIPClient', 'RECController', 'ECActuator',
+           'AsyncRECController', 'AsyncECActuator']
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""EC电缸asyncio控制类"""
+import asyncio
+from typing import Optional
+
+from .async_controller import AsyncRECController
+from .ec_actuator import POSITION_COMMANDS, motion_complete
+
+
+class AsyncECActuator:
+    """EC电缸asyncio控制类，接口与ECActuator一致，阻塞操作均为协程"""
+
+    def __init__(self, controller: AsyncRECController, unit_index: int, axis_index: int):
+        self.controller = controller
+        self.unit_index = unit_index
+        self.axis_index = axis_index
+        # 本对象最后发出的移动方向（'forward'/'backward'），停止后为None
+        self.target: Optional[str] = None
+
+    def _status(self, image) -> Optional[dict]:
+        return image.axis_status(self.unit_index, self.axis_index)
+
+    async def home(self, timeout: float = 30.0) -> bool:
+        """执行原点复归
+
+        Args:
+            timeout: 超时时间(秒)
+
+        Returns:
+            是否成功完成原点复归
+        """
+        # 发送原点复归命令(ST0或ST1都可以)
+        await self.controller.send_axis_command(self.unit_index, self.axis_index, 'ST0', True)
+
+        result = await self.controller.wait_until(self._complete, timeout, interval=0.1)
+
+        # 停止命令
+        await self.controller.send_axis_command(self.unit_index, self.axis_index, 'ST0', False)
+        return result
+
+    def _complete(self, image) -> bool:
+        return motion_complete(self._status(image))
+
+    async def move_forward(self) -> bool:
+        """前进到前进端"""
+        self.target = 'forward'
+        return await self.controller.send_axis_command(self.unit_index, self.axis_index, 'ST1', True)
+
+    async def move_backward(self) -> bool:
+        """后退到后退端"""
+        self.target = 'backward'
+        return await self.controller.send_axis_command(self.unit_index, self.axis_index, 'ST0', True)
+
+    async def stop(self):
+        """停止运动"""
+        self.target = None
+        await self.controller.send_axis_commands(self.unit_index, self.axis_index,
+                                                 {'ST0': False, 'ST1': False})
+
+    async def reset_alarm(self):
+        """复位报警"""
+        await self.controller.send_axis_command(self.unit_index, self.axis_index, 'RES', True)
+        await asyncio.sleep(0.1)
+        await self.controller.send_axis_command(self.unit_index, self.axis_index, 'RES', False)
+
+    async def wait_for_position(self, position: str, timeout: float = 10.0) -> bool:
+        """等待到达指定位置（判断方法同 ECActuator.wait_for_position）
+
+        Args:
+            position: 'forward' 或 'backward'
+            timeout: 超时时间
+
+        Returns:
+            是否成功到达位置
+        """
+        if position not in POSITION_COMMANDS:
+            return False
+        if self.target is not None and self.target != position:
+            return False
+        return await self.controller.wait_until(self._complete, timeout, interval=0.05)
+
+    async def cycle_motion(self, cycles: int = 1, dwell_time: float = 0.5) -> bool:
+        """往复运动
+
+        Args:
+            cycles: 循环次数
+            dwell_time: 停留时间（秒）
+
+        Returns:
+            是否成功完成所有循环
+        """
+        for _ in range(cycles):
+            for position, start in (('forward', self.move_forward), ('backward', self.move_backward)):
+                if not await start():
+                    return False
+                if not await self.wait_for_position(position):
+                    return False
+                await self.stop()
+                await asyncio.sleep(dwell_time)
+        return True
+
+    async def get_status(self) -> Optional[dict]:
+        """获取当前状态"""
+        return await self.controller.read_axis_status(self.unit_index, self.axis_index)
@@ -0,0 +1,138 @@
+"""REC控制器asyncio接口"""
+import asyncio
+import time
+from typing import Callable, Dict, Optional
+
+from .process_image import ProcessImage, GatewayStatus, AxisStatus
+from .rec_controller import RECController
+
+
+class AsyncRECController:
+    """REC控制器的asyncio封装
+
+    阻塞的总线访问提交到控制器的I/O通道（每个控制器一个I/O线程）执行，
+    事件循环中的协程只等待结果，所以一个事件循环可以驱动多个网关上的
+    几十个轴，而线程数只与网关数相同。
+
+    同一时刻多个协程请求状态时共用一次过程映像读取。
+
+    Modbus TCP模式下读写走控制器的流水线路径：I/O通道只负责发送，
+    应答在默认线程池中按事务ID等待，不占用I/O线程。
+    """
+
+    def __init__(self, controller: Optional[RECController] = None, **kwargs):
+        """
+        Args:
+            controller: 已创建的同步控制器，None时用kwargs创建
+            **kwargs: 传给RECController的参数
+        """
+        self.controller = controller or RECController(**kwargs)
+        self._snapshot_task: Optional[asyncio.Task] = None
+        self._snapshot: Optional[ProcessImage] = None
+        self._snapshot_time = 0.0
+
+    @property
+    def connected(self) -> bool:
+        return self.controller.connected
+
+    @property
+    def unit_count(self) -> int:
+        return self.controller.unit_count
+
+    async def _run(self, func: Callable, *args):
+        """在I/O通道中执行阻塞调用"""
+        return await asyncio.wrap_future(self.controller.channel.submit(func, *args))
+
+    async def _run_request(self, func: Callable, *args):
+        """执行控制器的读写调用
+
+        Modbus TCP的读写在调用线程等待应答，放在I/O线程中执行会让
+        整个往返期间其它操作无法发送，所以改在线程池中调用。
+        """
+        if self.controller.comm_type == RECController.COMM_MODBUS_TCP:
+            return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+        return await self._run(func, *args)
+
+    async def connect(self) -> bool:
+        """连接到REC控制器"""
+        return await self._run(self.controller.connect)
+
+    async def disconnect(self):
+        """断开连接"""
+        await asyncio.get_running_loop().run_in_executor(None, self.controller.disconnect)
+
+    async def read_data(self, address: int, length: int) -> Optional[bytes]:
+        """读取数据"""
+        return await self._run_request(self.controller.read_data, address, length)
+
+    async def write_data(self, address: int, data: bytes) -> bool:
+        """写入数据"""
+        return await self._run_request(self.controller.write_data, address, data)
+
+    async def read_process_image(self, max_age: float = 0.0) -> Optional[ProcessImage]:
+        """读取过程映像
+
+        Args:
+            max_age: 允许复用的快照最大年龄(秒)。已有读取在进行时直接等待它的结果。
+        """
+        if self._snapshot is not None and time.monotonic() - self._snapshot_time <= max_age:
+            return self._snapshot
+
+        if self._snapshot_task is None or self._snapshot_task.done():
+            self._snapshot_task = asyncio.ensure_future(self._read_snapshot())
+        return await asyncio.shield(self._snapshot_task)
+
+    async def _read_snapshot(self) -> Optional[ProcessImage]:
+        image = await self._run_request(self.controller.read_process_image)
+        if image is not None:
+            self._snapshot = image
+            self._snapshot_time = time.monotonic()
+        return image
+
+    async def read_gateway_status(self, max_age: float = 0.0) -> Optional[GatewayStatus]:
+        """读取网关状态"""
+        image = await self.read_process_image(max_age)
+        return image.gateway_status() if image else None
+
+    async def read_axis_status(self, unit_index: int, axis_index: int,
+                               max_age: float = 0.0) -> Optional[AxisStatus]:
+        """读取轴状态"""
+        image = await self.read_process_image(max_age)
+        return image.axis_status(unit_index, axis_index) if image else None
+
+    async def send_axis_command(self, unit_index: int, axis_index: int,
+                                command: str, value: bool = True) -> bool:
+        """发送轴控制命令"""
+        return await self._run(self.controller.send_axis_command,
+                               unit_index, axis_index, command, value)
+
+    async def send_axis_commands(self, unit_index: int, axis_index: int,
+                                 commands: Dict[str, bool]) -> bool:
+        """一次写出多个轴控制命令位"""
+        return await self._run(self.controller.send_axis_commands,
+                               unit_index, axis_index, commands)
+
+    async def wait_until(self, predicate: Callable[[ProcessImage], bool],
+                         timeout: float, interval: float = 0.05) -> bool:
+        """等待过程映像满足条件
+
+        Args:
+            predicate: 以过程映像为参数的判断函数
+            timeout: 超时时间(秒)
+            interval: 轮询间隔(秒)，同一间隔内的多个等待者共用一次读取
+
+        Returns:
+            是否在超时前满足条件
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        # 共用的快照可能在等待之前（刚写出的命令之前）读取，只判断之后发出的读取
+        token = self.controller.channel.ordinal
+        while True:
+            image = await self.read_process_image(max_age=interval)
+            if image is not None and image.ordinal >= token and predicate(image):
+                return True
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(interval, remaining))
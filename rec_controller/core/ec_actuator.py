@@ -1,16 +1,39 @@
 """EC电缸控制类"""
-import time
 from typing import Optional
 from .rec_controller import RECController
+from utils.clock import Clock, REAL_CLOCK
+
+# 等待位置的方向 -> 对应的移动命令
+POSITION_COMMANDS = {'forward': 'ST1', 'backward': 'ST0'}
+
+
+def motion_complete(status) -> bool:
+    """当前移动命令的动作是否已完成（完成位置位、忙碌位复位、无报警）
+
+    轴状态字没有单独的端点信号，到达端点以完成位判断：网关接受新的移动命令时
+    先复位完成位，命令写出之后读到的完成位就属于这次命令；仅忙碌不算到达。
+    """
+    return bool(status) and status['done'] and not status['busy'] and not status['alarm']
 
 
 class ECActuator:
     """EC电缸控制类"""
 
-    def __init__(self, controller: RECController, unit_index: int, axis_index: int):
+    def __init__(self, controller: RECController, unit_index: int, axis_index: int,
+                 clock: Optional[Clock] = None):
+        """
+        Args:
+            controller: REC控制器
+            unit_index: 单元索引
+            axis_index: 轴索引
+            clock: 等待循环使用的时钟，None时使用真实时钟
+        """
         self.controller = controller
         self.unit_index = unit_index
         self.axis_index = axis_index
+        self.clock = clock or REAL_CLOCK
+        # 本对象最后发出的移动方向（'forward'/'backward'），停止后为None
+        self.target: Optional[str] = None
 
     def home(self, timeout: float = 30.0) -> bool:
         """执行原点复归
@@ -25,41 +48,52 @@ class ECActuator:
         self.controller.send_axis_command(self.unit_index, self.axis_index, 'ST0', True)
 
         # 等待原点复归完成
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            status = self.controller.read_axis_status(self.unit_index, self.axis_index)
-            if status and (status['ls0_pe0'] or status['ls1_pe1']):
-                # 停止命令
-                self.controller.send_axis_command(self.unit_index, self.axis_index, 'ST0', False)
-                return True
-            time.sleep(0.1)
-
-        # 超时停止
+        done = self._wait_complete(timeout, 0.1)
         self.controller.send_axis_command(self.unit_index, self.axis_index, 'ST0', False)
+        return done
+
+    def _wait_complete(self, timeout: float, interval: float) -> bool:
+        """等待当前移动命令完成"""
+        if self.controller.polling:
+            # 由集中轮询器唤醒，不单独访问总线
+            return self.controller.poller.wait_for_axis(
+                self.unit_index, self.axis_index, motion_complete, timeout) is not None
+
+        start_time = self.clock.time()
+        while self.clock.time() - start_time < timeout:
+            if motion_complete(self.controller.read_axis_status(self.unit_index, self.axis_index)):
+                return True
+            self.clock.sleep(interval)
         return False
 
     def move_forward(self) -> bool:
         """前进到前进端"""
+        self.target = 'forward'
         return self.controller.send_axis_command(self.unit_index, self.axis_index, 'ST1', True)
 
     def move_backward(self) -> bool:
         """后退到后退端"""
+        self.target = 'backward'
         return self.controller.send_axis_command(self.unit_index, self.axis_index, 'ST0', True)
 
     def stop(self):
         """停止运动"""
-        self.controller.send_axis_command(self.unit_index, self.axis_index, 'ST0', False)
-        self.controller.send_axis_command(self.unit_index, self.axis_index, 'ST1', False)
+        self.target = None
+        self.controller.send_axis_commands(self.unit_index, self.axis_index,
+                                           {'ST0': False, 'ST1': False})
 
     def reset_alarm(self):
         """复位报警"""
         self.controller.send_axis_command(self.unit_index, self.axis_index, 'RES', True)
-        time.sleep(0.1)
+        self.clock.sleep(0.1)
         self.controller.send_axis_command(self.unit_index, self.axis_index, 'RES', False)
 
     def wait_for_position(self, position: str, timeout: float = 10.0) -> bool:
         """等待到达指定位置
 
+        到达以移动命令完成判断，应先用 move_forward()/move_backward()
+        发出同方向的命令；本对象最后的移动方向与 position 不符时直接返回False。
+
         Args:
             position: 'forward' 或 'backward'
             timeout: 超时时间
@@ -67,16 +101,12 @@ class ECActuator:
         Returns:
             是否成功到达位置
         """
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            status = self.controller.read_axis_status(self.unit_index, self.axis_index)
-            if status:
-                if position == 'forward' and status['ls1_pe1']:
-                    return True
-                elif position == 'backward' and status['ls0_pe0']:
-                    return True
-            time.sleep(0.05)
-        return False
+        if position not in POSITION_COMMANDS:
+            return False
+        if self.target is not None and self.target != position:
+            self.controller.logger.warning(f"等待{position}，但最后的移动命令为{self.target}")
+            return False
+        return self._wait_complete(timeout, 0.05)
 
     def get_status(self) -> Optional[dict]:
         """获取当前状态"""
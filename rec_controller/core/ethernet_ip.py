@@ -2,60 +2,242 @@
 from pycomm3 import CIPDriver, Services, ClassCode, INT, DINT, REAL
 import struct
 import logging
+from concurrent.futures import Future
+from .implicit_io import ImplicitIOConnection
+from .connection_supervisor import ConnectionSupervisor
 
 
 class EtherNetIPClient:
-    """EtherNet/IP客户端类"""
+    """EtherNet/IP客户端类
 
-    def __init__(self, ip_address, timeout=3.0):
+    显式报文通过组件对象（类0x04，属性3）读写网关的I/O数据：
+    输入组件用Get_Attribute_Single整体读取后按字节地址截取，
+    输出组件用Set_Attribute_Single整体写入。REC网关是EtherNet/IP适配器，
+    不是Logix控制器，没有 B{地址}:{长度} 这类标签；CIPDriver 也没有
+    read/write 方法，按标签读写的调用在任何网关上都会失败。
+    """
+
+    # 组件对象的数据属性
+    ASSEMBLY_DATA_ATTRIBUTE = 3
+
+    def __init__(self, ip_address, timeout=3.0, implicit=None,
+                 input_assembly=100, output_assembly=150, executor=None):
+        """
+        Args:
+            ip_address: 控制器IP地址，非标准端口时写作 'IP:端口'
+            timeout: 超时时间(秒)
+            implicit: 隐式I/O参数，None表示只使用显式报文。
+                键: input_size, output_size, input_assembly,
+                output_assembly, config_assembly, rpi(毫秒), port, target_port
+            input_assembly: 输入组件实例号（显式报文读取）
+            output_assembly: 输出组件实例号（显式报文读写）
+            executor: 提交驱动操作的函数 executor(func, *args)，如I/O通道的submit。
+                重连时新会话在重连线程中建立，换上新会话提交到executor执行，
+                None时直接在重连线程中执行
+        """
         self.ip_address = ip_address
         self.timeout = timeout
         self.driver = None
+        self.implicit = implicit
+        self.input_assembly = input_assembly
+        self.output_assembly = output_assembly
+        self.executor = executor or (lambda func, *args: func(*args))
+        self.io: ImplicitIOConnection = None
+        # 输出组件的本地副本：组件数据只能整体写入，有副本时每次写入只需一次Set。
+        # 本客户端是输出组件的唯一写入者，副本在首次读写时从设备读取，出错或重连后作废
+        self._output: bytearray = None
         self.logger = logging.getLogger(__name__)
+        # 断线后自动重连，断线期间读写立即失败
+        self.supervisor = ConnectionSupervisor(self._reopen, name=f"REC控制器 {ip_address}")
+
+    @property
+    def link_up(self):
+        """通信链路是否正常（断路器关闭）"""
+        return self.supervisor.available
 
     def connect(self):
         """建立连接"""
         try:
             self.driver = CIPDriver(self.ip_address, timeout=self.timeout)
             self.driver.open()
+            self._output = None
             self.logger.info(f"成功连接到REC控制器: {self.ip_address}")
-            return True
         except Exception as e:
             self.logger.error(f"连接失败: {e}")
             return False
 
+        self._open_io()
+        self.supervisor.mark_connected()
+        return True
+
+    def _open_io(self):
+        """建立隐式I/O连接，失败时退回显式报文"""
+        if not self.implicit:
+            return
+        host = self.ip_address.split(':')[0]
+        io = ImplicitIOConnection(self.driver, host, **self.implicit)
+        if io.open():
+            self.io = io
+        else:
+            self.logger.warning("隐式I/O连接失败，使用显式报文")
+
+    def _reopen(self):
+        """重新建立会话和隐式I/O连接（由后台重连线程调用）
+
+        新会话在重连线程中建立，不影响正在使用的驱动；
+        换上新会话提交到executor，与其它读写串行；等换上完成后才返回，
+        保证重连线程标记连接恢复时读写已经使用新会话。
+
+        Returns:
+            bool: 新会话是否已经换上
+        """
+        driver = CIPDriver(self.ip_address, timeout=self.timeout)
+        driver.open()
+        result = self.executor(self._replace_driver, driver)
+        if isinstance(result, Future):
+            # I/O线程可能正忙于其它读写，隐式连接的Forward Open也需要一次往返
+            result = result.result(timeout=self.timeout * 2)
+        return result
+
+    def _replace_driver(self, driver):
+        """关闭旧会话，换上新会话并重建隐式I/O连接
+
+        Returns:
+            bool: 是否换上（换上之前已主动断开时返回False）
+        """
+        if self.supervisor.state == ConnectionSupervisor.STATE_DISCONNECTED:
+            driver.close()
+            return False
+        if self.io:
+            self.io.close()
+            self.io = None
+        try:
+            if self.driver:
+                self.driver.close()
+        except Exception:
+            pass
+
+        self.driver = driver
+        self._output = None
+        self._open_io()
+        return True
+
     def disconnect(self):
         """断开连接"""
+        self.supervisor.mark_disconnected()
+        if self.io:
+            self.io.close()
+            self.io = None
         if self.driver:
             self.driver.close()
             self.logger.info("断开连接")
+        self._output = None
 
     def read_data(self, start_address, length):
-        """读取数据"""
+        """读取数据
+
+        隐式I/O连接有效时直接返回本地输入缓冲区中的最新数据。
+        """
+        if not self.link_up:
+            # 断路器打开，立即失败
+            return None
+
+        if self.io:
+            data = self.io.read_input(start_address, length)
+            if data is not None:
+                self.supervisor.record_success()
+            elif self.io.input_timestamp and not self.io.alive:
+                # 输入数据超过连接超时未刷新，视为断线
+                self.supervisor.record_failure(TimeoutError("隐式I/O输入超时"))
+            return data
+
         try:
-            # 使用pycomm3的read方法读取数据
-            # 根据REC文档，使用字节地址
-            tag = f"B{start_address}:{length}"
-            result = self.driver.read(tag)
-            if result and hasattr(result, 'value'):
-                return result.value
-            elif result and hasattr(result, 'data'):
-                return result.data
-            else:
-                return None
+            # 输入组件只有几十字节，整体读取也只需一次往返
+            data = self._get_assembly(self.input_assembly)
+            self.supervisor.record_success()
+            return data[start_address:start_address + length]
         except Exception as e:
             self.logger.error(f"读取数据失败: {e}")
+            self.supervisor.record_failure(e)
+            return None
+
+    def _get_assembly(self, instance):
+        """读取组件对象的数据（Get_Attribute_Single，类0x04 属性3）"""
+        response = self.driver.generic_message(
+            service=Services.get_attribute_single,
+            class_code=ClassCode.assembly,
+            instance=instance,
+            attribute=self.ASSEMBLY_DATA_ATTRIBUTE,
+            connected=False,
+            route_path=False,
+            name=f'assembly_{instance}',
+        )
+        if response.error:
+            raise IOError(response.error)
+        return bytes(response.value)
+
+    def _set_assembly(self, instance, data):
+        """写入组件对象的数据（Set_Attribute_Single，类0x04 属性3，只能整体写入）"""
+        response = self.driver.generic_message(
+            service=Services.set_attribute_single,
+            class_code=ClassCode.assembly,
+            instance=instance,
+            attribute=self.ASSEMBLY_DATA_ATTRIBUTE,
+            request_data=bytes(data),
+            connected=False,
+            route_path=False,
+            name=f'assembly_{instance}',
+        )
+        if response.error:
+            raise IOError(response.error)
+
+    def read_output_data(self, start_address, length):
+        """读取输出数据（从设备读取，并刷新输出组件副本）
+
+        隐式I/O模式下输出由本机产生，直接返回本地输出缓冲区。
+        """
+        if not self.link_up:
+            return None
+        if self.io:
+            return self.io.read_output(start_address, length)
+
+        try:
+            self._output = bytearray(self._get_assembly(self.output_assembly))
+            self.supervisor.record_success()
+            return bytes(self._output[start_address:start_address + length])
+        except Exception as e:
+            self.logger.error(f"读取输出数据失败: {e}")
+            self._output = None
+            self.supervisor.record_failure(e)
             return None
 
     def write_data(self, start_address, data):
-        """写入数据"""
+        """写入数据
+
+        隐式I/O连接有效时写入本地输出缓冲区，随下一个周期报文发出。
+        """
+        if not self.link_up:
+            return False
+
+        if self.io:
+            return self.io.write_output(start_address, bytes(data))
+
         try:
-            tag = f"B{start_address}"
-            result = self.driver.write(tag, data)
-            if hasattr(result, 'error'):
-                return result.error is None
-            else:
-                return True
+            # 组件数据只能整体写入：在本地副本上修改对应字节后一次写出
+            if self._output is None:
+                self._output = bytearray(self._get_assembly(self.output_assembly))
+            output = bytearray(self._output)
+            if start_address < 0 or start_address + len(data) > len(output):
+                self.logger.error(f"写入范围超出输出组件({len(output)}字节)")
+                return False
+            output[start_address:start_address + len(data)] = bytes(data)
+            self._set_assembly(self.output_assembly, output)
+            self._output = output
+            self.supervisor.record_success()
+            return True
         except Exception as e:
             self.logger.error(f"写入数据失败: {e}")
-            return False
\ No newline at end of file
+            # 写入结果未知，下次写入前重新读取
+            self._output = None
+            self.supervisor.record_failure(e)
+            return False
@@ -0,0 +1,336 @@
+"""EtherNet/IP隐式报文（Class 1循环I/O）"""
+import logging
+import random
+import socket
+import struct
+import threading
+import time
+from typing import Dict, Optional
+
+from pycomm3 import ClassCode, ConnectionManagerInstances, ConnectionManagerServices
+
+# 隐式I/O默认UDP端口
+IO_PORT = 2222
+
+# CPF项类型
+ITEM_SEQUENCED_ADDRESS = 0x8002
+ITEM_CONNECTED_DATA = 0x00B1
+
+# Forward Open参数
+PRIORITY_TICK_TIME = 0x0A
+TIMEOUT_TICKS = 0x0E
+TIMEOUT_MULTIPLIER = 0x01  # 连接超时 = RPI * 8
+TIMEOUT_FACTOR = 8
+TRANSPORT_CLASS1_CYCLIC = 0x01
+NET_PARAMS_P2P = 0x4000 | 0x0400  # 点对点, 高优先级, 定长
+ORIGINATOR_VENDOR_ID = 0x1337
+
+RUN_IDLE_RUN = 0x00000001
+
+
+class _IOEndpoint:
+    """本地UDP端点，按连接ID把收到的T->O报文分发给各连接
+
+    2222端口只能绑定一次，同一进程内的所有隐式连接共享一个端点。
+    """
+
+    _endpoints: Dict[int, '_IOEndpoint'] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, port: int):
+        self.port = port
+        self.logger = logging.getLogger(__name__)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(('', port))
+        self.sock.settimeout(0.1)
+        self.connections: Dict[int, 'ImplicitIOConnection'] = {}
+        self.running = True
+        self.thread = threading.Thread(target=self._receive_loop, daemon=True)
+        self.thread.start()
+
+    @classmethod
+    def acquire(cls, port: int, connection: 'ImplicitIOConnection') -> '_IOEndpoint':
+        """获取（必要时创建）端口对应的端点并注册连接"""
+        with cls._registry_lock:
+            endpoint = cls._endpoints.get(port)
+            if endpoint is None:
+                endpoint = cls(port)
+                cls._endpoints[port] = endpoint
+            endpoint.connections[connection.t_o_connection_id] = connection
+            return endpoint
+
+    @classmethod
+    def release(cls, port: int, connection: 'ImplicitIOConnection'):
+        """注销连接，最后一个连接注销时关闭端点"""
+        with cls._registry_lock:
+            endpoint = cls._endpoints.get(port)
+            if endpoint is None:
+                return
+            endpoint.connections.pop(connection.t_o_connection_id, None)
+            if not endpoint.connections:
+                endpoint.running = False
+                endpoint.thread.join(timeout=1)
+                endpoint.sock.close()
+                del cls._endpoints[port]
+
+    def send(self, packet: bytes, address):
+        """发送O->T报文"""
+        self.sock.sendto(packet, address)
+
+    def _receive_loop(self):
+        """接收循环"""
+        while self.running:
+            try:
+                packet, _ = self.sock.recvfrom(1500)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+
+            parsed = parse_io_packet(packet)
+            if parsed is None:
+                continue
+            connection_id, sequence, payload = parsed
+            connection = self.connections.get(connection_id)
+            if connection:
+                connection._on_input(sequence, payload)
+
+
+def build_io_packet(connection_id: int, sequence: int, payload: bytes) -> bytes:
+    """构造CPF格式的隐式I/O报文"""
+    return b''.join([
+        struct.pack('<H', 2),
+        struct.pack('<HHII', ITEM_SEQUENCED_ADDRESS, 8, connection_id, sequence),
+        struct.pack('<HH', ITEM_CONNECTED_DATA, len(payload)),
+        payload,
+    ])
+
+
+def parse_io_packet(packet: bytes) -> Optional[tuple]:
+    """解析隐式I/O报文
+
+    Returns:
+        (连接ID, 封装序号, 已连接数据)，格式不符返回None
+    """
+    if len(packet) < 18:
+        return None
+    item_count, addr_type, addr_len, connection_id, sequence = struct.unpack_from('<HHHII', packet, 0)
+    if item_count < 2 or addr_type != ITEM_SEQUENCED_ADDRESS or addr_len != 8:
+        return None
+    data_type, data_len = struct.unpack_from('<HH', packet, 14)
+    if data_type != ITEM_CONNECTED_DATA or len(packet) < 18 + data_len:
+        return None
+    return connection_id, sequence, packet[18:18 + data_len]
+
+
+class ImplicitIOConnection:
+    """Class 1循环I/O连接
+
+    通过Forward Open建立到网关I/O组件的连接，之后按RPI周期
+    在UDP 2222上交换生产者/消费者组件数据。最新的输入映像保存在本地缓冲区，
+    读取不需要网络往返；输出写入本地缓冲区，随下一个周期报文发出。
+    """
+
+    def __init__(self, driver, ip_address: str, input_size: int, output_size: int,
+                 input_assembly: int = 100, output_assembly: int = 150,
+                 config_assembly: int = 1, rpi: float = 10.0, port: int = IO_PORT,
+                 target_port: Optional[int] = None):
+        """
+        Args:
+            driver: 已打开会话的CIPDriver
+            ip_address: 网关IP地址
+            input_size: 输入组件（T->O）字节数
+            output_size: 输出组件（O->T）字节数
+            input_assembly: 输入组件实例号
+            output_assembly: 输出组件实例号
+            config_assembly: 配置组件实例号
+            rpi: 请求数据包间隔（毫秒）
+            port: 本地UDP端口
+            target_port: 网关UDP端口，None表示与本地端口相同
+        """
+        self.driver = driver
+        self.ip_address = ip_address
+        self.input_size = input_size
+        self.output_size = output_size
+        self.input_assembly = input_assembly
+        self.output_assembly = output_assembly
+        self.config_assembly = config_assembly
+        self.rpi = rpi
+        self.port = port
+        self.target_port = port if target_port is None else target_port
+        self.logger = logging.getLogger(__name__)
+
+        self.o_t_connection_id = 0
+        self.t_o_connection_id = random.getrandbits(32)
+        self.connection_serial = random.getrandbits(16)
+        self.originator_serial = random.getrandbits(32)
+
+        self._lock = threading.Lock()
+        self._input = bytearray(input_size)
+        self._output = bytearray(output_size)
+        self.input_timestamp = 0.0
+        self.input_sequence = 0
+        self.packets_received = 0
+        self.packets_sent = 0
+
+        self._endpoint: Optional[_IOEndpoint] = None
+        self._sender: Optional[threading.Thread] = None
+        self.running = False
+
+    @property
+    def alive(self) -> bool:
+        """连接是否有效（在超时时间内收到过输入数据）"""
+        if not self.running or not self.input_timestamp:
+            return False
+        timeout = self.rpi * TIMEOUT_FACTOR / 1000.0
+        return time.monotonic() - self.input_timestamp < timeout
+
+    def _connection_path(self) -> bytes:
+        """配置组件、消费点（输出）、生产点（输入）的连接路径"""
+        path = bytes([0x20, 0x04, 0x24, self.config_assembly,
+                      0x2C, self.output_assembly,
+                      0x2C, self.input_assembly])
+        return bytes([len(path) // 2]) + path
+
+    def open(self) -> bool:
+        """发送Forward Open并启动循环收发"""
+        rpi_us = int(self.rpi * 1000)
+        # O->T数据带2字节序号和4字节运行/空闲头，T->O只带2字节序号
+        o_t_params = NET_PARAMS_P2P | ((self.output_size + 6) & 0x01FF)
+        t_o_params = NET_PARAMS_P2P | ((self.input_size + 2) & 0x01FF)
+
+        request = b''.join([
+            struct.pack('<BB', PRIORITY_TICK_TIME, TIMEOUT_TICKS),
+            struct.pack('<II', 0, self.t_o_connection_id),
+            struct.pack('<HHI', self.connection_serial, ORIGINATOR_VENDOR_ID, self.originator_serial),
+            struct.pack('<B3x', TIMEOUT_MULTIPLIER),
+            struct.pack('<IH', rpi_us, o_t_params),
+            struct.pack('<IH', rpi_us, t_o_params),
+            struct.pack('<B', TRANSPORT_CLASS1_CYCLIC),
+        ])
+
+        try:
+            # 连接路径作为route_path附在请求数据之后
+            response = self.driver.generic_message(
+                service=ConnectionManagerServices.forward_open,
+                class_code=ClassCode.connection_manager,
+                instance=ConnectionManagerInstances.open_request,
+                request_data=request,
+                route_path=self._connection_path(),
+                connected=False,
+                name='class1_forward_open',
+            )
+        except Exception as e:
+            self.logger.error(f"Forward Open失败: {e}")
+            return False
+
+        if not response or response.error or not response.value or len(response.value) < 8:
+            self.logger.error(f"Forward Open失败: {getattr(response, 'error', None)}")
+            return False
+
+        self.o_t_connection_id, t_o_id = struct.unpack_from('<II', response.value, 0)
+        self.t_o_connection_id = t_o_id or self.t_o_connection_id
+
+        try:
+            self._endpoint = _IOEndpoint.acquire(self.port, self)
+        except OSError as e:
+            self.logger.error(f"无法绑定UDP端口{self.port}: {e}")
+            return False
+
+        self.running = True
+        self._sender = threading.Thread(target=self._send_loop, daemon=True)
+        self._sender.start()
+        self.logger.info(f"隐式I/O连接已建立: RPI={self.rpi}ms, "
+                         f"O->T CID={self.o_t_connection_id:#010x}, T->O CID={self.t_o_connection_id:#010x}")
+        return True
+
+    def close(self):
+        """停止循环收发并发送Forward Close"""
+        if not self.running:
+            return
+        self.running = False
+        if self._sender:
+            self._sender.join(timeout=1)
+        if self._endpoint:
+            _IOEndpoint.release(self.port, self)
+            self._endpoint = None
+
+        request = b''.join([
+            struct.pack('<BB', PRIORITY_TICK_TIME, TIMEOUT_TICKS),
+            struct.pack('<HHI', self.connection_serial, ORIGINATOR_VENDOR_ID, self.originator_serial),
+        ])
+        path = self._connection_path()
+        try:
+            self.driver.generic_message(
+                service=ConnectionManagerServices.forward_close,
+                class_code=ClassCode.connection_manager,
+                instance=ConnectionManagerInstances.open_request,
+                request_data=request,
+                route_path=path[:1] + b'\x00' + path[1:],
+                connected=False,
+                name='class1_forward_close',
+            )
+        except Exception as e:
+            self.logger.warning(f"Forward Close失败: {e}")
+        self.logger.info("隐式I/O连接已关闭")
+
+    def read_input(self, offset: int, length: int) -> Optional[bytes]:
+        """从本地输入缓冲区读取，不访问网络"""
+        if not self.alive or offset < 0 or offset + length > self.input_size:
+            return None
+        with self._lock:
+            return bytes(self._input[offset:offset + length])
+
+    def read_output(self, offset: int, length: int) -> Optional[bytes]:
+        """读取本地输出缓冲区"""
+        if offset < 0 or offset + length > self.output_size:
+            return None
+        with self._lock:
+            return bytes(self._output[offset:offset + length])
+
+    def write_output(self, offset: int, data: bytes) -> bool:
+        """写入本地输出缓冲区，随下一个周期报文发出"""
+        if not self.running or offset < 0 or offset + len(data) > self.output_size:
+            return False
+        with self._lock:
+            self._output[offset:offset + len(data)] = data
+        return True
+
+    def _on_input(self, sequence: int, payload: bytes):
+        """收到T->O报文（在端点接收线程中调用）"""
+        if len(payload) < 2:
+            return
+        data = payload[2:2 + self.input_size]
+        with self._lock:
+            self._input[:len(data)] = data
+            self.input_sequence = sequence
+            self.input_timestamp = time.monotonic()
+            self.packets_received += 1
+
+    def _send_loop(self):
+        """按RPI周期发送O->T报文"""
+        period = self.rpi / 1000.0
+        address = (self.ip_address, self.target_port)
+        encap_sequence = 0
+        cip_sequence = 0
+        deadline = time.monotonic()
+
+        while self.running:
+            encap_sequence = (encap_sequence + 1) & 0xFFFFFFFF
+            cip_sequence = (cip_sequence + 1) & 0xFFFF
+            with self._lock:
+                payload = struct.pack('<HI', cip_sequence, RUN_IDLE_RUN) + bytes(self._output)
+            try:
+                self._endpoint.send(build_io_packet(self.o_t_connection_id, encap_sequence, payload), address)
+                self.packets_sent += 1
+            except OSError as e:
+                self.logger.error(f"隐式I/O发送失败: {e}")
+
+            deadline += period
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # 落后超过一个周期时不补发，从当前时刻重新计时
+                deadline = time.monotonic()
@@ -0,0 +1,162 @@
+"""串行化I/O通道"""
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional
+
+
+class IOChannel:
+    """串行化I/O通道
+
+    所有对通信驱动的访问都提交到同一个I/O线程按顺序执行，
+    任意线程提交操作后通过Future取得结果，驱动本身不会被并发调用。
+    """
+
+    def __init__(self, name: str = 'rec-io'):
+        self.name = name
+        self.logger = logging.getLogger(__name__)
+        self._queue: 'queue.Queue' = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        # 已开始执行的操作数，只增不减。提交操作之前读到的值小于等于该操作
+        # 开始时的值：读到n之后提交的读取，一定在前n个操作之后执行
+        self.ordinal = 0
+        self.reset_statistics()
+
+    def start(self):
+        """启动I/O线程（已启动时忽略）"""
+        with self._start_lock:
+            self._start_locked()
+
+    def _start_locked(self):
+        """启动I/O线程（需持有_start_lock）"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        """处理完已提交的操作后停止I/O线程"""
+        with self._start_lock:
+            thread = self._thread
+            if not thread or not thread.is_alive():
+                return
+            self._queue.put(None)
+        if threading.current_thread() is not thread:
+            thread.join(timeout=timeout)
+
+    def in_channel_thread(self) -> bool:
+        """当前线程是否为I/O线程"""
+        return threading.current_thread() is self._thread
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """提交一个操作，返回Future"""
+        future = Future()
+        if self.in_channel_thread():
+            # 在I/O线程内部嵌套调用时直接执行，避免自身等待造成死锁
+            self._execute(func, args, kwargs, future, time.monotonic())
+            return future
+
+        # 入队与I/O线程退出判断在同一把锁下进行：停止信号之后提交的操作
+        # 要么由尚未退出的I/O线程继续执行，要么由新启动的线程执行，不会被遗漏
+        with self._start_lock:
+            self._start_locked()
+            self._queue.put((func, args, kwargs, future, time.monotonic()))
+        with self._stats_lock:
+            self._max_queue_depth = max(self._max_queue_depth, self._queue.qsize())
+        return future
+
+    def call(self, func: Callable, *args, **kwargs):
+        """提交操作并等待结果，操作抛出的异常在调用线程重新抛出"""
+        return self.submit(func, *args, **kwargs).result()
+
+    def _run(self):
+        """I/O线程"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                with self._start_lock:
+                    if self._queue.empty():
+                        self._thread = None
+                        break
+                    # 停止信号之后又有提交，执行完这些操作再停止
+                    self._queue.put(None)
+                continue
+            func, args, kwargs, future, submitted = item
+            self._execute(func, args, kwargs, future, submitted)
+
+    def _execute(self, func, args, kwargs, future: Future, submitted: float):
+        if not future.set_running_or_notify_cancel():
+            return
+
+        self.ordinal += 1
+        started = time.monotonic()
+        error = None
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            error = e
+        finished = time.monotonic()
+
+        with self._stats_lock:
+            self._operations += 1
+            self._errors += error is not None
+            self._busy_time += finished - started
+            self._total_latency += finished - submitted
+            self._max_latency = max(self._max_latency, finished - submitted)
+
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def reset_statistics(self):
+        """清零统计"""
+        with self._stats_lock:
+            self._stats_start = time.monotonic()
+            self._operations = 0
+            self._errors = 0
+            self._busy_time = 0.0
+            self._total_latency = 0.0
+            self._max_latency = 0.0
+            self._max_queue_depth = 0
+
+    def statistics(self) -> Dict:
+        """吞吐量统计
+
+        Returns:
+            operations: 完成的操作数
+            errors: 抛出异常的操作数
+            throughput: 每秒操作数
+            utilization: I/O线程忙碌时间占比
+            avg_service_ms: 平均执行时间
+            avg_latency_ms: 平均提交到完成时间（含排队）
+            max_latency_ms: 最大提交到完成时间
+            queue_depth: 当前排队数
+            max_queue_depth: 最大排队数
+        """
+        with self._stats_lock:
+            elapsed = max(time.monotonic() - self._stats_start, 1e-9)
+            operations = self._operations
+            return {
+                'operations': operations,
+                'errors': self._errors,
+                'throughput': operations / elapsed,
+                'utilization': self._busy_time / elapsed,
+                'avg_service_ms': self._busy_time / operations * 1000 if operations else 0.0,
+                'avg_latency_ms': self._total_latency / operations * 1000 if operations else 0.0,
+                'max_latency_ms': self._max_latency * 1000,
+                'queue_depth': self._queue.qsize(),
+                'max_queue_depth': self._max_queue_depth,
+            }
+
+    def report(self) -> str:
+        """统计摘要文本"""
+        stats = self.statistics()
+        return (f"I/O通道 {self.name}: {stats['operations']}次操作, "
+                f"{stats['throughput']:.1f}次/秒, 利用率{stats['utilization']:.0%}, "
+                f"平均执行{stats['avg_service_ms']:.2f}ms, 平均延迟{stats['avg_latency_ms']:.2f}ms, "
+                f"最大排队{stats['max_queue_depth']}")
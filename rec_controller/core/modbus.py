@@ -0,0 +1,88 @@
+"""Modbus RTU协议工具"""
+from typing import Tuple, Union
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def _build_crc_table() -> Tuple[int, ...]:
+    """生成CRC16（多项式0xA001，反射）查表"""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 0x0001:
+                crc = (crc >> 1) ^ 0xA001
+            else:
+                crc >>= 1
+        table.append(crc)
+    return tuple(table)
+
+
+CRC16_TABLE = _build_crc_table()
+
+
+def crc16(data: BytesLike, crc: int = 0xFFFF) -> int:
+    """计算Modbus CRC16
+
+    直接遍历bytes/bytearray/memoryview，不复制数据。
+    传入上一段的结果作为crc可以分段累计计算。
+    """
+    if isinstance(data, memoryview) and data.format != 'B':
+        data = data.cast('B')
+
+    table = CRC16_TABLE
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
+
+def check_crc(frame: BytesLike) -> bool:
+    """校验带CRC的完整帧
+
+    对包含CRC字段（低字节在前）的整帧计算CRC，结果为0即校验通过，
+    不需要切片取出CRC字段单独比较。
+    """
+    return len(frame) >= 3 and crc16(frame) == 0
+
+
+def append_crc(frame: BytesLike) -> bytes:
+    """在帧末尾追加CRC（低字节在前）"""
+    return bytes(frame) + crc16(frame).to_bytes(2, 'little')
+
+
+# 读类功能码：应答为 从站 功能码 字节数 数据... CRC
+READ_FUNCTIONS = (0x01, 0x02, 0x03, 0x04)
+# 写类功能码：应答为固定8字节回显
+WRITE_FUNCTIONS = (0x05, 0x06, 0x0F, 0x10)
+# 先读取的帧头长度（从站、功能码、字节数/异常码），也是最短应答帧的前缀
+RESPONSE_HEADER_LENGTH = 3
+
+
+def remaining_response_length(header: BytesLike) -> int:
+    """根据应答帧头推算剩余字节数
+
+    Args:
+        header: 应答的前3个字节
+
+    Returns:
+        剩余字节数（含CRC），功能码无法识别时返回-1
+    """
+    function = header[1]
+    if function & 0x80:
+        # 异常应答：从站 功能码|0x80 异常码 CRC
+        return 2
+    if function in READ_FUNCTIONS:
+        return header[2] + 2
+    if function in WRITE_FUNCTIONS:
+        return 8 - RESPONSE_HEADER_LENGTH
+    return -1
+
+
+def silent_interval(baudrate: int) -> float:
+    """帧间静止时间（3.5个字符，秒）
+
+    按每字符11位计算；波特率高于19200时使用协议规定的固定值1.75ms。
+    """
+    if baudrate > 19200:
+        return 0.00175
+    return 3.5 * 11 / baudrate
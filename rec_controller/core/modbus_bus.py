@@ -0,0 +1,175 @@
+"""RS-485多站Modbus RTU总线调度"""
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Deque, Dict, Optional, Tuple
+
+from .modbus import append_crc, check_crc
+from .serial_comm import SerialClient
+
+
+class ModbusRTUBus:
+    """多站总线调度器
+
+    一个串口只由一个总线对象持有，所有挂在这条RS-485线上的从站
+    （多个级联的REC网关）都通过它收发。写请求优先执行，读请求按从站
+    轮询，保证一个从站的大量轮询不会饿死其它从站。
+    """
+
+    _buses: Dict[str, 'ModbusRTUBus'] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, port: str, baudrate: int = 115200, timeout: float = 1.0):
+        self.client = SerialClient(port, baudrate, timeout)
+        self.logger = logging.getLogger(__name__)
+
+        self._condition = threading.Condition()
+        self._writes: Deque[Tuple[int, bytes, Future]] = deque()
+        self._reads: Dict[int, Deque[Tuple[int, bytes, Future]]] = {}
+        self._slave_order: Deque[int] = deque()
+        self._users = 0
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.transactions = 0
+        self.errors = 0
+
+    @classmethod
+    def shared(cls, port: str, baudrate: int = 115200, timeout: float = 1.0) -> 'ModbusRTUBus':
+        """获取串口对应的共享总线，不存在时创建"""
+        with cls._registry_lock:
+            bus = cls._buses.get(port)
+            if bus is None:
+                bus = cls(port, baudrate, timeout)
+                cls._buses[port] = bus
+            elif bus.client.baudrate != baudrate:
+                bus.logger.warning(f"串口{port}已按{bus.client.baudrate}bps打开，忽略波特率{baudrate}")
+            return bus
+
+    @property
+    def port(self) -> str:
+        return self.client.port
+
+    def attach(self) -> bool:
+        """登记一个使用者，第一个使用者登记时打开串口并启动调度线程"""
+        with self._condition:
+            if self._users == 0:
+                if not self.client.connect():
+                    return False
+                self._running = True
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._users += 1
+            return True
+
+    def detach(self):
+        """注销一个使用者，最后一个使用者注销时停止调度并关闭串口"""
+        with self._condition:
+            if self._users == 0:
+                return
+            self._users -= 1
+            if self._users > 0:
+                return
+            self._running = False
+            self._condition.notify_all()
+            thread = self._thread
+
+        if thread:
+            thread.join(timeout=self.client.timeout + 1)
+        self.client.disconnect()
+
+    def submit(self, slave_id: int, pdu: bytes, write: bool = False) -> Future:
+        """提交一个请求
+
+        Args:
+            slave_id: 从站地址
+            pdu: 功能码加数据（不含从站地址和CRC）
+            write: 是否为写请求（优先调度）
+
+        Returns:
+            Future，结果为CRC校验通过的完整应答帧，失败为None
+        """
+        future = Future()
+        with self._condition:
+            if not self._running:
+                future.set_result(None)
+                return future
+
+            request = (slave_id, pdu, future)
+            if write:
+                self._writes.append(request)
+            else:
+                if slave_id not in self._reads:
+                    self._reads[slave_id] = deque()
+                    self._slave_order.append(slave_id)
+                self._reads[slave_id].append(request)
+            self._condition.notify()
+        return future
+
+    def request(self, slave_id: int, pdu: bytes, write: bool = False) -> Optional[bytes]:
+        """提交请求并等待应答"""
+        return self.submit(slave_id, pdu, write).result()
+
+    def pending(self) -> int:
+        """排队中的请求数"""
+        with self._condition:
+            return len(self._writes) + sum(len(q) for q in self._reads.values())
+
+    def _next_request(self) -> Optional[Tuple[int, bytes, Future]]:
+        """取出下一个请求：写请求优先，读请求按从站轮询（需持有锁）"""
+        if self._writes:
+            return self._writes.popleft()
+
+        for _ in range(len(self._slave_order)):
+            slave_id = self._slave_order[0]
+            self._slave_order.rotate(-1)
+            queue = self._reads[slave_id]
+            if queue:
+                return queue.popleft()
+        return None
+
+    def _run(self):
+        """调度线程"""
+        while True:
+            with self._condition:
+                request = self._next_request()
+                while request is None and self._running:
+                    self._condition.wait()
+                    request = self._next_request()
+                if not self._running:
+                    break
+
+            slave_id, pdu, future = request
+            future.set_result(self._transact(slave_id, pdu))
+
+        # 停止时未执行的请求全部以失败结束
+        with self._condition:
+            pending = list(self._writes)
+            self._writes.clear()
+            for queue in self._reads.values():
+                pending.extend(queue)
+                queue.clear()
+        if request is not None:
+            pending.append(request)
+        for _, _, future in pending:
+            if not future.done():
+                future.set_result(None)
+
+    def _transact(self, slave_id: int, pdu: bytes) -> Optional[bytes]:
+        """执行一次请求/应答事务"""
+        self.transactions += 1
+        try:
+            response = self.client.query(append_crc(bytes([slave_id]) + pdu))
+        except Exception as e:
+            self.logger.error(f"从站{slave_id}通信失败: {e}")
+            response = None
+
+        if not response or not check_crc(response) or response[0] != slave_id:
+            self.errors += 1
+            return None
+        if response[1] & 0x80:
+            self.errors += 1
+            self.logger.warning(f"从站{slave_id}异常应答: 功能码{response[1]:#04x} 异常码{response[2]}")
+            return None
+        return response
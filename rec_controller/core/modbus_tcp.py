@@ -0,0 +1,189 @@
+"""Modbus TCP通信模块"""
+import logging
+import socket
+import struct
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Dict, List, Optional
+
+MODBUS_TCP_PORT = 502
+MBAP_HEADER = struct.Struct('>HHHB')  # 事务ID, 协议ID, 长度, 单元ID
+
+
+class ModbusTCPClient:
+    """Modbus TCP客户端
+
+    使用一条持久连接，每个请求分配MBAP事务ID，应答由接收线程按事务ID
+    分发，因此可以同时有多个请求在途（流水线），不必逐个等待往返。
+    """
+
+    def __init__(self, ip_address: str, port: int = MODBUS_TCP_PORT, unit_id: int = 1,
+                 timeout: float = 3.0, max_in_flight: int = 8):
+        """
+        Args:
+            ip_address: 网关IP地址
+            port: TCP端口
+            unit_id: 单元ID
+            timeout: 连接和应答超时(秒)
+            max_in_flight: 最大在途请求数
+        """
+        self.ip_address = ip_address
+        self.port = port
+        self.unit_id = unit_id
+        self.timeout = timeout
+        self.max_in_flight = max_in_flight
+        self.logger = logging.getLogger(__name__)
+
+        self.sock: Optional[socket.socket] = None
+        self.connected = False
+        self._send_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending: Dict[int, Future] = {}
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._transaction_id = 0
+        self._reader: Optional[threading.Thread] = None
+
+    def connect(self) -> bool:
+        """建立连接"""
+        try:
+            self.sock = socket.create_connection((self.ip_address, self.port), timeout=self.timeout)
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.sock.settimeout(None)
+        except OSError as e:
+            self.logger.error(f"Modbus TCP连接失败: {e}")
+            return False
+
+        self.connected = True
+        self._reader = threading.Thread(target=self._receive_loop, daemon=True)
+        self._reader.start()
+        self.logger.info(f"成功连接到Modbus TCP网关: {self.ip_address}:{self.port}")
+        return True
+
+    def disconnect(self):
+        """断开连接"""
+        if not self.sock:
+            return
+        self.connected = False
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+        if self._reader:
+            self._reader.join(timeout=1)
+        self.sock = None
+        self._fail_pending()
+        self.logger.info("Modbus TCP断开连接")
+
+    def submit(self, pdu: bytes, unit_id: Optional[int] = None) -> Future:
+        """发送请求，不等待应答
+
+        在途请求达到上限时阻塞，直到有应答返回。
+
+        Args:
+            pdu: 功能码加数据
+            unit_id: 单元ID，None使用默认值
+
+        Returns:
+            Future，结果为应答PDU，失败为None
+        """
+        future = Future()
+        if not self.connected:
+            future.set_result(None)
+            return future
+
+        if not self._in_flight.acquire(timeout=self.timeout):
+            self.logger.error("Modbus TCP在途请求已满")
+            future.set_result(None)
+            return future
+
+        with self._pending_lock:
+            self._transaction_id = (self._transaction_id + 1) & 0xFFFF
+            transaction_id = self._transaction_id
+            self._pending[transaction_id] = future
+
+        unit = self.unit_id if unit_id is None else unit_id
+        frame = MBAP_HEADER.pack(transaction_id, 0, len(pdu) + 1, unit) + pdu
+        try:
+            with self._send_lock:
+                self.sock.sendall(frame)
+        except OSError as e:
+            self.logger.error(f"Modbus TCP发送失败: {e}")
+            self._complete(transaction_id, None)
+        return future
+
+    def request(self, pdu: bytes, unit_id: Optional[int] = None) -> Optional[bytes]:
+        """发送请求并等待应答PDU"""
+        return self.wait(self.submit(pdu, unit_id))
+
+    def request_many(self, pdus: List[bytes], unit_id: Optional[int] = None) -> List[Optional[bytes]]:
+        """流水线发送多个请求，按顺序返回应答PDU"""
+        futures = [self.submit(pdu, unit_id) for pdu in pdus]
+        return [self.wait(future) for future in futures]
+
+    def wait(self, future: Future) -> Optional[bytes]:
+        """等待 submit 返回的应答，超时后放弃该事务"""
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            with self._pending_lock:
+                for transaction_id, pending in list(self._pending.items()):
+                    if pending is future:
+                        self._complete_locked(transaction_id, None)
+                        break
+            self.logger.error("Modbus TCP应答超时")
+            return None
+
+    def _complete(self, transaction_id: int, pdu: Optional[bytes]):
+        with self._pending_lock:
+            self._complete_locked(transaction_id, pdu)
+
+    def _complete_locked(self, transaction_id: int, pdu: Optional[bytes]):
+        """结束一个事务并释放在途名额（需持有_pending_lock）"""
+        future = self._pending.pop(transaction_id, None)
+        if future is None:
+            return
+        self._in_flight.release()
+        if not future.done():
+            future.set_result(pdu)
+
+    def _fail_pending(self):
+        """连接断开时结束全部在途请求"""
+        with self._pending_lock:
+            for transaction_id in list(self._pending):
+                self._complete_locked(transaction_id, None)
+
+    def _recv_exact(self, length: int) -> Optional[bytes]:
+        data = bytearray()
+        while len(data) < length:
+            chunk = self.sock.recv(length - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return bytes(data)
+
+    def _receive_loop(self):
+        """接收线程：按事务ID分发应答"""
+        while self.connected:
+            try:
+                header = self._recv_exact(MBAP_HEADER.size)
+                if header is None:
+                    break
+                transaction_id, protocol_id, length, _ = MBAP_HEADER.unpack(header)
+                pdu = self._recv_exact(length - 1)
+                if pdu is None:
+                    break
+            except OSError:
+                break
+
+            if protocol_id != 0:
+                continue
+            if pdu and pdu[0] & 0x80:
+                self.logger.warning(f"Modbus异常应答: 功能码{pdu[0]:#04x} 异常码{pdu[1] if len(pdu) > 1 else None}")
+                pdu = None
+            self._complete(transaction_id, pdu)
+
+        if self.connected:
+            self.logger.error("Modbus TCP连接已断开")
+            self.connected = False
+        self._fail_pending()
@@ -0,0 +1,231 @@
+"""网关输入过程映像"""
+import struct
+import time
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterator, Optional
+import numpy as np
+
+# 输入映像布局（字节地址）
+GATEWAY_STATUS_OFFSET = 0
+AXIS_STATUS_OFFSET = 4
+AXES_PER_UNIT = 4
+BYTES_PER_AXIS_STATUS = 2
+BYTES_PER_UNIT_STATUS = AXES_PER_UNIT * BYTES_PER_AXIS_STATUS
+
+
+def input_image_size(unit_count: int) -> int:
+    """网关状态字加全部单元轴状态字的总字节数"""
+    return AXIS_STATUS_OFFSET + unit_count * BYTES_PER_UNIT_STATUS
+
+
+def axis_status_offset(unit_index: int, axis_index: int) -> int:
+    """轴状态字的字节地址"""
+    return AXIS_STATUS_OFFSET + unit_index * BYTES_PER_UNIT_STATUS + axis_index * BYTES_PER_AXIS_STATUS
+
+
+# 轴状态字的标志位
+AXIS_STATUS_FLAGS = {
+    'ready': 0x0001,      # 准备就绪
+    'busy': 0x0002,       # 忙碌
+    'done': 0x0004,       # 完成
+    'alarm': 0x0008,      # 报警
+    'error': 0x0010,      # 错误
+}
+
+# 批量解码结果的结构化类型，每个轴一条记录
+AXIS_STATUS_DTYPE = np.dtype(
+    [('unit', 'u1'), ('axis', 'u1'), ('word', '<u2')]
+    + [(name, '?') for name in AXIS_STATUS_FLAGS]
+    + [('position', 'u1'), ('status_code', 'u1')]
+)
+
+
+class StatusRecord(Mapping):
+    """状态字记录
+
+    只保存一个整数状态字，各字段在访问时才从位域解码；不可变，
+    相等比较和哈希只比较状态字，适合做变化检测。同时实现只读映射接口，
+    status['ready']、status.get()、items() 等原有字典用法保持可用。
+    """
+
+    __slots__ = ('word',)
+
+    # 子类定义：字段名 -> 解码函数
+    FIELDS: Dict[str, Callable[[int], object]] = {}
+
+    def __init__(self, word: int):
+        object.__setattr__(self, 'word', word)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} 不可修改")
+
+    def __reduce__(self):
+        return type(self), (self.word,)
+
+    def __getitem__(self, key: str):
+        try:
+            decode = self.FIELDS[key]
+        except KeyError:
+            raise KeyError(key) from None
+        return decode(self.word)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def __eq__(self, other):
+        if type(other) is type(self):
+            return self.word == other.word
+        return Mapping.__eq__(self, other)
+
+    def __hash__(self):
+        return hash((type(self), self.word))
+
+    def __repr__(self):
+        return f"{type(self).__name__}(0x{self.word:04X}, {dict(self.items())})"
+
+    def to_dict(self) -> Dict:
+        """转换为普通字典"""
+        return dict(self.items())
+
+
+def _flag(mask: int, inverted: bool = False) -> Callable[[int], bool]:
+    if inverted:
+        return lambda word: not word & mask
+    return lambda word: bool(word & mask)
+
+
+def _add_properties(cls):
+    """为每个字段生成只读属性（status.ready 与 status['ready'] 等价）"""
+    for name, decode in cls.FIELDS.items():
+        setattr(cls, name, property(lambda self, decode=decode: decode(self.word)))
+    return cls
+
+
+@_add_properties
+class GatewayStatus(StatusRecord):
+    """网关状态"""
+
+    __slots__ = ()
+
+    FIELDS = {
+        'almh': _flag(0x8000, inverted=True),   # 重故障（bit15为0）
+        'mod': _flag(0x2000),                   # 手动模式
+        'estp': _flag(0x1000),                  # 急停
+        'alarm_code': lambda word: word & 0xFF,
+    }
+
+
+@_add_properties
+class AxisStatus(StatusRecord):
+    """轴状态"""
+
+    __slots__ = ()
+
+    FIELDS = {
+        **{name: _flag(mask) for name, mask in AXIS_STATUS_FLAGS.items()},
+        'position': lambda word: (word & 0xFF00) >> 8,   # 位置信息（高8位）
+        'status_code': lambda word: word & 0x00FF,       # 状态码（低8位）
+    }
+
+
+def decode_gateway_status(status_word: int) -> GatewayStatus:
+    """解码网关状态字"""
+    return GatewayStatus(status_word)
+
+
+def decode_axis_status(status_word: int) -> AxisStatus:
+    """解码轴状态字"""
+    return AxisStatus(status_word)
+
+
+def decode_axes(data: bytes, unit_count: int) -> np.ndarray:
+    """批量解码全部轴状态字
+
+    直接把输入映像中的轴状态区映射为uint16数组，用向量运算一次取出所有标志位，
+    不为每个轴构造字典。
+
+    Args:
+        data: 输入过程映像原始字节
+        unit_count: 单元数，超出映像范围的单元不解码
+
+    Returns:
+        结构化数组（AXIS_STATUS_DTYPE），按单元、轴顺序排列
+    """
+    available = max(0, (len(data) - AXIS_STATUS_OFFSET) // BYTES_PER_AXIS_STATUS)
+    count = min(unit_count * AXES_PER_UNIT, available)
+    words = np.frombuffer(data, dtype='<u2', count=count, offset=AXIS_STATUS_OFFSET) \
+        if count else np.empty(0, dtype='<u2')
+
+    axes = np.empty(count, dtype=AXIS_STATUS_DTYPE)
+    index = np.arange(count)
+    axes['unit'] = index // AXES_PER_UNIT
+    axes['axis'] = index % AXES_PER_UNIT
+    axes['word'] = words
+    for name, mask in AXIS_STATUS_FLAGS.items():
+        axes[name] = (words & mask) != 0
+    axes['position'] = words >> 8
+    axes['status_code'] = words & 0x00FF
+    return axes
+
+
+class ProcessImage:
+    """输入过程映像快照
+
+    一次连续读取网关状态字和所有单元的轴状态字，
+    之后网关状态和轴状态都从这块缓冲区本地解码，不再访问总线。
+    """
+
+    def __init__(self, data: bytes, unit_count: int, timestamp: Optional[float] = None,
+                 ordinal: int = 0):
+        """
+        Args:
+            data: 输入块数据
+            unit_count: 单元数
+            timestamp: 读取时间，None为当前时间
+            ordinal: 发出读取前I/O通道的操作序号（IOChannel.ordinal），
+                读取一定晚于序号以内的所有操作
+        """
+        self.data = bytes(data)
+        self.unit_count = unit_count
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.ordinal = ordinal
+        self._axes: Optional[np.ndarray] = None
+
+    def word(self, offset: int) -> Optional[int]:
+        """读取指定字节地址处的状态字，超出映像范围返回None"""
+        if offset < 0 or offset + 2 > len(self.data):
+            return None
+        return struct.unpack_from('<H', self.data, offset)[0]
+
+    def gateway_status(self) -> Optional[GatewayStatus]:
+        """解码网关状态"""
+        status_word = self.word(GATEWAY_STATUS_OFFSET)
+        if status_word is None:
+            return None
+        return decode_gateway_status(status_word)
+
+    def axis_status(self, unit_index: int, axis_index: int) -> Optional[AxisStatus]:
+        """解码轴状态，单元不在映像内时返回None"""
+        if not 0 <= unit_index < self.unit_count or not 0 <= axis_index < AXES_PER_UNIT:
+            return None
+        status_word = self.word(axis_status_offset(unit_index, axis_index))
+        if status_word is None:
+            return None
+        return decode_axis_status(status_word)
+
+    def axes(self) -> np.ndarray:
+        """批量解码所有轴状态，返回结构化数组（结果缓存，快照不可变）"""
+        if self._axes is None:
+            self._axes = decode_axes(self.data, self.unit_count)
+        return self._axes
+
+    def all_axes_status(self) -> Dict[str, Optional[AxisStatus]]:
+        """解码所有轴状态，键为 unit{n}_axis{m}"""
+        status = {}
+        for unit in range(self.unit_count):
+            for axis in range(AXES_PER_UNIT):
+                status[f"unit{unit}_axis{axis}"] = self.axis_status(unit, axis)
+        return status
@@ -1,9 +1,18 @@
 """REC控制器类 - 支持串口和网络通信"""
 import struct
 import time
-from typing import List, Dict, Optional, Union
+from typing import Callable, List, Dict, Optional, Tuple, Union
 from .ethernet_ip import EtherNetIPClient
-from .serial_comm import SerialClient
+from .modbus_bus import ModbusRTUBus
+from .modbus_tcp import ModbusTCPClient, MODBUS_TCP_PORT
+from .process_image import (ProcessImage, GatewayStatus, AxisStatus, input_image_size,
+                            axis_status_offset, decode_gateway_status, decode_axis_status)
+from .implicit_io import IO_PORT
+from .modbus import crc16, check_crc
+from .io_channel import IOChannel
+from .connection_supervisor import ConnectionSupervisor
+from .status_poller import StatusPoller
+from utils.clock import REAL_CLOCK
 
 class RECController:
     """REC控制器主类"""
@@ -11,49 +20,170 @@ class RECController:
     # 通信类型
     COMM_SERIAL = 'serial'
     COMM_ETHERNET_IP = 'ethernet_ip'
+    COMM_MODBUS_TCP = 'modbus_tcp'
 
     # 根据文档定义的地址偏移
     GATEWAY_STATUS_OFFSET = 0
     UNIT_BASE_OFFSET = 2
     BYTES_PER_UNIT = 2
 
+    # 控制字中每个轴占4位，命令对应的位偏移
+    COMMAND_BITS = {'ST0': 0, 'ST1': 1, 'RES': 2}
+
     def __init__(self, comm_type: str = COMM_SERIAL, **kwargs):
         """
         Args:
-            comm_type: 通信类型 ('serial' 或 'ethernet_ip')
+            comm_type: 通信类型 ('serial'、'ethernet_ip' 或 'modbus_tcp')
             **kwargs:
-                串口模式: port, baudrate
-                网络模式: ip_address, unit_count
+                通用: clock（状态等待使用的时钟，默认真实时钟）
+                串口模式: port, baudrate, unit_count, slave_id, bus
+                网络模式: ip_address, unit_count, implicit_io, rpi,
+                    input_assembly, output_assembly, config_assembly,
+                    io_port, target_io_port
+                Modbus TCP模式: ip_address, unit_count, tcp_port, slave_id
         """
         import logging
         self.logger = logging.getLogger(__name__)
         self.comm_type = comm_type
         self.connected = False
+        self.unit_count = kwargs.get('unit_count', 1)
+        self.clock = kwargs.get('clock') or REAL_CLOCK
+        self.process_image: Optional[ProcessImage] = None
+        # 集中状态轮询器，运行时各轴的等待都基于它，不再各自轮询
+        self.poller: Optional[StatusPoller] = None
+
+        # 控制字影子寄存器（单元号 -> 控制字），只在连接或出错时与设备同步。
+        # 读改写都在I/O线程中执行，由I/O通道串行化，不另外加锁：
+        # 持锁等待I/O通道会与在I/O线程中等锁的操作互相死锁
+        self._control_words: Dict[int, int] = {}
+
+        # 所有驱动访问都经由I/O通道串行执行，多线程调用安全
+        self.channel = IOChannel()
 
         if comm_type == self.COMM_SERIAL:
             self.port = kwargs.get('port', 'COM6')
             self.baudrate = kwargs.get('baudrate', 115200)
-            self.client = SerialClient(self.port, self.baudrate)
+            self.slave_id = kwargs.get('slave_id', 0x01)
+            # 同一串口上的多个REC共享一条总线，本实例只是该从站的视图
+            self.bus = kwargs.get('bus') or ModbusRTUBus.shared(self.port, self.baudrate)
+            self.client = self.bus.client
+        elif comm_type == self.COMM_MODBUS_TCP:
+            self.ip_address = kwargs.get('ip_address', '192.168.0.1')
+            self.slave_id = kwargs.get('slave_id', 0x01)
+            self.client = ModbusTCPClient(self.ip_address, kwargs.get('tcp_port', MODBUS_TCP_PORT),
+                                          unit_id=self.slave_id)
         else:
             self.ip_address = kwargs.get('ip_address', '192.168.0.1')
-            self.unit_count = kwargs.get('unit_count', 1)
-            self.client = EtherNetIPClient(self.ip_address)
+            implicit = None
+            if kwargs.get('implicit_io', False):
+                # 隐式I/O：输入组件为网关输入块，输出组件为各单元控制字
+                implicit = {
+                    'input_size': input_image_size(self.unit_count),
+                    'output_size': self.UNIT_BASE_OFFSET + self.unit_count * self.BYTES_PER_UNIT,
+                    'input_assembly': kwargs.get('input_assembly', 100),
+                    'output_assembly': kwargs.get('output_assembly', 150),
+                    'config_assembly': kwargs.get('config_assembly', 1),
+                    'rpi': kwargs.get('rpi', 10.0),
+                    'port': kwargs.get('io_port', IO_PORT),
+                    'target_port': kwargs.get('target_io_port'),
+                }
+            self.client = EtherNetIPClient(self.ip_address, implicit=implicit,
+                                           input_assembly=kwargs.get('input_assembly', 100),
+                                           output_assembly=kwargs.get('output_assembly', 150),
+                                           executor=self.channel.submit)
+
+        # 网络模式断线自动重连：断线时作废影子寄存器，重连后从设备重新同步
+        self.supervisor = getattr(self.client, 'supervisor', None)
+        if self.supervisor:
+            self.supervisor.add_listener(self._on_link_state)
+            # 钩子在重连线程中调用，只把同步提交到I/O线程、不等待结果，
+            # 重连线程不会等待I/O线程（断开连接时I/O线程会等待重连线程退出）
+            self.supervisor.add_reconnect_hook(lambda: self.channel.submit(self._sync_outputs))
+
+    @property
+    def link_up(self) -> bool:
+        """通信链路是否正常（断线重连期间为False）"""
+        if self.supervisor is None:
+            return self.connected
+        return self.connected and self.supervisor.available
+
+    def add_link_listener(self, callback: Callable[[str], None]):
+        """注册链路状态回调
+
+        Args:
+            callback: 参数为 'connected'/'down'/'disconnected'，在通信线程中调用
+        """
+        if self.supervisor:
+            self.supervisor.add_listener(callback)
+
+    def _on_link_state(self, state: str):
+        """链路断开时作废控制字影子寄存器
+
+        断开由读写失败触发，回调在I/O线程中执行。
+        """
+        if state == ConnectionSupervisor.STATE_DOWN:
+            self._control_words.clear()
 
     def connect(self) -> bool:
         """连接到REC控制器"""
-        self.connected = self.client.connect()
+        return self.channel.call(self._connect)
+
+    def _connect(self) -> bool:
+        if self.comm_type == self.COMM_SERIAL:
+            self.connected = self.bus.attach()
+        else:
+            self.connected = self.client.connect()
 
         if self.connected and self.comm_type == self.COMM_SERIAL:
             # 串口连接后，尝试识别设备
             if not self._identify_device():
                 self.logger.warning("无法识别设备")
 
+        if self.connected:
+            self._sync_outputs()
+
         return self.connected
 
+    def start_status_poller(self, period: float = 0.01) -> StatusPoller:
+        """启动集中状态轮询（已启动时直接返回）
+
+        Args:
+            period: 轮询周期(秒)
+
+        Returns:
+            状态轮询器
+        """
+        if self.poller is None or not self.poller.running:
+            self.poller = StatusPoller(self, period)
+            self.poller.start()
+        return self.poller
+
+    def stop_status_poller(self):
+        """停止集中状态轮询"""
+        if self.poller is not None:
+            self.poller.stop()
+            self.poller = None
+
+    @property
+    def polling(self) -> bool:
+        """集中状态轮询是否在运行"""
+        return self.poller is not None and self.poller.running
+
     def disconnect(self):
         """断开连接"""
-        self.client.disconnect()
+        self.stop_status_poller()
+        self.channel.call(self._disconnect)
+        self.logger.info(self.channel.report())
+        self.channel.stop()
+
+    def _disconnect(self):
+        if self.comm_type == self.COMM_SERIAL:
+            if self.connected:
+                self.bus.detach()
+        else:
+            self.client.disconnect()
         self.connected = False
+        self._control_words.clear()
 
     def _identify_device(self) -> bool:
         """识别设备（串口模式）"""
@@ -61,8 +191,8 @@ class RECController:
             return True
 
         # 发送识别命令（根据实际协议调整）
-        identify_cmd = b'\x01\x03\x00\x00\x00\x01\x84\x0A'  # 示例Modbus命令
-        response = self.client.query(identify_cmd, 7)
+        identify_pdu = b'\x03\x00\x00\x00\x01'  # 示例Modbus命令
+        response = self.bus.request(self.slave_id, identify_pdu)
 
         if response and len(response) >= 5:
             # 解析响应（根据实际协议调整）
@@ -72,59 +202,113 @@ class RECController:
         return False
 
     def read_data(self, address: int, length: int) -> Optional[bytes]:
-        """读取数据（统一接口）"""
+        """读取数据（统一接口）
+
+        Args:
+            address: 字节地址
+            length: 字节长度
+        """
+        if self.comm_type == self.COMM_MODBUS_TCP:
+            # 只有发送经由I/O通道，应答在调用线程等待，多个线程的请求可以同时在途
+            return self._read_modbus_tcp(address, length)
+        return self.channel.call(self._read_data, address, length)
+
+    def read_many(self, requests: List[Tuple[int, int]]) -> List[Optional[bytes]]:
+        """一次读取多个区域
+
+        Modbus TCP下全部请求流水线发送，只等待一次往返；
+        其它通信方式在I/O通道中依次读取。
+
+        Args:
+            requests: [(字节地址, 字节长度), ...]
+
+        Returns:
+            按请求顺序的数据，失败项为None
+        """
+        if self.comm_type == self.COMM_MODBUS_TCP:
+            pdus = [self._build_read_pdu(address, length) for address, length in requests]
+            futures = self.channel.call(lambda: [self.client.submit(pdu) for pdu in pdus])
+            return [self._parse_modbus_read(self.client.wait(future), length)
+                    for future, (_, length) in zip(futures, requests)]
+        return self.channel.call(
+            lambda: [self._read_data(address, length) for address, length in requests])
+
+    def _read_data(self, address: int, length: int) -> Optional[bytes]:
         if self.comm_type == self.COMM_SERIAL:
             return self._read_serial(address, length)
+        elif self.comm_type == self.COMM_MODBUS_TCP:
+            return self._read_modbus_tcp(address, length)
         else:
             return self._read_ethernet(address, length)
 
     def write_data(self, address: int, data: bytes) -> bool:
         """写入数据（统一接口）"""
+        if self.comm_type == self.COMM_MODBUS_TCP:
+            return self._write_modbus_tcp(address, data)
+        return self.channel.call(self._write_data, address, data)
+
+    def _write_data(self, address: int, data: bytes) -> bool:
         if self.comm_type == self.COMM_SERIAL:
             return self._write_serial(address, data)
+        elif self.comm_type == self.COMM_MODBUS_TCP:
+            return self._write_modbus_tcp(address, data)
         else:
             return self._write_ethernet(address, data)
 
-    def _read_serial(self, address: int, length: int) -> Optional[bytes]:
-        """串口读取（Modbus RTU协议示例）"""
-        # 构造Modbus读取命令
-        slave_id = 0x01
+    @staticmethod
+    def _build_read_pdu(address: int, length: int) -> bytes:
+        """构造Modbus读取PDU（字节地址/长度换算为寄存器地址/数量）"""
         function = 0x03  # Read Holding Registers
+        return struct.pack('>BHH', function, address // 2, (length + 1) // 2)
 
-        cmd = struct.pack('>BBHH', slave_id, function, address, length)
-        crc = self._calculate_crc(cmd)
-        cmd += struct.pack('<H', crc)
+    @staticmethod
+    def _build_write_pdu(address: int, data: bytes) -> bytes:
+        """构造Modbus写入PDU"""
+        function = 0x10  # Write Multiple Registers
+        num_registers = len(data) // 2
+        byte_count = len(data)
+        return struct.pack('>BHHB', function, address // 2,
+                           num_registers, byte_count) + data
 
-        # 发送并接收
-        response = self.client.query(cmd, 5 + length * 2)
+    def _read_serial(self, address: int, length: int) -> Optional[bytes]:
+        """串口读取（Modbus RTU协议示例）"""
+        response = self.bus.request(self.slave_id, self._build_read_pdu(address, length))
 
         if response and len(response) >= 5:
-            # 验证CRC
-            if self._verify_crc(response):
-                # 提取数据
-                data_start = 3
-                data_end = 3 + response[2]
-                return response[data_start:data_end]
+            # 提取数据（总线已校验CRC和从站地址）
+            data_start = 3
+            data_end = 3 + response[2]
+            return response[data_start:data_end][:length]
 
         return None
 
     def _write_serial(self, address: int, data: bytes) -> bool:
         """串口写入（Modbus RTU协议示例）"""
-        slave_id = 0x01
-        function = 0x10  # Write Multiple Registers
+        response = self.bus.request(self.slave_id, self._build_write_pdu(address, data), write=True)
 
-        num_registers = len(data) // 2
-        byte_count = len(data)
+        return response is not None and len(response) >= 8
 
-        cmd = struct.pack('>BBHHB', slave_id, function, address,
-                         num_registers, byte_count)
-        cmd += data
-        crc = self._calculate_crc(cmd)
-        cmd += struct.pack('<H', crc)
+    def _modbus_tcp_request(self, pdu: bytes) -> Optional[bytes]:
+        """Modbus TCP请求：在I/O通道中发送，在调用线程按事务ID等待应答"""
+        return self.client.wait(self.channel.call(self.client.submit, pdu))
 
-        response = self.client.query(cmd, 8)
+    @staticmethod
+    def _parse_modbus_read(response: Optional[bytes], length: int) -> Optional[bytes]:
+        """从读取应答PDU（功能码 字节数 数据...）中取出数据"""
+        if response and len(response) >= 2:
+            return response[2:2 + response[1]][:length]
+        return None
 
-        return response is not None and len(response) >= 8
+    def _read_modbus_tcp(self, address: int, length: int) -> Optional[bytes]:
+        """Modbus TCP读取"""
+        return self._parse_modbus_read(
+            self._modbus_tcp_request(self._build_read_pdu(address, length)), length)
+
+    def _write_modbus_tcp(self, address: int, data: bytes) -> bool:
+        """Modbus TCP写入"""
+        response = self._modbus_tcp_request(self._build_write_pdu(address, data))
+
+        return response is not None and len(response) >= 5
 
     def _read_ethernet(self, address: int, length: int) -> Optional[bytes]:
         """以太网读取"""
@@ -137,90 +321,159 @@ class RECController:
 
     def _calculate_crc(self, data: bytes) -> int:
         """计算Modbus CRC16"""
-        crc = 0xFFFF
-        for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                if crc & 0x0001:
-                    crc = (crc >> 1) ^ 0xA001
-                else:
-                    crc >>= 1
-        return crc
+        return crc16(data)
 
     def _verify_crc(self, data: bytes) -> bool:
         """验证CRC"""
-        if len(data) < 3:
-            return False
+        return check_crc(data)
 
-        received_crc = struct.unpack('<H', data[-2:])[0]
-        calculated_crc = self._calculate_crc(data[:-2])
+    def read_process_image(self) -> Optional[ProcessImage]:
+        """一次读取整个网关输入块（网关状态字和所有轴状态字）
 
-        return received_crc == calculated_crc
+        Returns:
+            过程映像快照，失败返回None
+        """
+        size = input_image_size(self.unit_count)
+        # 在发出读取之前取序号，快照一定晚于序号以内的命令
+        ordinal = self.channel.ordinal
+        data = self.read_data(self.GATEWAY_STATUS_OFFSET, size)
+        if not data or len(data) < size:
+            return None
+
+        self.process_image = ProcessImage(data, self.unit_count, ordinal=ordinal)
+        return self.process_image
 
     # 保留原有的高级接口
-    def read_gateway_status(self) -> Dict:
-        """读取网关状态"""
+    def read_gateway_status(self, image: Optional[ProcessImage] = None) -> Optional[GatewayStatus]:
+        """读取网关状态
+
+        Args:
+            image: 过程映像快照，给出时直接从快照解码，不访问总线
+        """
+        if image is not None:
+            return image.gateway_status()
+
         data = self.read_data(self.GATEWAY_STATUS_OFFSET, 2)
         if data:
             status_word = struct.unpack('<H', data)[0]
-            return {
-                'almh': not bool(status_word & 0x8000),
-                'mod': bool(status_word & 0x2000),
-                'estp': bool(status_word & 0x1000),
-                'alarm_code': status_word & 0xFF
-            }
+            return decode_gateway_status(status_word)
         return None
 
+    def _control_word_address(self, unit_index: int) -> int:
+        """单元控制字的字节地址"""
+        return self.UNIT_BASE_OFFSET + (unit_index * self.BYTES_PER_UNIT)
+
+    def _read_control_word(self, unit_index: int) -> Optional[int]:
+        """从设备读取单元控制字"""
+        address = self._control_word_address(unit_index)
+        if self.comm_type == self.COMM_ETHERNET_IP:
+            data = self.channel.call(self.client.read_output_data, address, 2)
+            data = bytes(data) if data else None
+        else:
+            data = self.read_data(address, 2)
+        if data:
+            return struct.unpack('<H', data)[0]
+        return None
+
+    def sync_outputs(self) -> bool:
+        """从设备重新同步所有单元的控制字影子寄存器（可在任意线程调用）
+
+        Returns:
+            是否全部同步成功
+        """
+        return self.channel.call(self._sync_outputs)
+
+    def _sync_outputs(self) -> bool:
+        self._control_words.clear()
+        units = range(self.unit_count)
+        if self.comm_type == self.COMM_ETHERNET_IP:
+            control_words = [self._read_control_word(unit) for unit in units]
+        else:
+            # 各单元的控制字一次批量读取（Modbus TCP下流水线发送）
+            control_words = [struct.unpack('<H', data)[0] if data else None
+                             for data in self.read_many([(self._control_word_address(unit), 2)
+                                                         for unit in units])]
+        success = True
+        for unit, control_word in zip(units, control_words):
+            if control_word is None:
+                success = False
+                continue
+            self._control_words[unit] = control_word
+
+        if not success:
+            self.logger.warning("控制字同步失败，将在下次命令时重新读取")
+        return success
+
     def send_axis_command(self, unit_index: int, axis_index: int,
                          command: str, value: bool = True):
         """发送轴控制命令"""
-        # 计算地址偏移
-        address = self.UNIT_BASE_OFFSET + (unit_index * self.BYTES_PER_UNIT)
+        return self.send_axis_commands(unit_index, axis_index, {command: value})
 
-        # 读取当前控制字
-        current_data = self.read_data(address, 2)
-        if current_data:
-            control_word = struct.unpack('<H', current_data)[0]
-        else:
-            control_word = 0
+    def send_axis_commands(self, unit_index: int, axis_index: int,
+                           commands: Dict[str, bool]) -> bool:
+        """在影子控制字上修改多个命令位，并一次写出
+
+        Args:
+            unit_index: 单元编号
+            axis_index: 轴编号
+            commands: {命令: 值}，命令为 'ST0'/'ST1'/'RES'
 
-        # 根据命令修改对应位
+        Returns:
+            是否写入成功
+        """
+        # 根据命令计算对应位
         bit_offset = axis_index * 4
-        if command == 'ST0':
-            bit_position = bit_offset + 0
-        elif command == 'ST1':
-            bit_position = bit_offset + 1
-        elif command == 'RES':
-            bit_position = bit_offset + 2
-        else:
-            raise ValueError(f"未知命令: {command}")
+        set_mask = 0
+        clear_mask = 0
+        for command, value in commands.items():
+            if command not in self.COMMAND_BITS:
+                raise ValueError(f"未知命令: {command}")
+            mask = 1 << (bit_offset + self.COMMAND_BITS[command])
+            if value:
+                set_mask |= mask
+            else:
+                clear_mask |= mask
+
+        return self.channel.call(self._update_control_word, unit_index, set_mask, clear_mask)
+
+    def _update_control_word(self, unit_index: int, set_mask: int, clear_mask: int) -> bool:
+        """在I/O线程中修改影子控制字并写出"""
+        control_word = self._control_words.get(unit_index)
+        if control_word is None:
+            # 影子寄存器未同步（首次使用或之前出错），从设备重新读取
+            control_word = self._read_control_word(unit_index)
+            if control_word is None:
+                # 不知道其它轴的命令位，写出会把它们清零，本次命令不写出
+                self.logger.warning(f"单元{unit_index}控制字读取失败，命令未写出")
+                return False
+
+        control_word = (control_word | set_mask) & ~clear_mask & 0xFFFF
+
+        # 写出控制字
+        if self._write_data(self._control_word_address(unit_index), struct.pack('<H', control_word)):
+            self._control_words[unit_index] = control_word
+            return True
 
-        # 设置或清除位
-        if value:
-            control_word |= (1 << bit_position)
-        else:
-            control_word &= ~(1 << bit_position)
+        # 写入失败，设备状态未知，下次命令时重新同步
+        self._control_words.pop(unit_index, None)
+        self.logger.warning(f"单元{unit_index}控制字写入失败")
+        return False
 
-        # 写回控制字
-        data = struct.pack('<H', control_word)
-        return self.write_data(address, data)
+    def read_axis_status(self, unit_index: int, axis_index: int,
+                         image: Optional[ProcessImage] = None) -> Optional[AxisStatus]:
+        """读取轴状态
+
+        Args:
+            unit_index: 单元编号
+            axis_index: 轴编号
+            image: 过程映像快照，给出时直接从快照解码，不访问总线
+        """
+        if image is not None:
+            return image.axis_status(unit_index, axis_index)
 
-    def read_axis_status(self, unit_index: int, axis_index: int) -> Optional[Dict]:
-        """读取轴状态"""
-        # 计算轴状态地址偏移
         # 根据REC文档，轴状态从地址4开始，每个轴占用2字节
-        axis_status_offset = 4 + (unit_index * 8) + (axis_index * 2)
-        
-        data = self.read_data(axis_status_offset, 2)
+        data = self.read_data(axis_status_offset(unit_index, axis_index), 2)
         if data:
             status_word = struct.unpack('<H', data)[0]
-            return {
-                'ready': bool(status_word & 0x0001),      # 准备就绪
-                'busy': bool(status_word & 0x0002),       # 忙碌
-                'done': bool(status_word & 0x0004),       # 完成
-                'alarm': bool(status_word & 0x0008),      # 报警
-                'error': bool(status_word & 0x0010),      # 错误
-                'position': status_word & 0xFF00 >> 8,    # 位置信息（高8位）
-                'status_code': status_word & 0x00FF       # 状态码（低8位）
-            }
-        return None
\ No newline at end of file
+            return decode_axis_status(status_word)
+        return None
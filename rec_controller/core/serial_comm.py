@@ -5,6 +5,7 @@ import struct
 import time
 import logging
 from typing import List, Optional, Tuple
+from .modbus import RESPONSE_HEADER_LENGTH, remaining_response_length, silent_interval
 
 
 class SerialClient:
@@ -16,6 +17,13 @@ class SerialClient:
         self.timeout = timeout
         self.serial = None
         self.logger = logging.getLogger(__name__)
+        # 上一次总线活动（发送完成或接收完成）的时刻
+        self._last_activity = 0.0
+
+    @property
+    def silent_interval(self) -> float:
+        """当前波特率下的帧间静止时间（秒）"""
+        return silent_interval(self.baudrate)
 
     @staticmethod
     def list_ports() -> List[Tuple[str, str]]:
@@ -87,9 +95,68 @@ class SerialClient:
             self.logger.error(f"接收失败: {e}")
             return None
 
+    def receive_frame(self, fallback_length: int = None) -> Optional[bytes]:
+        """接收一帧Modbus RTU应答
+
+        先读取帧头，根据功能码和字节数推算剩余长度，帧完整后立即返回，
+        不必等待读取超时。异常应答（5字节）同样按实际长度返回。
+
+        Args:
+            fallback_length: 功能码无法识别时使用的应答总长度
+
+        Returns:
+            接收到的数据（超时时可能不完整），出错返回None
+        """
+        try:
+            if not self.is_connected():
+                return None
+
+            response = self.serial.read(RESPONSE_HEADER_LENGTH)
+            if len(response) == RESPONSE_HEADER_LENGTH:
+                remaining = remaining_response_length(response)
+                if remaining < 0:
+                    remaining = max((fallback_length or 0) - RESPONSE_HEADER_LENGTH, 0)
+                if remaining:
+                    response += self.serial.read(remaining)
+
+            self._last_activity = time.monotonic()
+            if response:
+                self.logger.debug(f"接收: {response.hex()}")
+            return response
+        except Exception as e:
+            self.logger.error(f"接收失败: {e}")
+            return None
+
     def query(self, command: bytes, response_length: int = None) -> Optional[bytes]:
-        """查询（发送命令并接收响应）"""
-        if self.send_command(command):
-            time.sleep(0.01)  # 短暂延时
-            return self.receive_response(response_length)
-        return None
\ No newline at end of file
+        """查询（发送一帧命令并接收应答帧）
+
+        发送前保证距上一帧至少间隔3.5个字符时间，应答按帧长接收。
+
+        Args:
+            command: 完整的Modbus RTU命令帧
+            response_length: 功能码无法识别时使用的应答总长度
+        """
+        if not self.is_connected():
+            return None
+
+        # 帧间静止时间
+        idle = time.monotonic() - self._last_activity
+        if idle < self.silent_interval:
+            time.sleep(self.silent_interval - idle)
+
+        try:
+            # 丢弃上一次事务残留的数据
+            self.serial.reset_input_buffer()
+        except Exception as e:
+            self.logger.debug(f"清空接收缓冲区失败: {e}")
+
+        if not self.send_command(command):
+            return None
+
+        try:
+            self.serial.flush()
+        except Exception as e:
+            self.logger.debug(f"等待发送完成失败: {e}")
+        self._last_activity = time.monotonic()
+
+        return self.receive_frame(response_length)
@@ -0,0 +1,158 @@
+"""集中状态轮询与事件驱动等待"""
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .process_image import ProcessImage, AxisStatus
+from utils.periodic import PeriodicScheduler
+
+# 状态变化回调: (新快照, 状态字发生变化的轴 [(单元, 轴), ...])
+ChangeCallback = Callable[[ProcessImage, List[Tuple[int, int]]], None]
+
+
+class StatusPoller:
+    """集中状态轮询器
+
+    每个控制器一个，按固定周期读取整个过程映像，映像变化时通知订阅者
+    并唤醒等待者。任意多个轴的等待都只依赖这一路轮询，不增加总线访问，
+    到位在一个轮询周期内即可检测到。
+    """
+
+    # 等待者单次阻塞的上限(秒)
+    WAIT_SLICE = 0.05
+
+    def __init__(self, controller, period: float = 0.01):
+        """
+        Args:
+            controller: REC控制器，等待超时按它的时钟(clock)计算
+            period: 轮询周期(秒)
+        """
+        self.controller = controller
+        self.period = period
+        self.clock = controller.clock
+        self.logger = logging.getLogger(__name__)
+        self.image: Optional[ProcessImage] = None
+        # 已完成的轮询次数，等待者据此判断快照是否晚于等待开始
+        self.sequence = 0
+        self.read_failures = 0
+        self._words: Optional[np.ndarray] = None
+        self._condition = threading.Condition()
+        self._subscribers: List[ChangeCallback] = []
+        self.scheduler = PeriodicScheduler(period, self.poll, name='rec-status-poller')
+
+    @property
+    def running(self) -> bool:
+        """是否在轮询"""
+        return self.scheduler.running
+
+    def start(self):
+        """启动轮询线程"""
+        self.scheduler.start()
+
+    def stop(self):
+        """停止轮询，并唤醒所有等待者（等待返回失败）"""
+        self.scheduler.stop()
+        with self._condition:
+            self._condition.notify_all()
+
+    def subscribe(self, callback: ChangeCallback):
+        """注册状态变化回调（在轮询线程中调用，应尽快返回）"""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: ChangeCallback):
+        """注销状态变化回调"""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def poll(self) -> Optional[ProcessImage]:
+        """读取一次过程映像，发布变化
+
+        Returns:
+            新快照，读取失败返回None
+        """
+        image = self.controller.read_process_image()
+        if image is None:
+            self.read_failures += 1
+            return None
+
+        axes = image.axes()
+        words = axes['word']
+        previous = self._words
+        if previous is None or len(previous) != len(words):
+            mask = np.ones(len(words), dtype=bool)
+        else:
+            mask = words != previous
+        changed = [(int(unit), int(axis)) for unit, axis in zip(axes['unit'][mask], axes['axis'][mask])]
+        image_changed = self.image is None or image.data != self.image.data
+        self._words = words
+
+        with self._condition:
+            self.image = image
+            self.sequence += 1
+            self._condition.notify_all()
+
+        if image_changed:
+            for callback in list(self._subscribers):
+                try:
+                    callback(image, changed)
+                except Exception as e:
+                    self.logger.error(f"状态回调出错: {e}")
+        return image
+
+    def wait_until(self, predicate: Callable[[ProcessImage], bool], timeout: float,
+                   fresh: bool = True) -> Optional[ProcessImage]:
+        """阻塞等待快照满足条件
+
+        Args:
+            predicate: 以快照为参数的判断函数
+            timeout: 超时时间(秒)
+            fresh: 为True时只判断等待开始之后才发出读取的快照。快照按I/O通道的
+                操作序号判断先后，等待开始前已经在途的读取（可能早于刚写出的命令）
+                也不会被采用
+
+        Returns:
+            满足条件的快照，超时或轮询停止返回None
+        """
+        token = self.controller.channel.ordinal if fresh else 0
+        deadline = self.clock.monotonic() + timeout
+        with self._condition:
+            while True:
+                image = self.image
+                if image is not None and image.ordinal >= token and predicate(image):
+                    return image
+                remaining = deadline - self.clock.monotonic()
+                if remaining <= 0 or not self.running:
+                    return None
+                # 超时按注入的时钟计算（可能是虚拟时钟），分段等待以便及时发现
+                self._condition.wait(min(remaining, self.WAIT_SLICE))
+
+    def wait_for_axis(self, unit_index: int, axis_index: int,
+                      predicate: Callable[[AxisStatus], bool], timeout: float,
+                      fresh: bool = True) -> Optional[AxisStatus]:
+        """阻塞等待轴状态满足条件
+
+        Args:
+            unit_index: 单元编号
+            axis_index: 轴编号
+            predicate: 以轴状态为参数的判断函数
+            timeout: 超时时间(秒)
+            fresh: 同 wait_until
+
+        Returns:
+            满足条件时的轴状态，超时返回None
+        """
+        def check(image: ProcessImage) -> bool:
+            status = image.axis_status(unit_index, axis_index)
+            return status is not None and predicate(status)
+
+        image = self.wait_until(check, timeout, fresh)
+        return image.axis_status(unit_index, axis_index) if image is not None else None
+
+    def statistics(self) -> Dict[str, float]:
+        """轮询周期统计"""
+        stats = self.scheduler.statistics()
+        stats['polls'] = self.sequence
+        stats['read_failures'] = self.read_failures
+        return stats
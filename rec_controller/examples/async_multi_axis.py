@@ -0,0 +1,55 @@
+"""多轴控制示例（asyncio）
+
+一个事件循环同时驱动多个网关上的所有轴，每个网关只占用一个I/O线程。
+"""
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+from core.async_controller import AsyncRECController
+from core.async_actuator import AsyncECActuator
+
+
+async def control_axis(axis: AsyncECActuator, axis_name: str):
+    """控制单个轴"""
+    print(f"{axis_name}: 开始原点复归...")
+    await axis.home()
+    print(f"{axis_name}: 原点复归完成")
+
+    # 执行3次往复运动
+    await axis.cycle_motion(cycles=3, dwell_time=0.5)
+    print(f"{axis_name}: 往复运动完成")
+
+
+async def async_multi_axis_example():
+    """多网关多轴控制示例"""
+    # 创建控制器
+    controllers = [
+        AsyncRECController(comm_type='ethernet_ip', ip_address="192.168.0.1", unit_count=1),
+        AsyncRECController(comm_type='ethernet_ip', ip_address="192.168.0.2", unit_count=1),
+    ]
+
+    results = await asyncio.gather(*(c.connect() for c in controllers))
+    if not all(results):
+        print("连接失败")
+        return
+    print("连接成功")
+
+    # 每个网关4个轴
+    tasks = []
+    for gateway, controller in enumerate(controllers):
+        for axis_index in range(4):
+            axis = AsyncECActuator(controller, 0, axis_index)
+            tasks.append(control_axis(axis, f"网关{gateway}/轴{axis_index}"))
+
+    await asyncio.gather(*tasks)
+
+    for controller in controllers:
+        await controller.disconnect()
+    print("多轴控制测试完成")
+
+
+if __name__ == "__main__":
+    asyncio.run(async_multi_axis_example())
@@ -64,6 +64,9 @@ def multi_axis_example():
         for thread in threads:
             thread.join()
 
+        # 所有线程共用控制器的I/O通道，输出通道吞吐量统计
+        print(controller.channel.report())
+
         controller.disconnect()
         print("多轴控制测试完成")
 
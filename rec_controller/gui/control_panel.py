@@ -240,8 +240,7 @@ class ControlPanel(QWidget):
         if self.controller:
             for unit in range(4):
                 for axis in range(4):
-                    self.controller.send_axis_command(unit, axis, 'ST0', False)
-                    self.controller.send_axis_command(unit, axis, 'ST1', False)
+                    self.controller.send_axis_commands(unit, axis, {'ST0': False, 'ST1': False})
 
 
 class Worker(QThread):
@@ -1,5 +1,6 @@
 """主窗口"""
 import sys
+import threading
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
@@ -7,6 +8,7 @@ from .control_panel import ControlPanel
 from .status_panel import StatusPanel
 from .config_dialog import ConfigDialog
 from core.rec_controller import RECController
+from core.connection_supervisor import ConnectionSupervisor
 from utils.config_loader import load_config
 import logging
 
@@ -17,6 +19,8 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.controller = None
+        # 后台断开连接的线程
+        self.disconnect_thread = None
         self.config = load_config('config.yaml')
         self.logger = logging.getLogger(__name__)
         self.init_ui()
@@ -60,6 +64,7 @@ class MainWindow(QMainWindow):
 
         # 连接信号
         self.control_panel.command_signal.connect(self.handle_command)
+        self.status_panel.link_state_changed.connect(self.on_link_state_changed)
 
     def create_toolbar(self):
         """创建工具栏"""
@@ -145,12 +150,31 @@ class MainWindow(QMainWindow):
         """断开控制器"""
         if self.controller:
             self.status_panel.stop_update()
-            self.controller.disconnect()
+            # 等采集线程退出后再断开，都在后台线程中进行，界面线程不等待
+            self.disconnect_thread = threading.Thread(
+                target=self._shutdown_controller, args=(self.controller,), name='rec-disconnect')
+            self.disconnect_thread.start()
             self.controller = None
             self.connection_label.setText("未连接")
             self.connection_label.setStyleSheet("QLabel { color: red; }")
             self.mode_label.setText("模式: --")
 
+    def _shutdown_controller(self, controller: RECController):
+        """等待采集线程退出后断开控制器（在后台线程中执行）"""
+        self.status_panel.join_stopped()
+        controller.disconnect()
+
+    def on_link_state_changed(self, state: str):
+        """显示断线重连状态"""
+        if not self.controller:
+            return
+        if state == ConnectionSupervisor.STATE_DOWN:
+            self.connection_label.setText("重连中")
+            self.connection_label.setStyleSheet("QLabel { color: orange; }")
+        elif state == ConnectionSupervisor.STATE_CONNECTED:
+            self.connection_label.setText("已连接")
+            self.connection_label.setStyleSheet("QLabel { color: green; }")
+
     def show_config_dialog(self):
         """显示配置对话框"""
         dialog = ConfigDialog(self.config, self)
@@ -178,6 +202,9 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             if self.controller:
                 self.disconnect_controller()
+            # 退出前等待断开完成
+            if self.disconnect_thread is not None:
+                self.disconnect_thread.join()
             event.accept()
         else:
             event.ignore()
\ No newline at end of file
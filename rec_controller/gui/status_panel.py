@@ -1,24 +1,40 @@
 """状态显示面板"""
+import threading
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 import pyqtgraph as pg
 from core.rec_controller import RECController
 from commands.status_commands import StatusCommands
+from core.connection_supervisor import ConnectionSupervisor
+from utils.periodic import PeriodicScheduler
 
 
 class StatusPanel(QWidget):
     """状态显示面板"""
 
+    # 刷新周期（秒）
+    UPDATE_PERIOD = 0.2
+
+    # 链路状态变化（从通信线程转到界面线程）
+    link_state_changed = pyqtSignal(str)
+    # 采集到新的过程映像（从采集线程转到界面线程）
+    snapshot_ready = pyqtSignal(object)
+
     def __init__(self):
         super().__init__()
         self.controller = None
         self.status_commands = None
+        self.updating = False
+        # 已发出停止信号、可能仍在退出中的采集线程
+        self._stopping = []
+        self._stopping_lock = threading.Lock()
         self.init_ui()
 
-        # 更新定时器
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_status)
+        # 后台线程按固定频率采集，界面线程只负责显示
+        self.poller = PeriodicScheduler(self.UPDATE_PERIOD, self.acquire_status, name='status-panel')
+        self.snapshot_ready.connect(self.update_status)
+        self.link_state_changed.connect(self.on_link_state_changed)
 
     def init_ui(self):
         """初始化UI"""
@@ -37,10 +53,12 @@ class StatusPanel(QWidget):
         self.gateway_status_led = StatusLED()
         self.mode_label = QLabel("--")
         self.alarm_code_label = QLabel("--")
+        self.refresh_label = QLabel("--")
 
         gateway_layout.addRow("状态:", self.gateway_status_led)
         gateway_layout.addRow("模式:", self.mode_label)
         gateway_layout.addRow("报警代码:", self.alarm_code_label)
+        gateway_layout.addRow("刷新:", self.refresh_label)
 
         gateway_group.setLayout(gateway_layout)
         layout.addWidget(gateway_group)
@@ -89,24 +107,72 @@ class StatusPanel(QWidget):
         """设置控制器"""
         self.controller = controller
         self.status_commands = StatusCommands(controller)
+        controller.add_link_listener(self.link_state_changed.emit)
 
     def start_update(self):
         """开始更新"""
-        self.update_timer.start(200)  # 200ms更新一次
+        self.updating = True
+        self.poller.start()
 
     def stop_update(self):
-        """停止更新"""
-        self.update_timer.stop()
+        """停止更新
+
+        界面线程不等待采集线程退出（它可能正阻塞在总线读取上），
+        断开控制器之前在其它线程中调用 join_stopped()。
+        """
+        self.updating = False
+        self._stop_poller()
+
+    def _stop_poller(self):
+        """只发出停止信号，记下仍在运行的采集线程"""
+        thread = self.poller.thread
+        self.poller.stop(wait=False)
+        if thread is not None:
+            with self._stopping_lock:
+                # 链路反复断开时只保留尚未退出的线程
+                self._stopping = [t for t in self._stopping if t.is_alive()] + [thread]
+
+    def join_stopped(self, timeout: float = 2.0):
+        """等待已停止的采集线程退出（不要在界面线程中调用）"""
+        with self._stopping_lock:
+            threads, self._stopping = self._stopping, []
+        for thread in threads:
+            thread.join(timeout)
+
+    @pyqtSlot(str)
+    def on_link_state_changed(self, state: str):
+        """链路断开时暂停轮询，重连成功后恢复"""
+        if state == ConnectionSupervisor.STATE_DOWN:
+            # 界面线程不等待采集线程退出（它可能正阻塞在断开的链路上），只发出停止信号
+            self._stop_poller()
+            self.gateway_status_led.set_status(False)
+        elif state == ConnectionSupervisor.STATE_CONNECTED and self.updating:
+            self.poller.start()
+
+    def acquire_status(self):
+        """采集一次状态（在采集线程中执行）"""
+        if not self.status_commands:
+            return
 
-    @pyqtSlot()
-    def update_status(self):
-        """更新状态"""
-        if not self.controller or not self.status_commands:
+        # 每个周期只读取一次网关输入块
+        image = self.status_commands.get_snapshot()
+        if image is not None:
+            self.snapshot_ready.emit(image)
+
+    @pyqtSlot(object)
+    def update_status(self, image):
+        """更新状态显示"""
+        if not self.controller:
             return
 
         try:
+            stats = self.poller.statistics()
+            self.refresh_label.setText(
+                f"{stats['achieved_hz']:.1f}Hz  p99 {stats['cycle_p99_ms']:.0f}ms  超时{stats['overruns']}"
+            )
+
             # 更新网关状态
-            gateway_status = self.status_commands.get_gateway_status()
+            gateway_status = image.gateway_status()
             if gateway_status:
                 self.gateway_status_led.set_status(not gateway_status['almh'])
                 self.mode_label.setText("MANU" if gateway_status['mod'] else "AUTO")
@@ -117,7 +183,7 @@ class StatusPanel(QWidget):
                 for axis in range(4):
                     row = unit * 4 + axis
                     try:
-                        status = self.status_commands.get_axis_status(unit, axis)
+                        status = image.axis_status(unit, axis)
 
                         if status:
                             # 准备就绪
@@ -0,0 +1,7 @@
+"""REC网关模拟器"""
+from .device import RECSimulator, SimulatedAxis
+from .eip_server import EIPServer
+from .modbus_server import ModbusRTUServer
+from .modbus_tcp_server import ModbusTCPServer
+
+__all__ = ['RECSimulator', 'SimulatedAxis', 'EIPServer', 'ModbusRTUServer', 'ModbusTCPServer']
@@ -0,0 +1,62 @@
+"""启动REC网关模拟器
+
+用法（在rec_controller目录下）:
+    python -m simulator --units 2
+    python -m simulator --units 4 --no-modbus --stroke-time 1.0
+"""
+import argparse
+import logging
+import sys
+import time
+
+from .device import RECSimulator
+from .eip_server import EIPServer, EIP_PORT
+from .modbus_server import ModbusRTUServer
+from core.implicit_io import IO_PORT
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description='REC网关模拟器')
+    parser.add_argument('--units', type=int, default=1, help='EC接续单元数量')
+    parser.add_argument('--host', default='127.0.0.1', help='EtherNet/IP监听地址')
+    parser.add_argument('--port', type=int, default=EIP_PORT, help='EtherNet/IP TCP端口')
+    parser.add_argument('--io-port', type=int, default=IO_PORT, help='隐式I/O UDP端口')
+    parser.add_argument('--stroke-time', type=float, default=0.5, help='全行程时间(秒)')
+    parser.add_argument('--latency', type=float, default=0.02, help='命令响应延迟(秒)')
+    parser.add_argument('--no-eip', action='store_true', help='不启动EtherNet/IP服务')
+    parser.add_argument('--no-modbus', action='store_true', help='不启动Modbus RTU从站')
+    parser.add_argument('--verbose', '-v', action='store_true', help='显示详细日志')
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    simulator = RECSimulator(args.units, args.stroke_time, args.latency)
+    servers = []
+    if not args.no_eip:
+        server = EIPServer(simulator, args.host, args.port, args.io_port)
+        server.start()
+        servers.append(server)
+        print(f"EtherNet/IP: {args.host}:{server.port}（隐式I/O端口 {server.io_port}，"
+              f"本机客户端请使用其它本地端口，如 io_port={server.io_port + 1}）")
+    if not args.no_modbus:
+        modbus = ModbusRTUServer(simulator)
+        print(f"Modbus RTU: {modbus.start()}")
+        servers.append(modbus)
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for server in servers:
+            server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
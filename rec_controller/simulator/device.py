@@ -0,0 +1,172 @@
+"""模拟REC网关和EC电缸"""
+import logging
+import struct
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from core.process_image import (AXES_PER_UNIT, GATEWAY_STATUS_OFFSET, AXIS_STATUS_FLAGS,
+                                input_image_size, axis_status_offset)
+from core.rec_controller import RECController
+
+# 网关状态字：bit15为1表示无重故障
+GATEWAY_NORMAL = 0x8000
+GATEWAY_MANUAL = 0x2000
+
+
+class SimulatedAxis:
+    """模拟EC电缸
+
+    ST1置位时向前进端移动，ST0置位时向后退端移动，两者都置位或都复位时停在原地。
+    命令变化后经过latency秒才开始动作，全行程耗时stroke_time秒。
+    有移动命令时未到达命令端为忙碌，到达后为完成；接受新命令时完成位随即复位。
+    报警期间不动作，RES上升沿清除报警。
+    """
+
+    def __init__(self, stroke_time: float = 0.5, latency: float = 0.02, position: float = 0.0):
+        """
+        Args:
+            stroke_time: 后退端到前进端的移动时间(秒)
+            latency: 命令到开始动作的延迟(秒)
+            position: 初始位置，0为后退端，1为前进端
+        """
+        self.stroke_time = stroke_time
+        self.latency = latency
+        self.position = position
+        self.alarm = False
+        self.commands = {'ST0': False, 'ST1': False, 'RES': False}
+        self._direction = 0
+        self._start_time = 0.0
+        self._last_update: Optional[float] = None
+
+    def apply(self, commands: Dict[str, bool], now: float):
+        """应用控制字中本轴的命令位"""
+        self.update(now)
+        if commands['RES'] and not self.commands['RES']:
+            self.alarm = False
+
+        direction = int(commands['ST1']) - int(commands['ST0'])
+        if direction != self._direction:
+            self._direction = direction
+            self._start_time = now + self.latency
+        self.commands = dict(commands)
+
+    def update(self, now: float):
+        """按经过的时间推进位置"""
+        last = self._last_update if self._last_update is not None else now
+        self._last_update = now
+        if not self._direction or self.alarm:
+            return
+
+        moving = now - max(last, self._start_time)
+        if moving > 0:
+            step = moving / self.stroke_time * self._direction
+            self.position = min(1.0, max(0.0, self.position + step))
+
+    def status_word(self) -> int:
+        """当前状态字"""
+        word = 0
+        if self.alarm:
+            word |= AXIS_STATUS_FLAGS['alarm']
+        else:
+            word |= AXIS_STATUS_FLAGS['ready']
+            if self._direction:
+                target = 1.0 if self._direction > 0 else 0.0
+                word |= AXIS_STATUS_FLAGS['done' if self.position == target else 'busy']
+        # 高8位为位置（0~255）
+        word |= int(round(self.position * 255)) << 8
+        return word
+
+
+class RECSimulator:
+    """模拟REC网关的字节寻址I/O映像
+
+    输入映像（网关状态字、轴状态字）和输出映像（各单元控制字）
+    的布局与RECController一致。状态在每次访问时按经过的时间更新。
+    """
+
+    def __init__(self, unit_count: int = 1, stroke_time: float = 0.5, latency: float = 0.02,
+                 time_source: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            unit_count: EC接续单元数量
+            stroke_time: 每个轴的全行程时间(秒)
+            latency: 每个轴的命令响应延迟(秒)
+            time_source: 时间函数(秒)，可使用虚拟时钟的 monotonic
+        """
+        self.logger = logging.getLogger(__name__)
+        self.time_source = time_source
+        self.unit_count = unit_count
+        self.input_size = input_image_size(unit_count)
+        self.output_size = RECController.UNIT_BASE_OFFSET + unit_count * RECController.BYTES_PER_UNIT
+        self.gateway_status = GATEWAY_NORMAL
+        self.axes: List[List[SimulatedAxis]] = [
+            [SimulatedAxis(stroke_time, latency) for _ in range(AXES_PER_UNIT)]
+            for _ in range(unit_count)
+        ]
+        self._output = bytearray(self.output_size)
+        self._lock = threading.Lock()
+
+        self.reads = 0
+        self.writes = 0
+
+    def axis(self, unit_index: int, axis_index: int) -> SimulatedAxis:
+        """获取模拟轴"""
+        return self.axes[unit_index][axis_index]
+
+    def input_image(self) -> bytes:
+        """生成当前输入映像"""
+        with self._lock:
+            return self._build_input(self.time_source())
+
+    def _build_input(self, now: float) -> bytes:
+        image = bytearray(self.input_size)
+        struct.pack_into('<H', image, GATEWAY_STATUS_OFFSET, self.gateway_status)
+        for unit, axes in enumerate(self.axes):
+            for index, axis in enumerate(axes):
+                axis.update(now)
+                struct.pack_into('<H', image, axis_status_offset(unit, index), axis.status_word())
+        return bytes(image)
+
+    def read_input(self, offset: int, length: int) -> Optional[bytes]:
+        """读取输入映像，超出范围返回None"""
+        if offset < 0 or offset + length > self.input_size:
+            return None
+        self.reads += 1
+        return self.input_image()[offset:offset + length]
+
+    def read_output(self, offset: int = 0, length: Optional[int] = None) -> Optional[bytes]:
+        """读取输出映像"""
+        length = self.output_size - offset if length is None else length
+        if offset < 0 or offset + length > self.output_size:
+            return None
+        with self._lock:
+            return bytes(self._output[offset:offset + length])
+
+    def write_output(self, offset: int, data: bytes) -> bool:
+        """写入输出映像，控制字变化立即作用到各轴"""
+        if offset < 0 or offset + len(data) > self.output_size:
+            return False
+        with self._lock:
+            self.writes += 1
+            self._output[offset:offset + len(data)] = data
+            self._apply_outputs(self.time_source())
+        return True
+
+    def _apply_outputs(self, now: float):
+        """把各单元控制字分解为轴命令"""
+        for unit, axes in enumerate(self.axes):
+            control_word = struct.unpack_from(
+                '<H', self._output, RECController.UNIT_BASE_OFFSET + unit * RECController.BYTES_PER_UNIT)[0]
+            for index, axis in enumerate(axes):
+                bits = control_word >> (index * 4)
+                axis.apply({command: bool(bits >> bit & 1)
+                            for command, bit in RECController.COMMAND_BITS.items()}, now)
+
+    def inject_alarm(self, unit_index: int, axis_index: int):
+        """使指定轴进入报警状态"""
+        with self._lock:
+            axis = self.axes[unit_index][axis_index]
+            axis.update(self.time_source())
+            axis.alarm = True
+        self.logger.info(f"模拟报警: 单元{unit_index} 轴{axis_index}")
@@ -0,0 +1,418 @@
+"""模拟网关的EtherNet/IP服务
+
+支持会话注册、显式报文读写组件对象（Get/Set_Attribute_Single），
+以及Forward Open/Close建立的Class 1循环I/O连接。
+"""
+import logging
+import random
+import socket
+import socketserver
+import struct
+import threading
+import time
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from core.implicit_io import IO_PORT, build_io_packet, parse_io_packet
+from .device import RECSimulator
+
+EIP_PORT = 44818
+
+# 封装命令
+CMD_NOP = 0x0000
+CMD_REGISTER_SESSION = 0x0065
+CMD_UNREGISTER_SESSION = 0x0066
+CMD_SEND_RR_DATA = 0x006F
+ENCAP_HEADER = struct.Struct('<HHII8sI')  # 命令, 长度, 会话, 状态, 上下文, 选项
+
+# CPF项类型
+ITEM_NULL_ADDRESS = 0x0000
+ITEM_UNCONNECTED_DATA = 0x00B2
+
+# CIP服务和对象
+SERVICE_GET_ATTRIBUTE_SINGLE = 0x0E
+SERVICE_SET_ATTRIBUTE_SINGLE = 0x10
+SERVICE_FORWARD_OPEN = 0x54
+SERVICE_FORWARD_CLOSE = 0x4E
+SERVICE_GET_ATTRIBUTES_ALL = 0x01
+SERVICE_UNCONNECTED_SEND = 0x52
+CLASS_IDENTITY = 0x01
+CLASS_ASSEMBLY = 0x04
+CLASS_CONNECTION_MANAGER = 0x06
+ATTRIBUTE_DATA = 3
+
+# CIP通用状态
+STATUS_SUCCESS = 0x00
+STATUS_CONNECTION_FAILURE = 0x01
+STATUS_PATH_UNKNOWN = 0x05
+STATUS_SERVICE_NOT_SUPPORTED = 0x08
+STATUS_NOT_ENOUGH_DATA = 0x13
+STATUS_TOO_MUCH_DATA = 0x15
+
+# Forward Open请求固定部分（不含连接路径）
+FORWARD_OPEN = struct.Struct('<BBIIHHIB3xIHIHB')
+FORWARD_OPEN_REPLY = struct.Struct('<IIHHIIIBB')
+FORWARD_CLOSE = struct.Struct('<BBHHI')
+FORWARD_CLOSE_REPLY = struct.Struct('<HHIBB')
+EXT_INVALID_CONNECTION_SIZE = 0x0109
+EXT_CONNECTION_NOT_FOUND = 0x0107
+
+# 标识对象（供 CIPDriver.get_module_info 和连接诊断使用）
+IDENTITY = {
+    'vendor': 0,
+    'product_type': 0x0C,     # 通信适配器
+    'product_code': 1,
+    'revision': (1, 0),
+    'status': 0,
+    'serial': 0x52454300,
+    'product_name': 'REC Gateway Simulator',
+}
+
+
+def encode_identity(identity: dict) -> bytes:
+    """编码标识对象的全部属性"""
+    name = identity['product_name'].encode('ascii')
+    return (struct.pack('<HHHBBHI', identity['vendor'], identity['product_type'],
+                        identity['product_code'], *identity['revision'],
+                        identity['status'], identity['serial'])
+            + bytes([len(name)]) + name)
+
+
+def parse_request_path(path: bytes) -> Dict[str, int]:
+    """解析逻辑段请求路径
+
+    Returns:
+        {'class': 类, 'instance': 实例, 'attribute': 属性}（不存在的段省略）
+    """
+    names = {0x20: 'class', 0x24: 'instance', 0x30: 'attribute'}
+    result = {}
+    i = 0
+    while i < len(path):
+        segment = path[i]
+        base = segment & 0xFC
+        if base not in names:
+            break
+        if segment & 0x03 == 0:
+            result[names[base]] = path[i + 1]
+            i += 2
+        else:
+            # 16位逻辑段带1字节填充
+            result[names[base]] = struct.unpack_from('<H', path, i + 2)[0]
+            i += 4
+    return result
+
+
+class IOConnection:
+    """一条Class 1连接（目标端）"""
+
+    def __init__(self, key: Tuple[int, int, int], o_t_id: int, t_o_id: int,
+                 o_t_rpi: float, t_o_rpi: float, timeout: float, address: Tuple[str, int]):
+        self.key = key
+        self.o_t_id = o_t_id
+        self.t_o_id = t_o_id
+        self.o_t_rpi = o_t_rpi
+        self.t_o_rpi = t_o_rpi
+        self.timeout = timeout
+        self.address = address
+        self.last_received = time.monotonic()
+        self.last_output: Optional[bytes] = None
+        self.running = True
+        self.packets_sent = 0
+        self.packets_received = 0
+
+
+class _SessionHandler(socketserver.BaseRequestHandler):
+    """一个TCP会话"""
+
+    def handle(self):
+        server: 'EIPServer' = self.server.simulator_server
+        sock: socket.socket = self.request
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        session = 0
+        buffer = b''
+
+        while True:
+            try:
+                chunk = sock.recv(4096)
+            except OSError:
+                break
+            if not chunk:
+                break
+            buffer += chunk
+
+            while len(buffer) >= ENCAP_HEADER.size:
+                command, length, _, _, context, _ = ENCAP_HEADER.unpack_from(buffer)
+                if len(buffer) < ENCAP_HEADER.size + length:
+                    break
+                payload = buffer[ENCAP_HEADER.size:ENCAP_HEADER.size + length]
+                buffer = buffer[ENCAP_HEADER.size + length:]
+
+                if command == CMD_REGISTER_SESSION:
+                    session = server.new_session()
+                    reply = payload[:4]
+                elif command == CMD_UNREGISTER_SESSION:
+                    return
+                elif command == CMD_SEND_RR_DATA:
+                    reply = server.handle_rr_data(payload, self.client_address[0])
+                elif command == CMD_NOP:
+                    continue
+                else:
+                    reply = None
+
+                status = 0 if reply is not None else 0x0001  # 无效或不支持的封装命令
+                reply = reply or b''
+                sock.sendall(ENCAP_HEADER.pack(command, len(reply), session, status, context, 0) + reply)
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class EIPServer:
+    """模拟网关的EtherNet/IP服务端"""
+
+    def __init__(self, simulator: RECSimulator, host: str = '127.0.0.1', port: int = EIP_PORT,
+                 io_port: int = IO_PORT, input_assembly: int = 100, output_assembly: int = 150,
+                 config_assembly: int = 1):
+        """
+        Args:
+            simulator: 模拟网关
+            host: 监听地址
+            port: TCP端口（显式报文），0为自动分配
+            io_port: UDP端口（隐式I/O），0为自动分配。与客户端在同一台机器上时
+                客户端本地端口需不同于此端口
+            input_assembly: 输入组件实例号
+            output_assembly: 输出组件实例号
+            config_assembly: 配置组件实例号
+        """
+        self.simulator = simulator
+        self.host = host
+        self.input_assembly = input_assembly
+        self.output_assembly = output_assembly
+        self.config_assembly = config_assembly
+        self.logger = logging.getLogger(__name__)
+
+        self._tcp = _TCPServer((host, port), _SessionHandler)
+        self._tcp.simulator_server = self
+        self.port = self._tcp.server_address[1]
+
+        self._udp = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._udp.bind((host, io_port))
+        self._udp.settimeout(0.1)
+        self.io_port = self._udp.getsockname()[1]
+
+        self._lock = threading.Lock()
+        self._sessions = 0
+        self.connections: Dict[Tuple[int, int, int], IOConnection] = {}
+        self._threads = []
+        self.running = False
+        self.requests = 0
+        # 组件对象读写次数：(服务, 实例) -> 次数
+        self.assembly_services: Counter = Counter()
+
+    def start(self):
+        """启动服务线程"""
+        self.running = True
+        for target in (self._tcp.serve_forever, self._receive_loop):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        self.logger.info(f"模拟EtherNet/IP服务已启动: {self.host}:{self.port}, I/O端口{self.io_port}")
+
+    def stop(self):
+        """停止服务，关闭所有连接"""
+        self.running = False
+        with self._lock:
+            for connection in self.connections.values():
+                connection.running = False
+            self.connections.clear()
+        self._tcp.shutdown()
+        self._tcp.server_close()
+        for thread in self._threads:
+            thread.join(timeout=1)
+        self._udp.close()
+        self.logger.info("模拟EtherNet/IP服务已停止")
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def new_session(self) -> int:
+        """分配会话号"""
+        with self._lock:
+            self._sessions += 1
+            return self._sessions
+
+    def handle_rr_data(self, payload: bytes, peer: str) -> Optional[bytes]:
+        """处理SendRRData（未连接显式报文）"""
+        if len(payload) < 8:
+            return None
+        item_count = struct.unpack_from('<H', payload, 6)[0]
+        offset = 8
+        request = None
+        for _ in range(item_count):
+            item_type, item_length = struct.unpack_from('<HH', payload, offset)
+            if item_type == ITEM_UNCONNECTED_DATA:
+                request = payload[offset + 4:offset + 4 + item_length]
+            offset += 4 + item_length
+        if request is None:
+            return None
+
+        self.requests += 1
+        reply = self.handle_cip(request, peer)
+        return b''.join([
+            struct.pack('<IHH', 0, 0, 2),
+            struct.pack('<HH', ITEM_NULL_ADDRESS, 0),
+            struct.pack('<HH', ITEM_UNCONNECTED_DATA, len(reply)),
+            reply,
+        ])
+
+    def handle_cip(self, request: bytes, peer: str) -> bytes:
+        """处理一条CIP请求，返回CIP应答"""
+        service = request[0]
+        path_length = request[1] * 2
+        path = parse_request_path(request[2:2 + path_length])
+        data = request[2 + path_length:]
+
+        def reply(status: int, body: bytes = b'', extended: Tuple[int, ...] = ()) -> bytes:
+            return (bytes([service | 0x80, 0, status, len(extended)])
+                    + b''.join(struct.pack('<H', word) for word in extended) + body)
+
+        class_code = path.get('class')
+        instance = path.get('instance')
+
+        if class_code == CLASS_ASSEMBLY and path.get('attribute') == ATTRIBUTE_DATA:
+            self.assembly_services[service, instance] += 1
+            if service == SERVICE_GET_ATTRIBUTE_SINGLE:
+                if instance == self.input_assembly:
+                    return reply(STATUS_SUCCESS, self.simulator.input_image())
+                if instance == self.output_assembly:
+                    return reply(STATUS_SUCCESS, self.simulator.read_output())
+                return reply(STATUS_PATH_UNKNOWN)
+            if service == SERVICE_SET_ATTRIBUTE_SINGLE:
+                if instance != self.output_assembly:
+                    return reply(STATUS_PATH_UNKNOWN)
+                if len(data) < self.simulator.output_size:
+                    return reply(STATUS_NOT_ENOUGH_DATA)
+                if len(data) > self.simulator.output_size:
+                    return reply(STATUS_TOO_MUCH_DATA)
+                self.simulator.write_output(0, data)
+                return reply(STATUS_SUCCESS)
+
+        if class_code == CLASS_IDENTITY and service == SERVICE_GET_ATTRIBUTES_ALL:
+            return reply(STATUS_SUCCESS, encode_identity(IDENTITY))
+
+        if class_code == CLASS_CONNECTION_MANAGER:
+            if service == SERVICE_UNCONNECTED_SEND and len(data) >= 4:
+                # 直接处理内嵌报文（模拟网关本身即目标，忽略路由路径）
+                size = struct.unpack_from('<H', data, 2)[0]
+                return self.handle_cip(data[4:4 + size], peer)
+            if service == SERVICE_FORWARD_OPEN:
+                return self._forward_open(data, peer, reply)
+            if service == SERVICE_FORWARD_CLOSE:
+                return self._forward_close(data, reply)
+
+        return reply(STATUS_SERVICE_NOT_SUPPORTED)
+
+    def _forward_open(self, data: bytes, peer: str, reply) -> bytes:
+        """建立Class 1连接"""
+        if len(data) < FORWARD_OPEN.size:
+            return reply(STATUS_NOT_ENOUGH_DATA)
+        (_, _, _, t_o_id, serial, vendor, originator, multiplier,
+         o_t_rpi, o_t_params, t_o_rpi, t_o_params, _) = FORWARD_OPEN.unpack_from(data)
+
+        # O->T带2字节序号和4字节运行/空闲头，T->O带2字节序号
+        if ((o_t_params & 0x01FF) != self.simulator.output_size + 6
+                or (t_o_params & 0x01FF) != self.simulator.input_size + 2):
+            return reply(STATUS_CONNECTION_FAILURE, extended=(EXT_INVALID_CONNECTION_SIZE,))
+
+        key = (serial, vendor, originator)
+        timeout = o_t_rpi / 1e6 * (4 << multiplier)
+        connection = IOConnection(key, random.getrandbits(32), t_o_id, o_t_rpi / 1e6, t_o_rpi / 1e6,
+                                  timeout, (peer, IO_PORT))
+        with self._lock:
+            old = self.connections.pop(key, None)
+            if old:
+                old.running = False
+            self.connections[key] = connection
+        threading.Thread(target=self._produce_loop, args=(connection,), daemon=True).start()
+
+        self.logger.info(f"Class 1连接已建立: O->T CID={connection.o_t_id:#010x}, "
+                         f"T->O CID={connection.t_o_id:#010x}, RPI={t_o_rpi / 1000:.1f}ms")
+        return reply(STATUS_SUCCESS, FORWARD_OPEN_REPLY.pack(
+            connection.o_t_id, connection.t_o_id, serial, vendor, originator, o_t_rpi, t_o_rpi, 0, 0))
+
+    def _forward_close(self, data: bytes, reply) -> bytes:
+        """关闭Class 1连接"""
+        if len(data) < FORWARD_CLOSE.size:
+            return reply(STATUS_NOT_ENOUGH_DATA)
+        _, _, serial, vendor, originator = FORWARD_CLOSE.unpack_from(data)
+        with self._lock:
+            connection = self.connections.pop((serial, vendor, originator), None)
+        if connection is None:
+            return reply(STATUS_CONNECTION_FAILURE, extended=(EXT_CONNECTION_NOT_FOUND,))
+        connection.running = False
+        self.logger.info(f"Class 1连接已关闭: O->T CID={connection.o_t_id:#010x}")
+        return reply(STATUS_SUCCESS, FORWARD_CLOSE_REPLY.pack(serial, vendor, originator, 0, 0))
+
+    def _receive_loop(self):
+        """接收O->T报文，更新输出映像"""
+        while self.running:
+            try:
+                packet, address = self._udp.recvfrom(1500)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+
+            parsed = parse_io_packet(packet)
+            if parsed is None:
+                continue
+            connection_id, _, payload = parsed
+            with self._lock:
+                connection = next((c for c in self.connections.values() if c.o_t_id == connection_id), None)
+            if connection is None:
+                continue
+
+            # T->O报文发回发送方的端口
+            connection.address = address
+            connection.last_received = time.monotonic()
+            connection.packets_received += 1
+            output = payload[6:6 + self.simulator.output_size]
+            if output != connection.last_output:
+                connection.last_output = output
+                self.simulator.write_output(0, output)
+
+    def _produce_loop(self, connection: IOConnection):
+        """按RPI周期发送T->O报文，超时未收到O->T时关闭连接"""
+        encap_sequence = 0
+        cip_sequence = 0
+        deadline = time.monotonic()
+        while connection.running and self.running:
+            if time.monotonic() - connection.last_received > connection.timeout:
+                self.logger.warning(f"Class 1连接超时: O->T CID={connection.o_t_id:#010x}")
+                with self._lock:
+                    if self.connections.get(connection.key) is connection:
+                        del self.connections[connection.key]
+                break
+
+            encap_sequence = (encap_sequence + 1) & 0xFFFFFFFF
+            cip_sequence = (cip_sequence + 1) & 0xFFFF
+            payload = struct.pack('<H', cip_sequence) + self.simulator.input_image()
+            try:
+                self._udp.sendto(build_io_packet(connection.t_o_id, encap_sequence, payload),
+                                 connection.address)
+                connection.packets_sent += 1
+            except OSError:
+                break
+
+            deadline += connection.t_o_rpi
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                deadline = time.monotonic()
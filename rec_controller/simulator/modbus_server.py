@@ -0,0 +1,160 @@
+"""模拟网关的Modbus RTU从站（伪终端）"""
+import logging
+import os
+import select
+import struct
+import threading
+import tty
+from typing import Optional
+
+from core.modbus import append_crc, check_crc
+from .device import RECSimulator
+
+# 功能码
+READ_HOLDING_REGISTERS = 0x03
+WRITE_SINGLE_REGISTER = 0x06
+WRITE_MULTIPLE_REGISTERS = 0x10
+
+# 异常码
+ILLEGAL_FUNCTION = 0x01
+ILLEGAL_DATA_ADDRESS = 0x02
+
+
+def request_length(header: bytes) -> int:
+    """根据请求帧头（从站、功能码、起始地址、数量、字节数）推算整帧长度
+
+    Returns:
+        帧长度，功能码无法识别时返回-1
+    """
+    function = header[1]
+    if function in (READ_HOLDING_REGISTERS, WRITE_SINGLE_REGISTER):
+        return 8
+    if function == WRITE_MULTIPLE_REGISTERS:
+        return 7 + header[6] + 2 if len(header) >= 7 else 9
+    return -1
+
+
+def handle_pdu(simulator: RECSimulator, pdu: bytes) -> bytes:
+    """处理请求PDU，返回应答PDU（RTU与TCP从站共用）"""
+    function = pdu[0]
+
+    def exception(code: int) -> bytes:
+        return bytes([function | 0x80, code])
+
+    if function == READ_HOLDING_REGISTERS:
+        address, count = struct.unpack_from('>HH', pdu, 1)
+        data = simulator.read_input(address * 2, count * 2)
+        if data is None:
+            return exception(ILLEGAL_DATA_ADDRESS)
+        return bytes([function, len(data)]) + data
+
+    if function == WRITE_SINGLE_REGISTER:
+        address = struct.unpack_from('>H', pdu, 1)[0]
+        if not simulator.write_output(address * 2, pdu[3:5]):
+            return exception(ILLEGAL_DATA_ADDRESS)
+        return pdu[:5]
+
+    if function == WRITE_MULTIPLE_REGISTERS:
+        address, count, byte_count = struct.unpack_from('>HHB', pdu, 1)
+        if not simulator.write_output(address * 2, pdu[6:6 + byte_count]):
+            return exception(ILLEGAL_DATA_ADDRESS)
+        return pdu[:5]
+
+    return exception(ILLEGAL_FUNCTION)
+
+
+class ModbusRTUServer:
+    """模拟网关的Modbus RTU从站
+
+    在伪终端的主端收发，从端路径（slave_path）可直接作为串口号交给
+    RECController（comm_type='serial'）。寄存器地址与字节地址的换算
+    与RECController一致：读保持寄存器返回输入映像，写寄存器写入输出映像。
+    """
+
+    def __init__(self, simulator: RECSimulator, slave_id: int = 0x01):
+        """
+        Args:
+            simulator: 模拟网关
+            slave_id: 从站地址
+        """
+        self.simulator = simulator
+        self.slave_id = slave_id
+        self.logger = logging.getLogger(__name__)
+        self.master_fd: Optional[int] = None
+        self.slave_fd: Optional[int] = None
+        self.slave_path: Optional[str] = None
+        self.running = False
+        self._thread: Optional[threading.Thread] = None
+        self.requests = 0
+        self.crc_errors = 0
+
+    def start(self) -> str:
+        """创建伪终端并启动从站线程
+
+        Returns:
+            从端设备路径
+        """
+        self.master_fd, self.slave_fd = os.openpty()
+        tty.setraw(self.master_fd)
+        tty.setraw(self.slave_fd)
+        self.slave_path = os.ttyname(self.slave_fd)
+        self.running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self.logger.info(f"模拟Modbus RTU从站已启动: {self.slave_path}, 从站地址{self.slave_id}")
+        return self.slave_path
+
+    def stop(self):
+        """停止从站并关闭伪终端"""
+        self.running = False
+        if self._thread:
+            self._thread.join(timeout=1)
+        for fd in (self.master_fd, self.slave_fd):
+            if fd is not None:
+                os.close(fd)
+        self.master_fd = self.slave_fd = None
+        self.logger.info("模拟Modbus RTU从站已停止")
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _read(self, length: int, timeout: float = 0.05) -> bytes:
+        """从主端读取指定字节数，超时返回已读到的部分"""
+        data = b''
+        while len(data) < length and self.running:
+            ready, _, _ = select.select([self.master_fd], [], [], timeout)
+            if not ready:
+                break
+            data += os.read(self.master_fd, length - len(data))
+        return data
+
+    def _run(self):
+        """从站循环：按帧头推算帧长，收齐后应答"""
+        while self.running:
+            frame = self._read(7, timeout=0.1)
+            if len(frame) < 2:
+                continue
+            length = request_length(frame)
+            if length < 0:
+                # 无法识别的帧，丢弃缓冲区等待下一帧
+                self._read(256, timeout=0.01)
+                continue
+            if len(frame) < length:
+                frame += self._read(length - len(frame))
+            if len(frame) < length or not check_crc(frame[:length]):
+                self.crc_errors += 1
+                continue
+
+            if frame[0] != self.slave_id:
+                continue
+            self.requests += 1
+            response = self.handle_pdu(frame[1:length - 2])
+            os.write(self.master_fd, append_crc(bytes([self.slave_id]) + response))
+
+    def handle_pdu(self, pdu: bytes) -> bytes:
+        """处理请求PDU，返回应答PDU"""
+        return handle_pdu(self.simulator, pdu)
@@ -0,0 +1,120 @@
+"""模拟网关的Modbus TCP服务"""
+import logging
+import queue
+import socket
+import socketserver
+import threading
+import time
+
+from core.modbus_tcp import MBAP_HEADER
+from .device import RECSimulator
+from .modbus_server import handle_pdu
+
+
+class _ConnectionHandler(socketserver.BaseRequestHandler):
+    """一条TCP连接：收到请求立即处理，应答延迟 latency 秒后按顺序发出"""
+
+    def handle(self):
+        server: 'ModbusTCPServer' = self.server.simulator_server
+        sock: socket.socket = self.request
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        replies: 'queue.Queue' = queue.Queue()
+        sender = threading.Thread(target=self._send_loop, args=(sock, replies), daemon=True)
+        sender.start()
+        buffer = b''
+
+        try:
+            while True:
+                try:
+                    chunk = sock.recv(4096)
+                except OSError:
+                    break
+                if not chunk:
+                    break
+                buffer += chunk
+
+                while len(buffer) >= MBAP_HEADER.size:
+                    transaction_id, protocol_id, length, unit_id = MBAP_HEADER.unpack_from(buffer)
+                    if len(buffer) < MBAP_HEADER.size + length - 1:
+                        break
+                    pdu = buffer[MBAP_HEADER.size:MBAP_HEADER.size + length - 1]
+                    buffer = buffer[MBAP_HEADER.size + length - 1:]
+                    if protocol_id != 0:
+                        continue
+
+                    server.requests += 1
+                    reply = handle_pdu(server.simulator, pdu)
+                    frame = MBAP_HEADER.pack(transaction_id, 0, len(reply) + 1, unit_id) + reply
+                    replies.put((time.monotonic() + server.latency, frame))
+        finally:
+            replies.put(None)
+            sender.join(timeout=1)
+
+    @staticmethod
+    def _send_loop(sock: socket.socket, replies: 'queue.Queue'):
+        while True:
+            item = replies.get()
+            if item is None:
+                return
+            due, frame = item
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                sock.sendall(frame)
+            except OSError:
+                return
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class ModbusTCPServer:
+    """模拟网关的Modbus TCP服务端
+
+    寄存器映射与Modbus RTU从站相同。latency 模拟网络往返：
+    应答在收到请求 latency 秒后发出，期间可以继续接收请求，
+    因此流水线发送的多个请求只需等待一次往返。
+    """
+
+    def __init__(self, simulator: RECSimulator, host: str = '127.0.0.1', port: int = 502,
+                 latency: float = 0.0):
+        """
+        Args:
+            simulator: 模拟网关
+            host: 监听地址
+            port: TCP端口，0为自动分配
+            latency: 应答延迟(秒)
+        """
+        self.simulator = simulator
+        self.host = host
+        self.latency = latency
+        self.logger = logging.getLogger(__name__)
+        self._tcp = _TCPServer((host, port), _ConnectionHandler)
+        self._tcp.simulator_server = self
+        self.port = self._tcp.server_address[1]
+        self._thread = None
+        self.requests = 0
+
+    def start(self):
+        """启动服务线程"""
+        self._thread = threading.Thread(target=self._tcp.serve_forever, daemon=True)
+        self._thread.start()
+        self.logger.info(f"模拟Modbus TCP服务已启动: {self.host}:{self.port}")
+
+    def stop(self):
+        """停止服务"""
+        self._tcp.shutdown()
+        self._tcp.server_close()
+        if self._thread:
+            self._thread.join(timeout=1)
+        self.logger.info("模拟Modbus TCP服务已停止")
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -48,6 +48,8 @@ def main():
                         help='使用命令行模式')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='显示详细日志')
+    parser.add_argument('--simulate', action='store_true',
+                        help='在本机启动网关模拟器并测试 127.0.0.1（无需硬件）')
 
     args = parser.parse_args()
 
@@ -58,12 +60,23 @@ def main():
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
-    if args.cli:
-        # 命令行模式
-        return run_cli_test(args.ip)
-    else:
-        # GUI模式
-        run_gui_test(args.ip)
+    server = None
+    if args.simulate:
+        from simulator import RECSimulator, EIPServer
+        server = EIPServer(RECSimulator())
+        server.start()
+        args.ip = server.host
+
+    try:
+        if args.cli:
+            # 命令行模式
+            return run_cli_test(args.ip)
+        else:
+            # GUI模式
+            run_gui_test(args.ip)
+    finally:
+        if server:
+            server.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,101 @@
+"""
+REC控制器asyncio接口测试模块
+"""
+import asyncio
+import time
+import pytest
+from core.async_controller import AsyncRECController
+from core.async_actuator import AsyncECActuator
+from core.rec_controller import RECController
+from simulator import RECSimulator, EIPServer
+from simulator.eip_server import SERVICE_GET_ATTRIBUTE_SINGLE
+from simulator.modbus_tcp_server import ModbusTCPServer
+
+
+class TestAsyncRECController:
+    """asyncio接口测试类（本机模拟网关，显式报文）"""
+
+    @pytest.fixture
+    def server(self):
+        """模拟网关"""
+        with EIPServer(RECSimulator(2, stroke_time=0.2, latency=0.01), port=0, io_port=0) as server:
+            yield server
+
+    @pytest.fixture
+    def controller(self, server):
+        """已连接的asyncio控制器"""
+        controller = AsyncRECController(comm_type='ethernet_ip',
+                                        ip_address=f"{server.host}:{server.port}", unit_count=2)
+        assert asyncio.run(controller.connect())
+        yield controller
+        controller.controller.disconnect()
+
+    @staticmethod
+    def snapshot_reads(server) -> int:
+        """网关收到的输入组件读取次数"""
+        return server.assembly_services[SERVICE_GET_ATTRIBUTE_SINGLE, 100]
+
+    def test_concurrent_reads_share_snapshot(self, controller, server):
+        """测试同时请求状态的多个协程共用一次过程映像读取"""
+        async def scenario():
+            images = await asyncio.gather(*[controller.read_process_image() for _ in range(10)])
+            statuses = await asyncio.gather(*[controller.read_axis_status(0, axis, max_age=1.0)
+                                              for axis in range(4)])
+            return images, statuses
+
+        reads = self.snapshot_reads(server)
+        images, statuses = asyncio.run(scenario())
+        assert all(image is images[0] for image in images)
+        assert images[0].data == server.simulator.input_image()
+        assert statuses == [images[0].axis_status(0, axis) for axis in range(4)]
+        assert self.snapshot_reads(server) - reads == 1
+
+    def test_wait_until_timeout(self, controller):
+        """测试条件不满足时等待在超时后返回False"""
+        started = time.monotonic()
+        assert not asyncio.run(controller.wait_until(lambda image: False, 0.2, interval=0.05))
+        assert 0.2 <= time.monotonic() - started < 1.0
+
+    def test_home_and_move(self, controller, server):
+        """测试原点复归和往复运动在动作完成时返回"""
+        actuator = AsyncECActuator(controller, 0, 1)
+
+        async def scenario():
+            assert await actuator.home(timeout=2.0)
+            assert await actuator.move_forward()
+            # 运动中读到的只有忙碌位
+            assert not await actuator.wait_for_position('forward', timeout=0.05)
+            assert await actuator.wait_for_position('forward', timeout=2.0)
+            assert not await actuator.wait_for_position('backward', timeout=0.1)
+            await actuator.stop()
+            assert await actuator.cycle_motion(1, dwell_time=0.0)
+
+        asyncio.run(scenario())
+        assert server.simulator.axis(0, 1).position == 0.0
+
+
+class TestAsyncModbusTCP:
+    """asyncio接口测试类（本机模拟网关，Modbus TCP）"""
+
+    def test_snapshot_read_does_not_block_channel(self):
+        """测试等待快照应答期间I/O通道仍可执行其它操作"""
+        latency = 0.3
+        with ModbusTCPServer(RECSimulator(2), port=0, latency=latency) as server:
+            controller = AsyncRECController(comm_type='modbus_tcp', ip_address=server.host,
+                                            tcp_port=server.port, unit_count=2)
+
+            async def scenario():
+                assert await controller.connect()
+                read = asyncio.ensure_future(controller.read_process_image())
+                await asyncio.sleep(0.05)
+                started = time.monotonic()
+                await controller._run(lambda: None)
+                blocked = time.monotonic() - started
+                return await read, blocked
+
+            try:
+                image, blocked = asyncio.run(scenario())
+            finally:
+                controller.controller.disconnect()
+        assert image is not None and image.data == server.simulator.input_image()
+        assert blocked < latency / 2
@@ -0,0 +1,96 @@
+"""
+数据解析工具测试模块
+"""
+import random
+import struct
+import numpy as np
+from utils.data_parser import DataParser
+
+
+def reference_bytes_to_words(data):
+    """原实现：逐字struct解包，末尾不足一个字的字节忽略"""
+    words = []
+    for i in range(0, len(data), 2):
+        if i + 1 < len(data):
+            words.append(struct.unpack('<H', data[i:i + 2])[0])
+    return words
+
+
+def reference_words_to_bytes(words):
+    """原实现：逐字struct打包"""
+    data = b''
+    for word in words:
+        data += struct.pack('<H', word & 0xFFFF)
+    return data
+
+
+def reference_word_to_bits(word):
+    """原实现：逐位移位"""
+    return [(word >> i) & 1 for i in range(16)]
+
+
+class TestDataParser:
+    """数据解析器测试类（与原struct实现逐项比较）"""
+
+    @staticmethod
+    def samples():
+        """包含空数据、奇数长度和边界值的测试数据"""
+        rng = random.Random(19)
+        samples = [b'', b'\x01', b'\x00\x00', b'\xff\xff', b'\x34\x12\x78', bytes(range(256))]
+        samples += [bytes(rng.getrandbits(8) for _ in range(rng.randrange(1, 64))) for _ in range(20)]
+        return samples
+
+    def test_bytes_to_words(self):
+        """测试字节转字（含奇数长度）"""
+        for data in self.samples():
+            expected = reference_bytes_to_words(data)
+            assert DataParser.bytes_to_words(data) == expected
+            assert DataParser.bytes_to_words(bytearray(data)) == expected
+            assert list(DataParser.words_view(data)) == expected
+
+    def test_memoryview_slices(self):
+        """测试memoryview切片（奇数起点、奇数长度）不复制也得到相同结果"""
+        data = bytes(range(1, 42))
+        view = memoryview(data)
+        for start, stop in ((0, 41), (1, 41), (3, 10), (5, 6), (7, 7)):
+            expected = reference_bytes_to_words(data[start:stop])
+            assert DataParser.bytes_to_words(view[start:stop]) == expected
+            assert DataParser.bytes_to_word_array(view[start:stop]).tolist() == expected
+            assert DataParser.words_to_bits_array(view[start:stop]).shape == (len(expected), 16)
+
+    def test_words_to_bytes(self):
+        """测试字转字节（超出16位的值截断）"""
+        rng = random.Random(19)
+        cases = [[], [0], [0xFFFF], [0x1234, 0xABCD], [0x12345, -1]]
+        cases += [[rng.getrandbits(16) for _ in range(rng.randrange(1, 32))] for _ in range(20)]
+        for words in cases:
+            assert DataParser.words_to_bytes(words) == reference_words_to_bytes(words)
+
+    def test_word_to_bits(self):
+        """测试单字展开为位"""
+        for word in list(range(0, 0x10000, 257)) + [0x0001, 0x8000, 0xFFFF]:
+            bits = DataParser.word_to_bits(word)
+            assert bits == reference_word_to_bits(word)
+            assert DataParser.bits_to_word(bits) == word
+
+    def test_words_to_bits_array(self):
+        """测试批量展开与逐字展开一致"""
+        for data in self.samples():
+            words = reference_bytes_to_words(data)
+            expected = [reference_word_to_bits(word) for word in words]
+            assert DataParser.words_to_bits_array(data).tolist() == expected
+            array = np.array(words, dtype=np.uint16)
+            assert DataParser.words_to_bits_array(array).tolist() == expected
+
+    def test_bits_words_round_trip(self):
+        """测试位与字的批量往返转换"""
+        rng = np.random.default_rng(19)
+        bits = rng.integers(0, 2, size=(33, 16), dtype=np.uint8)
+        words = DataParser.bits_array_to_words(bits)
+        assert words.tolist() == [DataParser.bits_to_word(row.tolist()) for row in bits]
+        assert (DataParser.words_to_bits_array(words) == bits).all()
+
+        for data in self.samples():
+            words = DataParser.bytes_to_word_array(data)
+            assert (DataParser.bits_array_to_words(DataParser.words_to_bits_array(words)) == words).all()
+            assert DataParser.words_to_bytes(DataParser.bytes_to_words(data)) == data[:len(data) // 2 * 2]
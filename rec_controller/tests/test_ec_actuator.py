@@ -0,0 +1,110 @@
+"""
+EC电缸控制测试模块
+"""
+import logging
+import time
+import pytest
+from core.ec_actuator import ECActuator, motion_complete
+from core.process_image import AxisStatus, AXIS_STATUS_FLAGS
+from core.rec_controller import RECController
+from simulator import RECSimulator, EIPServer
+from utils.clock import VirtualClock
+
+READY = AXIS_STATUS_FLAGS['ready']
+BUSY = AXIS_STATUS_FLAGS['busy']
+DONE = AXIS_STATUS_FLAGS['done']
+ALARM = AXIS_STATUS_FLAGS['alarm']
+
+
+class ScriptedController:
+    """按顺序返回给定状态字的控制器，最后一个状态字一直保持"""
+
+    def __init__(self, *words: int):
+        self.words = list(words)
+        self.commands = []
+        self.polling = False
+        self.logger = logging.getLogger(__name__)
+
+    def read_axis_status(self, unit_index, axis_index):
+        word = self.words.pop(0) if len(self.words) > 1 else self.words[0]
+        return AxisStatus(word)
+
+    def send_axis_command(self, unit_index, axis_index, command, value=True):
+        self.commands.append((command, value))
+        return True
+
+    def send_axis_commands(self, unit_index, axis_index, commands):
+        self.commands.extend(commands.items())
+        return True
+
+
+class TestECActuator:
+    """EC电缸控制测试类"""
+
+    def test_motion_complete(self):
+        """测试到达判断：只有完成位置位且不忙碌、无报警才算到达"""
+        assert motion_complete(AxisStatus(READY | DONE))
+        assert not motion_complete(AxisStatus(READY | BUSY))
+        assert not motion_complete(AxisStatus(READY | BUSY | DONE))
+        assert not motion_complete(AxisStatus(ALARM | DONE))
+        assert not motion_complete(AxisStatus(READY))
+        assert not motion_complete(None)
+
+    def test_busy_is_not_arrival(self):
+        """测试轴只是忙碌时不会判为到达任何一端"""
+        for position, move in (('forward', 'move_forward'), ('backward', 'move_backward')):
+            actuator = ECActuator(ScriptedController(READY | BUSY), 0, 0, clock=VirtualClock())
+            getattr(actuator, move)()
+            assert actuator.wait_for_position(position, timeout=1.0) is False
+
+        controller = ScriptedController(READY | BUSY)
+        assert ECActuator(controller, 0, 0, clock=VirtualClock()).home(timeout=1.0) is False
+        assert controller.commands == [('ST0', True), ('ST0', False)]
+
+    def test_arrival_after_busy(self):
+        """测试忙碌之后完成位置位时到达"""
+        clock = VirtualClock()
+        actuator = ECActuator(ScriptedController(READY | BUSY, READY | BUSY, READY | DONE), 0, 0,
+                              clock=clock)
+        actuator.move_backward()
+        assert actuator.wait_for_position('backward', timeout=1.0)
+        assert clock.time() == pytest.approx(0.1)
+
+    def test_wrong_direction(self):
+        """测试等待的方向与最后的移动命令不符时直接失败"""
+        actuator = ECActuator(ScriptedController(READY | DONE), 0, 0, clock=VirtualClock())
+        actuator.move_forward()
+        assert actuator.wait_for_position('backward') is False
+        assert actuator.wait_for_position('sideways') is False
+        assert actuator.wait_for_position('forward') is True
+
+    @staticmethod
+    def run_stroke(polling: bool):
+        """在模拟网关上往复运动一次，到达时间不早于行程时间"""
+        stroke_time = 0.2
+        with EIPServer(RECSimulator(1, stroke_time=stroke_time, latency=0.01),
+                       port=0, io_port=0) as server:
+            controller = RECController('ethernet_ip', ip_address=f"{server.host}:{server.port}")
+            assert controller.connect()
+            try:
+                if polling:
+                    controller.start_status_poller(0.005)
+                actuator = ECActuator(controller, 0, 1)
+                for position, move in (('forward', actuator.move_forward),
+                                       ('backward', actuator.move_backward)):
+                    start = time.monotonic()
+                    assert move()
+                    assert actuator.wait_for_position(position, timeout=2.0)
+                    assert time.monotonic() - start >= stroke_time
+                    actuator.stop()
+                assert server.simulator.axis(0, 1).position == 0.0
+            finally:
+                controller.disconnect()
+
+    def test_stroke_with_simulator(self):
+        """测试逐次读取状态时的往复运动"""
+        self.run_stroke(polling=False)
+
+    def test_stroke_with_poller(self):
+        """测试由集中轮询器唤醒时的往复运动"""
+        self.run_stroke(polling=True)
@@ -0,0 +1,65 @@
+"""
+EtherNet/IP显式报文测试模块
+"""
+import pytest
+from core.ethernet_ip import EtherNetIPClient
+from simulator import RECSimulator, EIPServer
+from simulator.eip_server import SERVICE_GET_ATTRIBUTE_SINGLE, SERVICE_SET_ATTRIBUTE_SINGLE
+
+GET = SERVICE_GET_ATTRIBUTE_SINGLE
+SET = SERVICE_SET_ATTRIBUTE_SINGLE
+
+
+class TestEtherNetIPClient:
+    """EtherNet/IP客户端测试类（本机模拟网关，组件对象读写）"""
+
+    @pytest.fixture
+    def server(self):
+        """模拟网关"""
+        with EIPServer(RECSimulator(2), port=0, io_port=0) as server:
+            yield server
+
+    @pytest.fixture
+    def client(self, server):
+        """已连接的客户端"""
+        client = EtherNetIPClient(f"{server.host}:{server.port}")
+        assert client.connect()
+        yield client
+        client.disconnect()
+
+    def test_read_data(self, client, server):
+        """测试读取输入组件并按字节地址截取"""
+        image = server.simulator.input_image()
+        assert client.read_data(0, len(image)) == image
+        assert client.read_data(4, 2) == image[4:6]
+        assert server.assembly_services[GET, 100] == 2
+
+    def test_write_data(self, client, server):
+        """测试写入输出组件：首次写入先读取一次，之后每次写入只需一次Set"""
+        assert client.write_data(2, b'\x02\x00')
+        assert client.write_data(4, b'\x20\x00')
+        assert server.simulator.read_output(2, 4) == b'\x02\x00\x20\x00'
+        assert server.assembly_services[GET, 150] == 1
+        assert server.assembly_services[SET, 150] == 2
+
+        assert client.read_output_data(2, 2) == b'\x02\x00'
+        assert not client.write_data(server.simulator.output_size, b'\x00\x00')
+
+    def test_other_writer_seen_after_read(self, client, server):
+        """测试读取输出组件会刷新本地副本"""
+        assert client.write_data(2, b'\x01\x00')
+        server.simulator.write_output(4, b'\x10\x00')
+        assert client.read_output_data(4, 2) == b'\x10\x00'
+        assert client.write_data(2, b'\x02\x00')
+        assert server.simulator.read_output(2, 4) == b'\x02\x00\x10\x00'
+
+    def test_unknown_assembly(self, server):
+        """测试组件实例不存在时读写失败"""
+        client = EtherNetIPClient(f"{server.host}:{server.port}", input_assembly=101,
+                                  output_assembly=151)
+        assert client.connect()
+        try:
+            assert client.read_data(0, 2) is None
+            assert client.write_data(2, b'\x01\x00') is False
+        finally:
+            client.disconnect()
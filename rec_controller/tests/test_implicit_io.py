@@ -0,0 +1,91 @@
+"""
+EtherNet/IP隐式报文测试模块
+"""
+import time
+import pytest
+from pycomm3 import CIPDriver
+from core.implicit_io import ImplicitIOConnection
+from simulator import RECSimulator, EIPServer
+
+
+def wait_for(predicate, timeout=2.0):
+    """轮询等待条件成立"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestImplicitIOConnection:
+    """Class 1循环I/O连接测试类（本机模拟网关）"""
+
+    @pytest.fixture
+    def server(self):
+        """模拟网关"""
+        with EIPServer(RECSimulator(2), port=0, io_port=0) as server:
+            yield server
+
+    @pytest.fixture
+    def driver(self, server):
+        """已打开会话的驱动"""
+        driver = CIPDriver(f"{server.host}:{server.port}")
+        driver.open()
+        yield driver
+        driver.close()
+
+    @pytest.fixture
+    def connection(self, server, driver):
+        """已建立的隐式连接（本地端口自动分配）"""
+        simulator = server.simulator
+        connection = ImplicitIOConnection(driver, server.host, simulator.input_size,
+                                          simulator.output_size, rpi=10.0, port=0,
+                                          target_port=server.io_port)
+        assert connection.open()
+        yield connection
+        connection.close()
+
+    def test_forward_open(self, connection, server):
+        """测试Forward Open在网关上建立连接并开始收到输入"""
+        assert len(server.connections) == 1
+        assert wait_for(lambda: connection.alive)
+        assert connection.o_t_connection_id
+
+    def test_input_data(self, connection, server):
+        """测试网关输入映像变化后随周期报文到达本地缓冲区"""
+        simulator = server.simulator
+        assert wait_for(lambda: connection.read_input(0, simulator.input_size) == simulator.input_image())
+
+        simulator.axis(0, 1).position = 0.5
+        simulator.inject_alarm(0, 1)
+        assert simulator.input_image() != connection.read_input(0, simulator.input_size)
+        assert wait_for(lambda: connection.read_input(0, simulator.input_size) == simulator.input_image())
+        assert connection.read_input(simulator.input_size, 2) is None
+
+    def test_output_data(self, connection, server):
+        """测试写入本地输出缓冲区后随周期报文到达网关"""
+        assert connection.write_output(2, b'\x02\x01')
+        assert connection.read_output(2, 2) == b'\x02\x01'
+        assert wait_for(lambda: server.simulator.read_output(2, 2) == b'\x02\x01')
+        assert not connection.write_output(server.simulator.output_size, b'\x00')
+
+    def test_forward_close(self, connection, server):
+        """测试Forward Close在网关上关闭连接"""
+        assert wait_for(lambda: connection.alive)
+        connection.close()
+        assert not server.connections
+        assert not connection.alive
+        assert not connection.write_output(2, b'\x00\x00')
+
+    def test_timeout(self, connection, server):
+        """测试停止发送输出后网关按超时关闭连接，本地输入随之失效"""
+        assert wait_for(lambda: connection.alive)
+        # 只停止发送线程，不发送Forward Close
+        connection.running = False
+        connection._sender.join(1)
+        connection.running = True
+
+        assert wait_for(lambda: not server.connections)
+        assert wait_for(lambda: not connection.alive)
+        assert connection.read_input(0, 2) is None
@@ -0,0 +1,113 @@
+"""
+串行化I/O通道测试模块
+"""
+import threading
+import time
+import pytest
+from core.io_channel import IOChannel
+
+
+class TestIOChannel:
+    """串行化I/O通道测试类"""
+
+    @pytest.fixture
+    def channel(self):
+        """I/O通道"""
+        channel = IOChannel('test-io')
+        yield channel
+        channel.stop()
+
+    def test_serialized(self, channel):
+        """测试多个线程提交的操作都在I/O线程中逐个执行"""
+        active = []
+        overlaps = []
+        threads_seen = set()
+        lock = threading.Lock()
+
+        def operation(i):
+            with lock:
+                active.append(i)
+                overlaps.append(len(active))
+            threads_seen.add(threading.current_thread().name)
+            time.sleep(0.002)
+            with lock:
+                active.remove(i)
+            return i * 2
+
+        results = {}
+
+        def worker(start):
+            for i in range(start, start + 10):
+                results[i] = channel.call(operation, i)
+
+        workers = [threading.Thread(target=worker, args=(n * 10,)) for n in range(8)]
+        for worker_thread in workers:
+            worker_thread.start()
+        for worker_thread in workers:
+            worker_thread.join(5)
+
+        assert results == {i: i * 2 for i in range(80)}
+        assert max(overlaps) == 1
+        assert threads_seen == {'test-io'}
+        assert channel.statistics()['operations'] == 80
+
+    def test_nested_call(self, channel):
+        """测试在I/O线程中嵌套调用直接执行，不会自身等待死锁"""
+        def inner():
+            return channel.in_channel_thread()
+
+        def outer():
+            future = channel.submit(inner)
+            # 嵌套提交同步执行，返回时已经完成
+            assert future.done()
+            return channel.call(inner), future.result()
+
+        assert channel.call(outer) == (True, True)
+        assert not channel.in_channel_thread()
+
+    def test_exception_propagates(self, channel):
+        """测试操作抛出的异常在调用线程重新抛出，I/O线程继续工作"""
+        def fail():
+            raise ValueError("bad")
+
+        with pytest.raises(ValueError):
+            channel.call(fail)
+        assert channel.call(lambda: 1) == 1
+        stats = channel.statistics()
+        assert stats['operations'] == 2 and stats['errors'] == 1
+
+    def test_stop_and_restart(self, channel):
+        """测试停止前执行完已提交的操作，停止后再次提交会重新启动"""
+        gate = threading.Event()
+        done = []
+        channel.submit(gate.wait, 2)
+        futures = [channel.submit(done.append, i) for i in range(3)]
+
+        stopper = threading.Thread(target=channel.stop)
+        stopper.start()
+        gate.set()
+        stopper.join(2)
+
+        assert not stopper.is_alive()
+        assert done == [0, 1, 2] and all(future.done() for future in futures)
+        assert channel.call(lambda: 'again') == 'again'
+
+    def test_submit_after_stop_signal(self, channel):
+        """测试停止信号之后、I/O线程退出之前提交的操作仍会执行"""
+        gate = threading.Event()
+        channel.submit(gate.wait, 2)
+        stopper = threading.Thread(target=channel.stop)
+        stopper.start()
+        time.sleep(0.05)
+        # I/O线程仍在运行（阻塞在上一个操作中），新操作排在停止信号之后
+        future = channel.submit(lambda: 'after stop')
+        gate.set()
+
+        assert future.result(timeout=1) == 'after stop'
+        stopper.join(1)
+        assert not stopper.is_alive()
+
+    def test_stop_from_channel_thread(self, channel):
+        """测试在I/O线程中停止不会等待自身"""
+        assert channel.call(channel.stop) is None
+        assert channel.call(lambda: 'restarted') == 'restarted'
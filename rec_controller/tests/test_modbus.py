@@ -0,0 +1,60 @@
+"""
+Modbus RTU协议工具测试模块
+"""
+from core.modbus import (CRC16_TABLE, crc16, check_crc, append_crc,
+                         remaining_response_length, silent_interval)
+
+
+def bitwise_crc16(data: bytes) -> int:
+    """逐位计算的CRC16（原实现），作为对照"""
+    crc = 0xFFFF
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            if crc & 0x0001:
+                crc = (crc >> 1) ^ 0xA001
+            else:
+                crc >>= 1
+    return crc
+
+
+class TestModbus:
+    """Modbus RTU协议工具测试类"""
+
+    def test_crc_table(self):
+        """测试查表与逐位计算一致"""
+        assert len(CRC16_TABLE) == 256
+        assert CRC16_TABLE[1] == 0xC0C1
+        assert crc16(b'123456789') == 0x4B37
+        for data in (b'', b'\x01', b'\x01\x03\x00\x00\x00\x01', bytes(range(256))):
+            assert crc16(data) == bitwise_crc16(data)
+
+    def test_crc_inputs(self):
+        """测试bytearray、memoryview（含非字节格式）和分段计算"""
+        data = bytes(range(64))
+        expected = crc16(data)
+        assert crc16(bytearray(data)) == expected
+        assert crc16(memoryview(data)[10:]) == crc16(data[10:])
+        assert crc16(memoryview(data).cast('H')) == expected
+        assert crc16(data[20:], crc16(data[:20])) == expected
+
+    def test_check_crc(self):
+        """测试整帧校验"""
+        frame = append_crc(b'\x01\x03\x00\x00\x00\x01')
+        assert frame == b'\x01\x03\x00\x00\x00\x01\x84\x0a'
+        assert check_crc(frame)
+        assert check_crc(memoryview(frame))
+        assert not check_crc(frame[:-1] + b'\x00')
+        assert not check_crc(frame[:2])
+
+    def test_remaining_response_length(self):
+        """测试按帧头推算应答剩余长度"""
+        assert remaining_response_length(b'\x01\x03\x04') == 6
+        assert remaining_response_length(b'\x01\x06\x00') == 5
+        assert remaining_response_length(b'\x01\x83\x02') == 2
+        assert remaining_response_length(b'\x01\x2b\x00') == -1
+
+    def test_silent_interval(self):
+        """测试帧间静止时间"""
+        assert silent_interval(9600) == 3.5 * 11 / 9600
+        assert silent_interval(115200) == 0.00175
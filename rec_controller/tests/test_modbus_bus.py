@@ -0,0 +1,125 @@
+"""
+RS-485多站总线调度测试模块
+"""
+import threading
+import time
+import pytest
+from core.modbus import append_crc
+from core.modbus_bus import ModbusRTUBus
+from core.rec_controller import RECController
+from simulator import RECSimulator, ModbusRTUServer
+
+
+class FakeSerialClient:
+    """记录事务顺序的串口：第一个事务阻塞到放行，期间其它请求排队"""
+
+    def __init__(self):
+        self.port = 'fake'
+        self.baudrate = 115200
+        self.timeout = 0.1
+        self.frames = []
+        self.gate = threading.Event()
+        self.connected = False
+
+    def connect(self) -> bool:
+        self.connected = True
+        return True
+
+    def disconnect(self):
+        self.connected = False
+
+    def query(self, command: bytes) -> bytes:
+        self.frames.append(command)
+        if len(self.frames) == 1:
+            self.gate.wait(2)
+        slave_id, function = command[0], command[1]
+        if slave_id == 9:
+            # 异常应答：非法数据地址
+            return append_crc(bytes([slave_id, function | 0x80, 0x02]))
+        if function == 0x03:
+            return append_crc(bytes([slave_id, 0x03, 0x02, 0x00, slave_id]))
+        return command
+
+
+def wait_for(predicate, timeout: float = 2.0):
+    """等待条件成立"""
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+class TestModbusBus:
+    """RS-485多站总线调度测试类"""
+
+    READ = b'\x03\x00\x00\x00\x01'
+    WRITE = b'\x06\x00\x01\x00\x01'
+
+    @pytest.fixture
+    def bus(self):
+        """使用假串口的总线"""
+        bus = ModbusRTUBus('fake')
+        bus.client = FakeSerialClient()
+        assert bus.attach()
+        yield bus
+        bus.client.gate.set()
+        bus.detach()
+
+    def test_write_priority_and_round_robin(self, bus):
+        """测试写请求优先，读请求按从站轮询，一个从站的大量轮询不饿死其它从站"""
+        first = bus.submit(1, self.READ)
+        assert wait_for(lambda: len(bus.client.frames) == 1)
+
+        futures = [bus.submit(1, self.READ) for _ in range(3)]
+        futures.append(bus.submit(2, self.READ))
+        futures.append(bus.submit(3, self.READ))
+        futures.append(bus.submit(2, self.WRITE, write=True))
+        assert bus.pending() == 6
+        bus.client.gate.set()
+
+        assert first.result(2)[4] == 1
+        assert all(future.result(2) for future in futures)
+        order = [(frame[0], frame[1]) for frame in bus.client.frames[1:]]
+        assert order == [(2, 0x06), (1, 0x03), (2, 0x03), (3, 0x03), (1, 0x03), (1, 0x03)]
+        assert bus.transactions == 7 and bus.errors == 0
+
+    def test_exception_response(self, bus):
+        """测试异常应答和从站地址不符的应答视为失败"""
+        bus.client.gate.set()
+        assert bus.request(9, self.READ) is None
+        assert bus.errors == 1
+
+        bus.client.query = lambda command: append_crc(b'\x05\x03\x02\x00\x05')
+        assert bus.request(1, self.READ) is None
+        assert bus.errors == 2
+
+    def test_detach_fails_pending(self, bus):
+        """测试最后一个使用者注销时，排队的请求以失败结束"""
+        bus.submit(1, self.READ)
+        assert wait_for(lambda: len(bus.client.frames) == 1)
+        pending = [bus.submit(slave_id, self.READ) for slave_id in (1, 2, 3)]
+
+        detach = threading.Thread(target=bus.detach)
+        detach.start()
+        time.sleep(0.05)
+        bus.client.gate.set()
+        detach.join(2)
+
+        assert [future.result(2) for future in pending] == [None, None, None]
+        assert not bus.client.connected
+        assert bus.submit(1, self.READ).result(0) is None
+
+    def test_shared_port(self):
+        """测试同一串口上的多个控制器共享一条总线，最后一个断开时才关闭串口"""
+        with ModbusRTUServer(RECSimulator(1)) as server:
+            first = RECController('serial', port=server.slave_path, baudrate=115200)
+            second = RECController('serial', port=server.slave_path, baudrate=115200)
+            assert first.bus is second.bus
+            assert first.connect() and second.connect()
+
+            first.disconnect()
+            assert second.client.is_connected()
+            assert second.read_data(0, 2) is not None
+
+            second.disconnect()
+            assert not second.client.is_connected()
@@ -0,0 +1,165 @@
+"""
+Modbus TCP通信测试模块
+"""
+import socket
+import threading
+import time
+import pytest
+from core.modbus_tcp import ModbusTCPClient, MBAP_HEADER
+from core.rec_controller import RECController
+from core.process_image import input_image_size
+from simulator import RECSimulator, ModbusTCPServer
+
+LATENCY = 0.05
+READ_PDU = b'\x03\x00\x00\x00\x01'
+
+
+class ScriptedServer:
+    """收齐指定数量的请求后，按脚本给出的帧应答（可乱序、可缺失）"""
+
+    def __init__(self, count: int, script):
+        """
+        Args:
+            count: 先接收的请求数
+            script: 参数为 [(事务ID, 单元ID, PDU), ...]，返回要发出的应答帧列表
+        """
+        self.listener = socket.create_server(('127.0.0.1', 0))
+        self.port = self.listener.getsockname()[1]
+        self.count = count
+        self.script = script
+        self.connection = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _recv_exact(self, length: int) -> bytes:
+        data = b''
+        while len(data) < length:
+            data += self.connection.recv(length - len(data))
+        return data
+
+    def _run(self):
+        self.connection, _ = self.listener.accept()
+        requests = []
+        for _ in range(self.count):
+            transaction_id, _, length, unit_id = MBAP_HEADER.unpack(self._recv_exact(MBAP_HEADER.size))
+            requests.append((transaction_id, unit_id, self._recv_exact(length - 1)))
+        for frame in self.script(requests):
+            self.connection.sendall(frame)
+
+    def close(self):
+        if self.connection:
+            self.connection.close()
+        self.listener.close()
+
+
+def reply(transaction_id: int, pdu: bytes, protocol_id: int = 0, unit_id: int = 1) -> bytes:
+    """构造应答帧"""
+    return MBAP_HEADER.pack(transaction_id, protocol_id, len(pdu) + 1, unit_id) + pdu
+
+
+class TestModbusTCP:
+    """Modbus TCP测试类（本机模拟网关，应答延迟模拟网络往返）"""
+
+    @pytest.fixture
+    def server(self):
+        """模拟网关"""
+        with ModbusTCPServer(RECSimulator(2), port=0, latency=LATENCY) as server:
+            yield server
+
+    @pytest.fixture
+    def controller(self, server):
+        """已连接的控制器"""
+        controller = RECController('modbus_tcp', ip_address=server.host, tcp_port=server.port,
+                                   unit_count=2)
+        assert controller.connect()
+        yield controller
+        controller.disconnect()
+
+    def test_concurrent_reads_pipelined(self, controller):
+        """测试多个线程的读取同时在途，不经I/O通道逐个等待往返"""
+        results = []
+
+        def read():
+            results.append(controller.read_process_image())
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(2)
+        elapsed = time.monotonic() - start
+
+        assert len(results) == 8 and all(image is not None for image in results)
+        assert elapsed < 4 * LATENCY
+
+    def test_read_many(self, controller):
+        """测试批量读取只等待一次往返，结果按请求顺序返回"""
+        size = input_image_size(2)
+        start = time.monotonic()
+        results = controller.read_many([(0, size), (0, 2), (4, 2), (size, 2)])
+        elapsed = time.monotonic() - start
+
+        assert len(results[0]) == size
+        assert results[1] == results[0][:2]
+        assert results[2] == results[0][4:6]
+        assert results[3] is None
+        assert elapsed < 2 * LATENCY
+
+
+class TestModbusTCPClient:
+    """Modbus TCP客户端测试类（按事务ID匹配应答）"""
+
+    @staticmethod
+    def connect(server: ScriptedServer, **kwargs) -> ModbusTCPClient:
+        client = ModbusTCPClient('127.0.0.1', server.port, **kwargs)
+        assert client.connect()
+        return client
+
+    def test_out_of_order_replies(self):
+        """测试乱序应答按事务ID交给各自的请求，协议ID非0和未知事务ID的帧被忽略"""
+        def script(requests):
+            frames = [reply(0x7777, b'\x03\x02\x00\x00'),
+                      reply(requests[0][0], b'\x03\x02\xff\xff', protocol_id=1)]
+            for transaction_id, _, _ in reversed(requests):
+                frames.append(reply(transaction_id, b'\x03\x02' + transaction_id.to_bytes(2, 'big')))
+            return frames
+
+        server = ScriptedServer(4, script)
+        client = self.connect(server, timeout=1.0)
+        try:
+            futures = [client.submit(READ_PDU) for _ in range(4)]
+            results = [client.wait(future) for future in futures]
+            # 事务ID从1开始依次分配
+            assert results == [b'\x03\x02' + transaction_id.to_bytes(2, 'big') for transaction_id in range(1, 5)]
+        finally:
+            client.disconnect()
+            server.close()
+
+    def test_exception_and_missing_replies(self):
+        """测试异常应答为None；超时的事务被放弃并释放在途名额，迟到的应答被忽略"""
+        late = threading.Event()
+
+        def script(requests):
+            (first, _, _), (second, _, _) = requests
+            frames = [reply(second, b'\x83\x02')]
+            late.wait(2)
+            frames.append(reply(first, b'\x03\x02\x00\x01'))
+            return frames
+
+        server = ScriptedServer(2, script)
+        client = self.connect(server, timeout=0.2, max_in_flight=2)
+        try:
+            first = client.submit(READ_PDU)
+            second = client.submit(READ_PDU)
+            assert client.wait(second) is None
+            assert client.wait(first) is None
+            late.set()
+
+            # 超时的事务已释放名额，可以继续提交；迟到的应答不会交给新请求
+            third = client.submit(READ_PDU)
+            assert not third.done()
+        finally:
+            client.disconnect()
+            server.close()
+        assert third.result(0) is None
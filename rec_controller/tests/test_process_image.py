@@ -0,0 +1,32 @@
+"""
+过程映像测试模块
+"""
+import struct
+from core.process_image import (AXIS_STATUS_FLAGS, AxisStatus, decode_axes,
+                                input_image_size, axis_status_offset)
+
+
+class TestProcessImage:
+    """过程映像测试类"""
+
+    def test_flags_distinct(self):
+        """测试每个标志位各占一位，不与其它标志共用"""
+        masks = list(AXIS_STATUS_FLAGS.values())
+        assert all(mask and not mask & (mask - 1) for mask in masks)
+        assert len(set(masks)) == len(masks)
+
+    def test_decode_axes_matches_records(self):
+        """测试批量解码与逐轴解码一致"""
+        data = bytearray(input_image_size(2))
+        words = [0x0001, 0x0003, 0x0005, 0x0009, 0x0011, 0xFF04, 0x8002, 0x0000]
+        for index, word in enumerate(words):
+            struct.pack_into('<H', data, axis_status_offset(index // 4, index % 4), word)
+
+        axes = decode_axes(bytes(data), 2)
+        assert list(axes['word']) == words
+        for record, word in zip(axes, words):
+            status = AxisStatus(word)
+            assert all(bool(record[name]) == status[name] for name in AXIS_STATUS_FLAGS)
+            assert record['position'] == status['position']
+            assert record['status_code'] == status['status_code']
+        assert AxisStatus(0x0003)['busy'] and not AxisStatus(0x0003)['done']
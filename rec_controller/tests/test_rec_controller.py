@@ -0,0 +1,181 @@
+"""
+REC控制器测试模块
+"""
+import threading
+import time
+import pytest
+from core.connection_supervisor import ConnectionSupervisor
+from core.rec_controller import RECController
+from simulator import RECSimulator, EIPServer, ModbusRTUServer
+
+
+class TestRECController:
+    """REC控制器测试类（本机模拟网关，显式报文）"""
+
+    @pytest.fixture
+    def server(self):
+        """模拟网关"""
+        with EIPServer(RECSimulator(2), port=0, io_port=0) as server:
+            yield server
+
+    @pytest.fixture
+    def controller(self, server):
+        """已连接的控制器"""
+        controller = RECController('ethernet_ip', ip_address=f"{server.host}:{server.port}",
+                                   unit_count=2)
+        assert controller.connect()
+        yield controller
+        controller.disconnect()
+
+    def test_sync_outputs_during_command(self, controller):
+        """测试重连同步与I/O线程中的命令并发时不会死锁"""
+        gate = threading.Event()
+
+        def command_in_channel():
+            # 与 AsyncRECController 相同：命令在I/O线程中执行
+            gate.wait(2)
+            return controller.send_axis_command(0, 1, 'ST1')
+
+        future = controller.channel.submit(command_in_channel)
+        # 与重连钩子相同：在其它线程中同步影子寄存器
+        sync = threading.Thread(target=controller.sync_outputs, daemon=True)
+        sync.start()
+        time.sleep(0.05)
+        gate.set()
+
+        assert future.result(timeout=2) is True
+        sync.join(2)
+        assert not sync.is_alive()
+
+    def test_command_single_write(self, controller, server):
+        """测试显式报文下每个命令只需一次写入，不再先读后写"""
+        requests = server.requests
+        for command, value in (('ST1', True), ('ST1', False), ('ST0', True), ('ST0', False)):
+            assert controller.send_axis_command(1, 2, command, value)
+        assert server.requests - requests == 4
+        assert server.simulator.read_output(4, 2) == b'\x00\x00'
+
+        controller.send_axis_command(1, 2, 'ST1')
+        assert server.simulator.read_output(4, 2) == (1 << 9).to_bytes(2, 'little')
+
+    def test_reconnect_swaps_driver_on_io_thread(self, controller):
+        """测试重连时新会话在I/O线程中换上，不与正在进行的读写并发"""
+        client = controller.client
+        old_driver = client.driver
+        gate = threading.Event()
+        drivers = []
+
+        def busy():
+            # 模拟I/O线程中正在进行的操作，期间驱动不能被替换
+            gate.wait(2)
+            drivers.append(client.driver)
+
+        controller.channel.submit(busy)
+        results = []
+        reopen = threading.Thread(target=lambda: results.append(client._reopen()))
+        reopen.start()
+        # 换上完成之前_reopen不返回，重连线程不会提前标记连接恢复
+        reopen.join(0.3)
+        assert reopen.is_alive()
+        assert client.driver is old_driver
+        gate.set()
+        reopen.join(2)
+
+        assert results == [True]
+        assert drivers == [old_driver]
+        assert client.driver is not old_driver
+        assert controller.send_axis_command(0, 0, 'ST1')
+
+    def test_reopen_after_disconnect(self, controller):
+        """测试换上之前已主动断开时重连报告失败"""
+        client = controller.client
+        client.supervisor.mark_disconnected()
+        assert client._reopen() is False
+
+    def test_shadow_control_word(self, controller, server):
+        """测试影子控制字：各轴命令位互不覆盖，链路断开后从设备重新同步"""
+        address = RECController.UNIT_BASE_OFFSET
+        controller.send_axis_command(0, 0, 'ST1')
+        controller.send_axis_commands(0, 2, {'ST0': True, 'RES': True})
+        assert server.simulator.read_output(address, 2) == ((1 << 1) | (1 << 8) | (1 << 10)).to_bytes(2, 'little')
+
+        controller.send_axis_command(0, 2, 'RES', False)
+        assert server.simulator.read_output(address, 2) == ((1 << 1) | (1 << 8)).to_bytes(2, 'little')
+        # 其它单元不受影响
+        assert server.simulator.read_output(address + RECController.BYTES_PER_UNIT, 2) == b'\x00\x00'
+
+        # 设备上的控制字被其它主站修改：链路断开作废影子寄存器，下次命令前重新读取
+        server.simulator.write_output(address, (1 << 5).to_bytes(2, 'little'))
+        controller.channel.call(controller._on_link_state, ConnectionSupervisor.STATE_DOWN)
+        requests = server.requests
+        controller.send_axis_command(0, 0, 'ST0')
+        assert server.simulator.read_output(address, 2) == ((1 << 5) | 1).to_bytes(2, 'little')
+        assert server.requests - requests == 2
+
+        with pytest.raises(ValueError):
+            controller.send_axis_command(0, 0, 'XX')
+
+    def test_concurrent_commands(self, controller, server):
+        """测试多个线程同时给不同的轴发命令，控制字的修改不会互相覆盖"""
+        def toggle(unit, axis):
+            for _ in range(10):
+                assert controller.send_axis_command(unit, axis, 'ST1', True)
+                assert controller.send_axis_command(unit, axis, 'ST0', False)
+            assert controller.send_axis_command(unit, axis, 'ST0', True)
+
+        threads = [threading.Thread(target=toggle, args=(unit, axis))
+                   for unit in range(2) for axis in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        # 每个轴最后都是 ST0=1、ST1=1
+        expected = sum(0b11 << (axis * 4) for axis in range(4))
+        for unit in range(2):
+            address = RECController.UNIT_BASE_OFFSET + unit * RECController.BYTES_PER_UNIT
+            assert server.simulator.read_output(address, 2) == expected.to_bytes(2, 'little')
+
+
+class TestSerialRECController:
+    """REC控制器测试类（伪终端上的模拟Modbus RTU从站）"""
+
+    @pytest.fixture
+    def server(self):
+        """模拟从站"""
+        with ModbusRTUServer(RECSimulator(2)) as server:
+            yield server
+
+    @pytest.fixture
+    def controller(self, server):
+        """已连接的控制器"""
+        controller = RECController('serial', port=server.slave_path, baudrate=115200, unit_count=2)
+        assert controller.connect()
+        yield controller
+        controller.disconnect()
+
+    def test_register_mapping(self, controller, server):
+        """测试字节地址/长度到寄存器的换算：地址向下取整到寄存器，长度向上取整"""
+        assert RECController._build_read_pdu(3, 3) == bytes([0x03, 0x00, 0x01, 0x00, 0x02])
+        assert RECController._build_read_pdu(4, 1) == bytes([0x03, 0x00, 0x02, 0x00, 0x01])
+
+        image = server.simulator.input_image()
+        assert controller.read_data(0, 5) == image[0:5]
+        # 奇数地址从所在寄存器的起始字节读取
+        assert controller.read_data(3, 3) == image[2:5]
+        assert controller.read_data(4, 1) == image[4:5]
+
+        assert controller.write_data(5, b'\x34\x12')
+        assert server.simulator.read_output(4, 2) == b'\x34\x12'
+
+    def test_control_word_read_failure(self, controller, server):
+        """测试影子寄存器未同步且读取失败时不写出控制字"""
+        address = RECController.UNIT_BASE_OFFSET
+        server.simulator.write_output(address, (1 << 5).to_bytes(2, 'little'))
+        controller._control_words.clear()
+        controller._read_control_word = lambda unit_index: None
+
+        requests = server.requests
+        assert controller.send_axis_command(0, 0, 'ST1') is False
+        assert server.requests == requests
+        assert server.simulator.read_output(address, 2) == (1 << 5).to_bytes(2, 'little')
@@ -0,0 +1,84 @@
+"""
+串口通信测试模块（伪终端）
+"""
+import os
+import threading
+import time
+import tty
+import pytest
+from core.modbus import append_crc
+from core.serial_comm import SerialClient
+
+TIMEOUT = 0.5
+
+
+class TestSerialComm:
+    """串口通信测试类"""
+
+    @pytest.fixture
+    def link(self):
+        """伪终端的两端：从端交给SerialClient，测试在主端模拟从站应答"""
+        master, slave = os.openpty()
+        tty.setraw(master)
+        tty.setraw(slave)
+        client = SerialClient(os.ttyname(slave), baudrate=115200, timeout=TIMEOUT)
+        assert client.connect()
+        yield client, master
+        client.disconnect()
+        os.close(master)
+        os.close(slave)
+
+    @staticmethod
+    def respond(master: int, chunks, delay: float = 0.02) -> threading.Thread:
+        """收到请求后分段写出应答，模拟应答在串口上分几次到达"""
+        def run():
+            os.read(master, 256)
+            for chunk in chunks:
+                time.sleep(delay)
+                os.write(master, chunk)
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+
+    def test_split_read_response(self, link):
+        """测试分段到达的读应答拼成一帧，收齐后立即返回"""
+        client, master = link
+        response = append_crc(b'\x01\x03\x04\x00\x01\x00\x02')
+        # 应答后面紧跟的多余字节不属于这一帧
+        thread = self.respond(master, [response[:2], response[2:6], response[6:] + b'\x01'])
+
+        started = time.monotonic()
+        assert client.query(append_crc(b'\x01\x03\x00\x00\x00\x02')) == response
+        assert time.monotonic() - started < TIMEOUT / 2
+        thread.join(1)
+
+    def test_write_and_exception_responses(self, link):
+        """测试写应答（固定8字节）和异常应答（5字节）按实际长度接收"""
+        client, master = link
+        request = append_crc(b'\x01\x06\x00\x02\x00\x01')
+        thread = self.respond(master, [request[:3], request[3:]])
+        assert client.query(request) == request
+        thread.join(1)
+
+        exception = append_crc(b'\x01\x83\x02')
+        thread = self.respond(master, [exception])
+        started = time.monotonic()
+        assert client.query(append_crc(b'\x01\x03\x01\x00\x00\x01')) == exception
+        assert time.monotonic() - started < TIMEOUT / 2
+        thread.join(1)
+
+    def test_unknown_function_uses_fallback_length(self, link):
+        """测试无法识别的功能码按给定的应答长度接收"""
+        client, master = link
+        response = append_crc(b'\x01\x2b\x0e\x01\x01')
+        thread = self.respond(master, [response[:4], response[4:]])
+        assert client.query(append_crc(b'\x01\x2b\x0e\x01\x00'), len(response)) == response
+        thread.join(1)
+
+    def test_timeout_returns_partial_frame(self, link):
+        """测试应答不完整时超时返回已收到的部分"""
+        client, master = link
+        thread = self.respond(master, [b'\x01\x03\x04\x00'])
+        assert client.query(append_crc(b'\x01\x03\x00\x00\x00\x02')) == b'\x01\x03\x04\x00'
+        thread.join(1)
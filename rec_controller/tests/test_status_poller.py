@@ -0,0 +1,105 @@
+"""
+集中状态轮询测试模块
+"""
+import threading
+import time
+import pytest
+from core.rec_controller import RECController
+from simulator import RECSimulator, EIPServer
+from utils.clock import VirtualClock
+
+
+class TestStatusPoller:
+    """状态轮询器测试类（本机模拟网关，虚拟时钟计时）"""
+
+    @pytest.fixture
+    def server(self):
+        """模拟网关"""
+        with EIPServer(RECSimulator(2), port=0, io_port=0) as server:
+            yield server
+
+    @pytest.fixture
+    def clock(self):
+        """控制器注入的时钟，等待超时只按它计算"""
+        return VirtualClock()
+
+    @pytest.fixture
+    def controller(self, server, clock):
+        """已连接的控制器"""
+        controller = RECController('ethernet_ip', ip_address=f"{server.host}:{server.port}",
+                                   unit_count=2, clock=clock)
+        assert controller.connect()
+        yield controller
+        controller.disconnect()
+
+    @pytest.fixture
+    def poller(self, controller):
+        """轮询器：启动时轮询一次，之后只在测试中手动轮询"""
+        poller = controller.start_status_poller(period=60.0)
+        deadline = time.monotonic() + 2
+        while poller.image is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert poller.image is not None
+        return poller
+
+    def test_stale_snapshot(self, poller, clock):
+        """测试等待开始前的快照只在fresh=False时采用"""
+        image = poller.image
+        assert poller.wait_until(lambda image: True, 1.0, fresh=False) is image
+
+        threading.Timer(0.05, clock.advance, [1.0]).start()
+        assert poller.wait_until(lambda image: True, 1.0) is None
+
+    def test_fresh_snapshot(self, poller):
+        """测试等待开始后发出的读取被采用"""
+        stale = poller.image
+        threading.Timer(0.05, poller.poll).start()
+        image = poller.wait_until(lambda image: True, 1.0)
+        assert image is not None and image is not stale
+
+    def test_read_in_flight_before_command(self, controller, poller):
+        """测试命令写出前已经发出的读取，在等待开始后才发布也不被采用"""
+        read_done = threading.Event()
+        release = threading.Event()
+        stale = []
+        original = controller.read_process_image
+
+        def delayed_read():
+            image = original()
+            stale.append(image)
+            read_done.set()
+            release.wait(2)
+            return image
+
+        controller.read_process_image = delayed_read
+        threading.Thread(target=poller.poll).start()
+        assert read_done.wait(2)
+        del controller.read_process_image
+
+        assert controller.send_axis_command(0, 0, 'ST1')
+        seen = []
+
+        def moving(image):
+            seen.append(image)
+            return image.axis_status(0, 0)['busy']
+
+        threading.Timer(0.05, release.set).start()
+        threading.Timer(0.2, poller.poll).start()
+        image = poller.wait_until(moving, 1.0)
+        assert image is not None
+        assert poller.image is image
+        assert stale[0] not in seen
+
+    def test_timeout_uses_controller_clock(self, poller, clock):
+        """测试超时按控制器时钟计算：时钟推进后立即返回，不等真实时间"""
+        assert poller.clock is clock
+        started = time.monotonic()
+        threading.Timer(0.05, clock.advance, [30.0]).start()
+        assert poller.wait_for_axis(0, 0, lambda status: False, 30.0, fresh=False) is None
+        assert time.monotonic() - started < 1.0
+
+    def test_stop_wakes_waiters(self, poller):
+        """测试停止轮询时等待者立即返回失败"""
+        threading.Timer(0.05, poller.stop).start()
+        assert poller.wait_until(lambda image: False, 30.0) is None
+        assert not poller.running
@@ -2,5 +2,9 @@
 from .config_loader import load_config
 from .logger import setup_logger
 from .data_parser import DataParser
+from .periodic import PeriodicScheduler
+from .historian import Historian
+from .clock import RealClock, VirtualClock
 
-__all__ = ['load_config', 'setup_logger', 'DataParser']
\ No newline at end of file
+__all__ = ['load_config', 'setup_logger', 'DataParser', 'PeriodicScheduler', 'Historian',
+           'RealClock', 'VirtualClock']
\ No newline at end of file
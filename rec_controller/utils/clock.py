@@ -0,0 +1,116 @@
+"""
+时钟
+运动和等待循环通过时钟对象读取时间和休眠，测试和仿真可换成虚拟时钟
+与 iai_ec_controller/utils/clock.py 相同，修改时两边同步
+"""
+import heapq
+import itertools
+import threading
+import time
+from typing import Union
+
+
+class RealClock:
+    """真实时钟：直接使用time模块"""
+
+    def time(self) -> float:
+        """当前时间（秒）"""
+        return time.time()
+
+    def monotonic(self) -> float:
+        """单调时间（秒）"""
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        """休眠"""
+        time.sleep(seconds)
+
+
+class VirtualClock:
+    """虚拟时钟
+
+    时间只在休眠时前进：当所有参与线程都在 sleep 中阻塞时，时间直接跳到
+    最早的唤醒时刻，不实际等待。单线程使用时 sleep 立即返回并推进时间。
+
+    多个线程共用一个虚拟时钟时，须在启动线程前通过 register() 登记，
+    否则时间可能在某个线程仍在运行时前进。参与线程不能阻塞在时钟以外
+    的等待上（锁、网络I/O等），否则时间无法前进。
+    """
+
+    def __init__(self, start: float = 0.0, participants: int = 1):
+        """
+        初始化虚拟时钟
+
+        Args:
+            start: 起始时间（秒）
+            participants: 初始参与线程数，默认只有调用线程
+        """
+        self._now = start
+        self._participants = participants
+        self._blocked = 0
+        self._wakeups = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    def time(self) -> float:
+        """当前虚拟时间（秒）"""
+        return self._now
+
+    def monotonic(self) -> float:
+        """单调时间，与 time() 相同"""
+        return self._now
+
+    def sleep(self, seconds: float):
+        """
+        休眠：阻塞到虚拟时间前进seconds秒
+
+        Args:
+            seconds: 休眠时间（秒）
+        """
+        with self._condition:
+            wake = self._now + max(seconds, 0.0)
+            entry = (wake, next(self._sequence))
+            heapq.heappush(self._wakeups, entry)
+            self._blocked += 1
+            while self._now < wake:
+                # 已到期的线程尚未运行时不能前进
+                if self._blocked >= self._participants and self._wakeups[0][0] > self._now:
+                    self._advance()
+                else:
+                    self._condition.wait()
+            self._wakeups.remove(entry)
+            heapq.heapify(self._wakeups)
+            self._blocked -= 1
+
+    def advance(self, seconds: float):
+        """手动推进时间，到期的休眠随之返回"""
+        with self._condition:
+            self._now += seconds
+            self._condition.notify_all()
+
+    def _advance(self):
+        """跳到最早的唤醒时刻"""
+        self._now = self._wakeups[0][0]
+        self._condition.notify_all()
+
+    def register(self, count: int = 1):
+        """
+        登记参与线程，须在启动线程之前调用，线程结束时调用 release()
+
+        Args:
+            count: 线程数
+        """
+        with self._condition:
+            self._participants += count
+
+    def release(self):
+        """调用线程不再参与（线程结束，或主线程只负责启动和等待其它线程）"""
+        with self._condition:
+            self._participants -= 1
+            self._condition.notify_all()
+
+
+Clock = Union[RealClock, VirtualClock]
+
+# 默认时钟
+REAL_CLOCK = RealClock()
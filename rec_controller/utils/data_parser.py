@@ -1,15 +1,29 @@
 """数据解析工具"""
-import struct
-from typing import List, Union, Tuple
+import sys
+from array import array
+from typing import List, Union
+import numpy as np
+
+# 网关数据为小端字序，本机为大端时需要字节交换
+_NATIVE_LITTLE = sys.byteorder == 'little'
+
+# 每个字节展开为8个位（低位在前）
+_BYTE_BITS = tuple(tuple((value >> i) & 1 for i in range(8)) for value in range(256))
+
+BytesLike = Union[bytes, bytearray, memoryview]
 
 
 class DataParser:
-    """数据解析器"""
+    """数据解析器
+
+    单字接口保持原有行为；批量接口（*_array / words_view）面向整个过程映像，
+    直接在原缓冲区上按字解释，不逐字切片、不复制。
+    """
 
     @staticmethod
     def word_to_bits(word: int) -> List[bool]:
         """将字转换为位列表"""
-        return [(word >> i) & 1 for i in range(16)]
+        return list(_BYTE_BITS[word & 0xFF] + _BYTE_BITS[(word >> 8) & 0xFF])
 
     @staticmethod
     def bits_to_word(bits: List[bool]) -> int:
@@ -21,22 +35,66 @@ class DataParser:
         return word
 
     @staticmethod
-    def bytes_to_words(data: bytes) -> List[int]:
-        """将字节数据转换为字列表"""
-        words = []
-        for i in range(0, len(data), 2):
-            if i + 1 < len(data):
-                word = struct.unpack('<H', data[i:i + 2])[0]
-                words.append(word)
+    def words_view(data: BytesLike) -> Union[memoryview, array]:
+        """按字解释字节数据，末尾不足一个字的字节忽略
+
+        小端主机上返回原缓冲区的memoryview（零复制），
+        大端主机上返回字节交换后的array('H')。
+        """
+        view = memoryview(data).cast('B')
+        view = view[:len(view) // 2 * 2]
+        if _NATIVE_LITTLE:
+            return view.cast('H')
+        words = array('H', view.tobytes())
+        words.byteswap()
         return words
 
+    @staticmethod
+    def bytes_to_words(data: BytesLike) -> List[int]:
+        """将字节数据转换为字列表"""
+        return DataParser.words_view(data).tolist()
+
     @staticmethod
     def words_to_bytes(words: List[int]) -> bytes:
         """将字列表转换为字节数据"""
-        data = b''
-        for word in words:
-            data += struct.pack('<H', word & 0xFFFF)
-        return data
+        packed = array('H', [word & 0xFFFF for word in words])
+        if not _NATIVE_LITTLE:
+            packed.byteswap()
+        return packed.tobytes()
+
+    @staticmethod
+    def bytes_to_word_array(data: BytesLike) -> np.ndarray:
+        """将整块字节数据映射为uint16数组（零复制，只读）"""
+        view = memoryview(data).cast('B')
+        return np.frombuffer(view, dtype='<u2', count=len(view) // 2)
+
+    @staticmethod
+    def words_to_bits_array(words: Union[np.ndarray, BytesLike]) -> np.ndarray:
+        """批量将字展开为位
+
+        Args:
+            words: uint16数组，或原始字节数据
+
+        Returns:
+            形状为 (字数, 16) 的uint8数组，第i列为第i位
+        """
+        if not isinstance(words, np.ndarray):
+            words = DataParser.bytes_to_word_array(words)
+        octets = np.ascontiguousarray(words, dtype='<u2').view(np.uint8)
+        return np.unpackbits(octets, bitorder='little').reshape(-1, 16)
+
+    @staticmethod
+    def bits_array_to_words(bits: np.ndarray) -> np.ndarray:
+        """批量将位合成字，words_to_bits_array 的逆运算
+
+        Args:
+            bits: 形状为 (字数, 16) 的位数组，第i列为第i位
+
+        Returns:
+            uint16数组
+        """
+        packed = np.packbits(np.asarray(bits, dtype=np.uint8).reshape(-1, 16), axis=1, bitorder='little')
+        return packed.view('<u2').reshape(-1)
 
     @staticmethod
     def parse_position(raw_value: int, scale: float = 0.01) -> float:
@@ -51,6 +109,11 @@ class DataParser:
         """
         return raw_value * scale
 
+    @staticmethod
+    def parse_positions(raw_values: np.ndarray, scale: float = 0.01) -> np.ndarray:
+        """批量解析位置数据（mm）"""
+        return np.asarray(raw_values) * scale
+
     @staticmethod
     def encode_position(position: float, scale: float = 0.01) -> int:
         """编码位置数据
@@ -62,4 +125,4 @@ class DataParser:
         Returns:
             编码后的原始值
         """
-        return int(position / scale)
\ No newline at end of file
+        return int(position / scale)